@@ -6,11 +6,13 @@ A beautiful menu bar app to track daily habits and maintain streaks!
 
 import rumps
 import json
-import os
 import subprocess
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
+import streak_core
+from batch import Batch
+
 # Data file in user's home directory
 DATA_DIR = Path.home() / ".consistency_tracker"
 DATA_FILE = DATA_DIR / "data.json"
@@ -47,6 +49,8 @@ class ConsistencyTracker(rumps.App):
     def __init__(self):
         super().__init__("🔥 0", quit_button=None)
         self.data = self.load_data()
+        self.day_index = streak_core.DayIndex.build(self.data.get("activities", {}))
+        self.batch = Batch(self.write_data, self.post_notification)
         self.update_menu()
         
         # Schedule reminder checks
@@ -64,45 +68,31 @@ class ConsistencyTracker(rumps.App):
         return {"activities": {}, "badges": [], "settings": {"morning": 9, "afternoon": 14, "evening": 20}}
     
     def save_data(self):
+        """Save data now, or once when the open batch commits."""
+        self.batch.save()
+    
+    def write_data(self):
         """Save data to JSON file."""
         with open(DATA_FILE, 'w') as f:
             json.dump(self.data, f, indent=2)
     
+    def post_notification(self, title, message):
+        rumps.notification(title=title, subtitle="", message=message, sound=True)
+    
     def get_today(self):
-        """Get today's date as string."""
-        return datetime.now().strftime("%Y-%m-%d")
+        """Get today's date as string, honouring the day boundary set in main.py."""
+        return streak_core.day_key(day_start=self.data.get("day_start", "00:00"))
     
-    def get_streak(self, dates):
-        """Calculate current streak from list of dates."""
-        if not dates:
-            return 0
-        
-        dates = sorted(set(dates), reverse=True)
-        today = datetime.now().date()
-        yesterday = today - timedelta(days=1)
-        
-        last_date = datetime.strptime(dates[0], "%Y-%m-%d").date()
-        if last_date != today and last_date != yesterday:
-            return 0
-        
-        streak = 0
-        expected = last_date
-        
-        for date_str in dates:
-            date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            if date == expected:
-                streak += 1
-                expected = date - timedelta(days=1)
-            elif date < expected:
-                break
-        
-        return streak
+    def get_streak(self, info):
+        """Current streak of an activity, bridged by its frozen days."""
+        today = datetime.strptime(self.get_today(), "%Y-%m-%d").date()
+        return streak_core.get_streak(info.get("dates", []), info.get("frozen", []), today=today)
     
     def update_title(self):
         """Update menu bar title with max streak."""
         max_streak = 0
         for info in self.data.get("activities", {}).values():
-            streak = self.get_streak(info.get("dates", []))
+            streak = self.get_streak(info)
             max_streak = max(max_streak, streak)
         
         fire = "🔥" if max_streak > 0 else "○"
@@ -113,7 +103,7 @@ class ConsistencyTracker(rumps.App):
         self.menu.clear()
         
         # Header
-        today = datetime.now().strftime("%A, %B %d")
+        today = datetime.strptime(self.get_today(), "%Y-%m-%d").strftime("%A, %B %d")
         self.menu.add(rumps.MenuItem(f"📅 {today}", callback=None))
         self.menu.add(rumps.separator)
         
@@ -124,9 +114,8 @@ class ConsistencyTracker(rumps.App):
             self.menu.add(rumps.MenuItem("No activities yet!", callback=None))
         else:
             for name, info in activities.items():
-                dates = info.get("dates", [])
-                streak = self.get_streak(dates)
-                checked_today = self.get_today() in dates
+                streak = self.get_streak(info)
+                checked_today = self.day_index.has(streak_core.to_ordinal(self.get_today()), name)
                 longest = info.get("longest", 0)
                 
                 # Status emoji
@@ -151,7 +140,7 @@ class ConsistencyTracker(rumps.App):
                 item.add(rumps.separator)
                 item.add(rumps.MenuItem(f"Current: {streak} days", callback=None))
                 item.add(rumps.MenuItem(f"Longest: {longest} days", callback=None))
-                item.add(rumps.MenuItem(f"Total: {len(dates)} days", callback=None))
+                item.add(rumps.MenuItem(f"Total: {len(info.get('dates', []))} days", callback=None))
                 item.add(rumps.separator)
                 
                 delete = rumps.MenuItem("🗑 Delete Activity", callback=lambda sender, n=name: self.delete_activity(n))
@@ -162,11 +151,15 @@ class ConsistencyTracker(rumps.App):
         self.menu.add(rumps.separator)
         
         # Quick check-in buttons for unchecked activities
-        unchecked = [(n, i) for n, i in activities.items() if self.get_today() not in i.get("dates", [])]
+        today = streak_core.to_ordinal(self.get_today())
+        unchecked = [(n, i) for n, i in activities.items() if not self.day_index.has(today, n)]
         if unchecked:
             quick_menu = rumps.MenuItem("⚡ Quick Check-in")
             for name, _ in unchecked:
                 quick_menu.add(rumps.MenuItem(name, callback=lambda sender, n=name: self.check_in(n)))
+            if len(unchecked) > 1:
+                quick_menu.add(rumps.separator)
+                quick_menu.add(rumps.MenuItem("✅ Check In All", callback=self.check_in_all))
             self.menu.add(quick_menu)
             self.menu.add(rumps.separator)
         
@@ -213,6 +206,18 @@ class ConsistencyTracker(rumps.App):
     
     def check_in(self, activity_name):
         """Check in for an activity."""
+        with self.batch:
+            self.record_check_in(activity_name)
+    
+    def check_in_all(self, sender):
+        """Check in every activity not yet done today: one save, one notification."""
+        today = streak_core.to_ordinal(self.get_today())
+        with self.batch:
+            for name in list(self.data.get("activities", {})):
+                if not self.day_index.has(today, name):
+                    self.record_check_in(name)
+    
+    def record_check_in(self, activity_name):
         today = self.get_today()
         
         if activity_name not in self.data["activities"]:
@@ -222,9 +227,10 @@ class ConsistencyTracker(rumps.App):
             return  # Already checked in
         
         self.data["activities"][activity_name].setdefault("dates", []).append(today)
+        self.day_index.add(streak_core.to_ordinal(today), activity_name)
         
         # Update longest streak
-        streak = self.get_streak(self.data["activities"][activity_name]["dates"])
+        streak = self.get_streak(self.data["activities"][activity_name])
         if streak > self.data["activities"][activity_name].get("longest", 0):
             self.data["activities"][activity_name]["longest"] = streak
         
@@ -234,14 +240,9 @@ class ConsistencyTracker(rumps.App):
         self.check_badges(activity_name, streak)
         
         # Notification
-        rumps.notification(
-            title="✅ Checked In!",
-            subtitle=activity_name,
-            message=f"🔥 {streak} day streak!",
-            sound=True
-        )
+        self.batch.notify("✅ Checked In!", f"{activity_name}: 🔥 {streak} day streak!")
         
-        self.update_menu()
+        self.batch.after(self.update_menu)
     
     def check_badges(self, activity_name, streak):
         """Check and award badges."""
@@ -252,12 +253,7 @@ class ConsistencyTracker(rumps.App):
                 self.save_data()
                 
                 icon, name = BADGES[streak]
-                rumps.notification(
-                    title="🏆 Badge Earned!",
-                    subtitle=f"{icon} {name}",
-                    message=f"{streak} day streak for {activity_name}!",
-                    sound=True
-                )
+                self.batch.notify("🏆 Badge Earned!", f"{icon} {name}: {streak} day streak for {activity_name}!")
     
     def add_preset(self, name):
         """Add a preset activity."""
@@ -310,6 +306,7 @@ class ConsistencyTracker(rumps.App):
         if response == 1:  # OK clicked
             if name in self.data.get("activities", {}):
                 del self.data["activities"][name]
+                self.day_index.remove_activity(name)
                 self.save_data()
                 self.update_menu()
     
@@ -324,7 +321,7 @@ class ConsistencyTracker(rumps.App):
         total_days = sum(len(a.get("dates", [])) for a in activities.values())
         total_activities = len(activities)
         best_streak = max((a.get("longest", 0) for a in activities.values()), default=0)
-        current_streaks = sum(1 for a in activities.values() if self.get_streak(a.get("dates", [])) > 0)
+        current_streaks = sum(1 for a in activities.values() if self.get_streak(a) > 0)
         badges = len(self.data.get("badges", []))
         
         stats = f"""📊 Your Consistency Stats
@@ -402,10 +399,7 @@ Keep building those streaks! 💪"""
             self.sent_reminders = {"morning": False, "afternoon": False, "evening": False, "date": today}
         
         # Check if already checked in today
-        checked_in = any(
-            today in info.get("dates", [])
-            for info in self.data.get("activities", {}).values()
-        )
+        checked_in = self.day_index.any_on(streak_core.to_ordinal(today))
         
         if checked_in:
             return  # Already did work today
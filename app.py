@@ -7,11 +7,14 @@ Track your daily habits and maintain streaks!
 import customtkinter as ctk
 import json
 import subprocess
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 import threading
 import time
 
+import streak_core
+from batch import Batch
+
 # Set appearance
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
@@ -73,6 +76,8 @@ class ConsistencyApp(ctk.CTk):
         
         # Load data
         self.data = self.load_data()
+        self.day_index = streak_core.DayIndex.build(self.data.get("activities", {}))
+        self.batch = Batch(self.write_data, self.post_notification)
         
         # Create UI
         self.create_sidebar()
@@ -91,33 +96,23 @@ class ConsistencyApp(ctk.CTk):
         return {"activities": {}, "badges": []}
     
     def save_data(self):
+        self.batch.save()
+    
+    def write_data(self):
         with open(DATA_FILE, 'w') as f:
             json.dump(self.data, f, indent=2)
     
     def get_today(self):
-        return datetime.now().strftime("%Y-%m-%d")
+        return streak_core.day_key(day_start=self.data.get("day_start", "00:00"))
     
-    def get_streak(self, dates):
-        if not dates:
-            return 0
-        dates = sorted(set(dates), reverse=True)
-        today = datetime.now().date()
-        yesterday = today - timedelta(days=1)
-        last_date = datetime.strptime(dates[0], "%Y-%m-%d").date()
-        if last_date != today and last_date != yesterday:
-            return 0
-        streak = 0
-        expected = last_date
-        for date_str in dates:
-            date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            if date == expected:
-                streak += 1
-                expected = date - timedelta(days=1)
-            elif date < expected:
-                break
-        return streak
+    def get_streak(self, info):
+        today = datetime.strptime(self.get_today(), "%Y-%m-%d").date()
+        return streak_core.get_streak(info.get("dates", []), info.get("frozen", []), today=today)
     
     def send_notification(self, title, message):
+        self.batch.notify(title, message)
+    
+    def post_notification(self, title, message):
         script = f'display notification "{message}" with title "{title}" sound name "default"'
         subprocess.run(["osascript", "-e", script], capture_output=True)
     
@@ -216,7 +211,7 @@ class ConsistencyApp(ctk.CTk):
         
         self.header_date = ctk.CTkLabel(
             self.header,
-            text=datetime.now().strftime("%A, %B %d, %Y"),
+            text=datetime.strptime(self.get_today(), "%Y-%m-%d").strftime("%A, %B %d, %Y"),
             font=ctk.CTkFont(size=14),
             text_color=COLORS["text_dim"]
         )
@@ -238,7 +233,7 @@ class ConsistencyApp(ctk.CTk):
     def update_streak_display(self):
         max_streak = 0
         for info in self.data.get("activities", {}).values():
-            streak = self.get_streak(info.get("dates", []))
+            streak = self.get_streak(info)
             max_streak = max(max_streak, streak)
         self.streak_label.configure(text=f"🔥 {max_streak}")
     
@@ -300,10 +295,10 @@ class ConsistencyApp(ctk.CTk):
     
     def create_activity_card(self, name, info):
         dates = info.get("dates", [])
-        streak = self.get_streak(dates)
+        streak = self.get_streak(info)
         longest = info.get("longest", 0)
         total = len(dates)
-        checked_today = self.get_today() in dates
+        checked_today = self.day_index.has(streak_core.to_ordinal(self.get_today()), name)
         color = info.get("color", COLORS["accent"])
         
         # Card frame
@@ -423,6 +418,11 @@ class ConsistencyApp(ctk.CTk):
         delete_btn.grid(row=0, column=3, padx=(0, 10), pady=15, sticky="ne")
     
     def check_in(self, activity_name):
+        # Check-in and any badge it earns share one save and one notification
+        with self.batch:
+            self.record_check_in(activity_name)
+    
+    def record_check_in(self, activity_name):
         today = self.get_today()
         
         if activity_name not in self.data["activities"]:
@@ -432,9 +432,10 @@ class ConsistencyApp(ctk.CTk):
             return
         
         self.data["activities"][activity_name].setdefault("dates", []).append(today)
+        self.day_index.add(streak_core.to_ordinal(today), activity_name)
         
         # Update longest streak
-        streak = self.get_streak(self.data["activities"][activity_name]["dates"])
+        streak = self.get_streak(self.data["activities"][activity_name])
         if streak > self.data["activities"][activity_name].get("longest", 0):
             self.data["activities"][activity_name]["longest"] = streak
         
@@ -447,7 +448,7 @@ class ConsistencyApp(ctk.CTk):
         self.send_notification("✅ Checked In!", f"{activity_name}: 🔥 {streak} day streak!")
         
         # Refresh
-        self.show_home()
+        self.batch.after(self.show_home)
     
     def check_badges(self, activity_name, streak):
         if streak in BADGES:
@@ -469,6 +470,7 @@ class ConsistencyApp(ctk.CTk):
         if result == "DELETE":
             if name in self.data.get("activities", {}):
                 del self.data["activities"][name]
+                self.day_index.remove_activity(name)
                 self.save_data()
                 self.show_home()
     
@@ -647,7 +649,7 @@ class ConsistencyApp(ctk.CTk):
         total_days = sum(len(a.get("dates", [])) for a in activities.values())
         total_activities = len(activities)
         best_streak = max((a.get("longest", 0) for a in activities.values()), default=0)
-        active_streaks = sum(1 for a in activities.values() if self.get_streak(a.get("dates", [])) > 0)
+        active_streaks = sum(1 for a in activities.values() if self.get_streak(a) > 0)
         badges_count = len(self.data.get("badges", []))
         
         # Stats cards
@@ -679,7 +681,7 @@ class ConsistencyApp(ctk.CTk):
             anchor="w"
         ).pack(fill="x", pady=(30, 15))
         
-        today = datetime.now().date()
+        today = datetime.strptime(self.get_today(), "%Y-%m-%d").date()
         
         for name, info in activities.items():
             row_frame = ctk.CTkFrame(self.content_frame, fg_color=COLORS["card"], corner_radius=10)
@@ -693,10 +695,8 @@ class ConsistencyApp(ctk.CTk):
                 anchor="w"
             ).pack(side="left", padx=15, pady=10)
             
-            dates = info.get("dates", [])
             for i in range(6, -1, -1):
-                day = (today - timedelta(days=i)).strftime("%Y-%m-%d")
-                is_active = day in dates
+                is_active = self.day_index.has(today.toordinal() - i, name)
                 
                 day_box = ctk.CTkFrame(
                     row_frame,
@@ -807,10 +807,7 @@ class ConsistencyApp(ctk.CTk):
                         sent = {"morning": False, "afternoon": False, "evening": False, "date": today}
                     
                     # Check if checked in
-                    checked_in = any(
-                        today in info.get("dates", [])
-                        for info in self.data.get("activities", {}).values()
-                    )
+                    checked_in = self.day_index.any_on(streak_core.to_ordinal(today))
                     
                     if not checked_in and self.data.get("activities"):
                         hour = now.hour
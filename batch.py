@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+📦 Batched writes for Consistency Tracker.
+Lets any frontend group many mutations so the data file is written once,
+notifications are merged and UI refreshes run once, at commit.
+"""
+
+MAX_MESSAGE = 180
+
+
+class Batch:
+    """Transaction wrapper around a frontend's save and notify functions.
+
+    Outside a transaction save() and notify() pass straight through. Inside
+    one (begin() ... commit(), or a with block; they nest) save() only marks
+    the data dirty, notify() queues the message and after() queues a
+    callback; commit() of the outermost level then writes once, sends one
+    notification and runs each queued callback once. If a block raises,
+    rollback() drops all of it and runs the on_rollback() hooks.
+    Transactions opened with snapshot=True (`with batch(snapshot=True):`)
+    hand the data as it was at begin() back to restore; snapshots copy all
+    the data, so only bulk operations ask for one, and restore gets None
+    otherwise. A level can't be undone on its own, so an inner rollback
+    aborts the whole transaction: the outer levels may carry on, but the
+    outermost commit() rolls back instead.
+    """
+
+    def __init__(self, write, notify=None, snapshot=None, restore=None):
+        self._write = write
+        self._notify = notify
+        self._snapshot = snapshot
+        self._restore = restore
+        self._depth = 0
+        self._saved = None
+        self._want_snapshot = False
+        self._aborted = False
+        self._dirty = False
+        self._messages = []
+        self._callbacks = []
+        self._rollback_hooks = []
+
+    def __call__(self, snapshot=False):
+        """Options for the next with block."""
+        self._want_snapshot = snapshot
+        return self
+
+    @property
+    def active(self):
+        return self._depth > 0
+
+    def begin(self, snapshot=False):
+        """Open a level; only the outermost one decides whether to snapshot."""
+        if not self._depth:
+            self._aborted = False
+            if snapshot and self._snapshot is not None:
+                self._saved = self._snapshot()
+        self._depth += 1
+        return self
+
+    def commit(self):
+        if self._aborted:
+            self.rollback()
+            return
+        self._depth -= 1
+        if self._depth:
+            return
+        dirty, self._dirty = self._dirty, False
+        messages, self._messages = self._messages, []
+        callbacks, self._callbacks = self._callbacks, []
+        self._saved = None
+        if dirty:
+            self._write()
+        if messages and self._notify is not None:
+            self._notify(*merge_messages(messages))
+        for callback in callbacks:
+            callback()
+
+    def rollback(self):
+        """Abandon the transaction: nothing queued is written or sent.
+
+        Inside an outer level this only marks the transaction aborted; the
+        data is restored once the outermost level closes, so frames still
+        holding parts of it never write to a discarded copy.
+        """
+        self._depth = max(self._depth - 1, 0)
+        if self._depth:
+            self._aborted = True
+            return
+        saved, self._saved = self._saved, None
+        self._aborted = False
+        self._dirty = False
+        self._messages = []
+        self._callbacks = []
+        for hook in self._rollback_hooks:
+            hook()
+        if self._restore is not None:
+            self._restore(saved)
+
+    def on_rollback(self, hook):
+        """Call hook() whenever a transaction is rolled back, e.g. to drop queued events."""
+        self._rollback_hooks.append(hook)
+
+    def __enter__(self):
+        snapshot, self._want_snapshot = self._want_snapshot, False
+        return self.begin(snapshot)
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def save(self):
+        if self._depth:
+            self._dirty = True
+        else:
+            self._write()
+
+    def notify(self, title, message):
+        if self._depth:
+            self._messages.append((title, message))
+        elif self._notify is not None:
+            self._notify(title, message)
+
+    def after(self, callback):
+        """Run callback now, or once at commit however often it was queued."""
+        if not self._depth:
+            callback()
+        elif callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+
+def merge_messages(messages):
+    """One (title, message) standing in for several queued notifications."""
+    if len(messages) == 1:
+        return messages[0]
+    titles = {title for title, _ in messages}
+    title = messages[0][0] if len(titles) == 1 else "Consistency Tracker"
+    message = f"{len(messages)} updates: " + " · ".join(message for _, message in messages)
+    if len(message) > MAX_MESSAGE:
+        message = message[:MAX_MESSAGE - 1].rstrip() + "…"
+    return title, message
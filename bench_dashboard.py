@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+⏱ Dashboard refresh benchmark.
+Times a check-in end to end (data update, change events, dashboard redraw,
+pending Qt events) on a generated data set: with the old full
+clear-and-rebuild of every card, with keyed cards patched in place, and
+with the painted list view. Also times building the page and, for the list,
+repainting while scrolling, and with --pages building each sidebar page and
+switching back to it once it is kept built (Statistics both until its skeleton
+shows and until its worker has filled it in). Disk writes and notifications are
+skipped so only the UI path is measured.
+
+Run: python bench_dashboard.py [--activities 200] [--sessions 300] [--checkins 50] [--seed 7]
+     python bench_dashboard.py --pages   (time building and revisiting each sidebar page instead)
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEvent, QThreadPool
+from PyQt6.QtWidgets import QApplication, QListView
+
+import main
+from bench_sessions import generate_sessions
+
+
+class BenchApp(main.ConsistencyApp):
+    rebuild = False
+
+    def write_data(self):
+        pass
+
+    def post_notification(self, title, message):
+        pass
+
+    def refresh_home(self, changes):
+        if self.rebuild:
+            # What every check-in did before cards were keyed
+            self.show_home()
+        else:
+            super().refresh_home(changes)
+
+
+def generate_data(rng, activities, sessions):
+    data = {"activities": {}, "badges": [], "notes": [], "calendar": {}}
+    for i in range(activities):
+        history = generate_sessions(rng, rng.randint(sessions // 2, sessions))
+        data["activities"][f"Activity {i:04d}"] = {
+            "dates": sorted({session["date"] for session in history}),
+            "sessions": history,
+            "longest": 0,
+            "color": rng.choice(main.PRESETS)[2],
+        }
+    return data
+
+
+def settle(app):
+    """Finish background work, then run pending events, including the deleteLater()s an event loop would process."""
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+def time_check_ins(app, window, names, count, offset):
+    timings = []
+    for i in range(count):
+        name = names[i % len(names)]
+        start = time.perf_counter()
+        window.check_in(name, 15, start=(offset + i * 7) % 1380)
+        settle(app)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def time_home(app, window, count=5):
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        window.show_home()
+        settle(app)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+PAGES = (
+    ("Home", "show_home"),
+    ("Statistics", "show_stats"),
+    ("Badges", "show_badges"),
+    ("Notes", "show_notes"),
+    ("Calendar", "show_calendar"),
+    ("Settings", "show_settings"),
+)
+
+
+def time_pages(app, window, count=5):
+    """{page: build timings} for each sidebar page."""
+    pages = {}
+    for _, page in PAGES:
+        timings = pages[page] = []
+        for _ in range(count):
+            start = time.perf_counter()
+            getattr(window, page)()
+            settle(app)
+            timings.append(time.perf_counter() - start)
+    return pages
+
+
+def time_skeleton(app, window, count=5):
+    """Time until the Statistics page shows its skeleton, before the worker is done."""
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        window.show_stats()
+        app.processEvents()
+        timings.append(time.perf_counter() - start)
+        settle(app)
+    return timings
+
+
+def time_revisits(app, window, count=5):
+    """{page: timings} for sidebar clicks back to a page, cycling through them all."""
+    pages = {name: [] for name, _ in PAGES}
+    for _ in range(count):
+        for name, page in PAGES:
+            start = time.perf_counter()
+            window.open_page(name, getattr(window, page))
+            settle(app)
+            pages[name].append(time.perf_counter() - start)
+    return pages
+
+
+def time_scrolling(view, count=60):
+    """Repaint time after each half-page scroll of the painted dashboard."""
+    bar = view.verticalScrollBar()
+    timings = []
+    for _ in range(count):
+        bar.setValue(bar.value() + view.viewport().height() // 2 if bar.value() < bar.maximum() else 0)
+        start = time.perf_counter()
+        view.viewport().repaint()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def describe(label, timings):
+    timings = sorted(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{label:<30}{statistics.median(timings) * 1000:>10.1f} ms{p95 * 1000:>10.1f} ms")
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--activities", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=300)
+    parser.add_argument("--checkins", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--pages", action="store_true", help="only time building each page")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    folder = Path(tempfile.mkdtemp(prefix="consistency-bench-"))
+    main.DATA_FILE = folder / "data.json"
+    main.ICLOUD_DIR = folder / "icloud"
+    main.ICLOUD_FILE = main.ICLOUD_DIR / "data.json"
+    with open(main.DATA_FILE, "w") as f:
+        json.dump(generate_data(rng, args.activities, args.sessions), f)
+
+    app = QApplication(sys.argv)
+    start = time.perf_counter()
+    window = BenchApp()
+    window.show()
+    settle(app)
+    print(f"Startup with {args.activities} activities: {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    if args.pages:
+        main.LIST_DASHBOARD_AT = float("inf")
+        print(f"{'page build':<30}{'median':>13}{'p95':>13}")
+        describe("show_stats skeleton", time_skeleton(app, window))
+        for page, timings in time_pages(app, window).items():
+            describe(page, timings)
+        print(f"\n{'sidebar revisit':<30}{'median':>13}{'p95':>13}")
+        for page, timings in time_revisits(app, window).items():
+            describe(page, timings)
+        return 0
+
+    names = list(window.data["activities"])
+    rng.shuffle(names)
+
+    print(f"{'':<30}{'median':>13}{'p95':>13}")
+    # Card widgets whatever the count
+    main.LIST_DASHBOARD_AT = float("inf")
+    window.rebuild = True
+    window.show_home()
+    settle(app)
+    describe("check-in, cards rebuilt", time_check_ins(app, window, names, args.checkins, 0))
+    window.rebuild = False
+    describe("check-in, cards patched", time_check_ins(app, window, names, args.checkins, 3))
+    describe("Home build, cards", time_home(app, window))
+
+    # Painted list view
+    main.LIST_DASHBOARD_AT = 0
+    window.show_home()
+    settle(app)
+    describe("check-in, list row", time_check_ins(app, window, names, args.checkins, 5))
+    describe("Home build, list", time_home(app, window))
+    view = window.findChild(QListView)
+    describe("list scroll frame", time_scrolling(view))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_bench())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+⏱ Session storage benchmark.
+Compares the list-of-dicts session layout with SessionColumns on generated
+histories: memory held after loading, and the cost of simple aggregates.
+
+Run: python bench_sessions.py [--sessions 20000] [--repeat 5] [--seed 7]
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+import streak_core
+from session_index import SessionColumns, json_default
+
+NOTES = ["", "", "Read two chapters", "Leg day 💪", "Refactored the parser and wrote tests for it", "Tired, short one"]
+
+
+def generate_sessions(rng, count):
+    """Newest-first sessions as main.py persists them, some days with several."""
+    today = date.today().toordinal()
+    sessions = []
+    day = today
+    while len(sessions) < count:
+        for _ in range(rng.choice((1, 1, 1, 2, 3))):
+            start = rng.randint(6 * 60, 22 * 60)
+            minutes = rng.choice((15, 30, 45, 60, 90, 120))
+            session = {
+                "date": streak_core.from_ordinal(day),
+                "start": f"{start // 60:02d}:{start % 60:02d}",
+                "minutes": minutes,
+                "note": rng.choice(NOTES),
+                "mood": rng.randint(1, 5),
+            }
+            if rng.random() < 0.5:
+                logged = min(start + minutes, 23 * 60 + 59)
+                session["time"] = f"{logged // 60:02d}:{logged % 60:02d}"
+                session["ts"] = f"{session['date']}T{session['time']}:00+00:00"
+            sessions.append(session)
+        day -= rng.choice((1, 1, 1, 2))
+    return sessions[:count]
+
+
+def held_bytes(build):
+    """Bytes still allocated by whatever build() returns, via tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def bench(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    raw = json.dumps(generate_sessions(random.Random(args.seed), args.sessions))
+    dicts = json.loads(raw)
+    columns, rows = SessionColumns.from_sessions(dicts)
+
+    # Round trip: rows must serialize back to exactly what was loaded
+    same = json.loads(json.dumps(rows, default=json_default)) == dicts
+    print(f"Round trip through SessionColumns: {'ok' if same else 'MISMATCH'}")
+
+    dict_bytes = held_bytes(lambda: json.loads(raw))
+    column_bytes = held_bytes(lambda: SessionColumns.from_sessions(json.loads(raw))[0])
+    row_bytes = held_bytes(lambda: SessionColumns.from_sessions(json.loads(raw)))
+    print(f"\n{'layout':<28}{'bytes/session':>14}{'total':>12}")
+    for name, size in (
+        ("list of dicts", dict_bytes),
+        ("SessionColumns", column_bytes),
+        ("SessionColumns + rows", row_bytes),
+    ):
+        print(f"{name:<28}{size / len(dicts):>14.1f}{size / 1024:>10.0f} KB")
+
+    cutoff = streak_core.from_ordinal(date.today().toordinal() - 364)
+    cutoff_ordinal = date.today().toordinal() - 364
+    timings = [
+        ("total minutes", lambda: sum(s.get("minutes", 0) for s in dicts), columns.total_minutes),
+        ("average mood", lambda: sum(s.get("mood", 3) for s in dicts) / len(dicts), columns.average_mood),
+        (
+            "minutes, last 365 days",
+            lambda: sum(s.get("minutes", 0) for s in dicts if s.get("date", "") >= cutoff),
+            lambda: sum(m for d, m in zip(columns.days, columns.minutes) if d >= cutoff_ordinal),
+        ),
+    ]
+    mismatched = not same
+    print(f"\n{'aggregate':<26}{'dicts':>10}{'columns':>10}")
+    for name, over_dicts, over_columns in timings:
+        if over_dicts() != over_columns():
+            mismatched = True
+            print(f"  {name}: {over_dicts()} != {over_columns()}")
+        print(
+            f"{name:<26}{bench(over_dicts, args.repeat) * 1000:>7.2f} ms"
+            f"{bench(over_columns, args.repeat) * 1000:>7.2f} ms"
+        )
+
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
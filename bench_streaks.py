@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+⏱ Streak engine benchmark and differential check.
+Compares streak_core against the legacy per-frontend implementations on
+generated histories, and against a plain day-by-day walk with frozen
+days, weekday schedules and day boundaries, then times them.
+
+Run: python bench_streaks.py [--histories 300] [--days 1825] [--seed 7]
+"""
+
+import argparse
+import random
+import subprocess
+import sys
+import time
+from datetime import date, datetime, time as clock, timedelta
+
+import streak_core
+
+UI_MODULES = ("PyQt6", "customtkinter", "tkinter", "rumps")
+
+
+def legacy_sorted_walk(dates, today):
+    """The sorted-list walk main.py, app.py, ConsistencyApp.py and tracker.py used to carry."""
+    if not dates:
+        return 0
+    dates = sorted(set(dates), reverse=True)
+    yesterday = today - timedelta(days=1)
+    last_date = datetime.strptime(dates[0], "%Y-%m-%d").date()
+    if last_date != today and last_date != yesterday:
+        return 0
+    streak = 0
+    expected = last_date
+    for date_str in dates:
+        day = datetime.strptime(date_str, "%Y-%m-%d").date()
+        if day == expected:
+            streak += 1
+            expected = day - timedelta(days=1)
+        elif day < expected:
+            break
+    return streak
+
+
+def legacy_counter(dates, today):
+    """Replay of consistency_tracker.py's stateful current_streak counter."""
+    streak = 0
+    checked = []
+    for date_str in sorted(set(dates)):
+        day = datetime.strptime(date_str, "%Y-%m-%d").date()
+        if checked and checked[-1] == day - timedelta(days=1):
+            streak += 1
+        else:
+            streak = 1
+        checked.append(day)
+    # Startup resets broken streaks to zero
+    if not checked or checked[-1] < today - timedelta(days=1):
+        return 0
+    return streak
+
+
+def generate_history(rng, days, today):
+    """Random check-in history: bursts of activity separated by gaps, with duplicates."""
+    history = []
+    day = today.toordinal() - days
+    end = today.toordinal() - rng.choice((0, 0, 1, 2, 5))
+    density = rng.uniform(0.3, 0.95)
+    while day <= end:
+        if rng.random() < density:
+            history.append(streak_core.from_ordinal(day))
+            if rng.random() < 0.02:
+                history.append(streak_core.from_ordinal(day))
+        day += 1
+    rng.shuffle(history)
+    return history
+
+
+def reference_walk(history, frozen, today, due=lambda day: True):
+    """Streak by stepping back one day at a time over sets; rest days are skipped."""
+    days = {streak_core.to_ordinal(day) for day in history}
+    covered = days | {streak_core.to_ordinal(day) for day in frozen}
+    day = today.toordinal()
+    if not (due(day) and day in covered):
+        day -= 1
+    streak = 0
+    floor = min(covered, default=day) - 8
+    while day > floor:
+        if due(day):
+            if day not in covered:
+                break
+            streak += day in days
+        day -= 1
+    return streak
+
+
+def generate_frozen(rng, history, today):
+    """Frozen days for a history: a few gaps, sometimes on days later checked in too."""
+    checked = set(history)
+    recent = [streak_core.from_ordinal(today.toordinal() - i) for i in range(60)]
+    gaps = [day for day in recent if day not in checked]
+    frozen = rng.sample(gaps, min(len(gaps), rng.randint(0, 5)))
+    if history and rng.random() < 0.3:
+        frozen += rng.sample(sorted(checked), min(len(checked), 2))
+    return frozen
+
+
+def reference_day(moment, day_start):
+    hours, minutes = map(int, day_start.split(":"))
+    day = moment.date() - timedelta(days=1) if moment.time() < clock(hours, minutes) else moment.date()
+    return day.isoformat()
+
+
+def differential(histories, today, rng):
+    """Return (name, history, expected, got) for every disagreement."""
+    mismatches = []
+    for history in histories:
+        core = streak_core.get_streak(history, today=today)
+        walk = legacy_sorted_walk(history, today)
+        counter = legacy_counter(history, today)
+        runs = streak_core.RunIndex(history).streak_as_of(today.toordinal())
+        for name, got in (("sorted_walk", walk), ("counter", counter), ("run_index", runs)):
+            if got != core:
+                mismatches.append((name, history, core, got))
+
+        frozen = generate_frozen(rng, history, today)
+        expected = reference_walk(history, frozen, today)
+        runs = streak_core.RunIndex(history, frozen)
+        checks = [
+            ("get_streak+frozen", streak_core.get_streak(history, frozen, today=today)),
+            ("run_index+frozen", runs.streak_as_of(today.toordinal())),
+            ("habit_status+frozen", streak_core.habit_status(history, frozen=frozen, today=today, runs=runs)[1]),
+        ]
+        for name, got in checks:
+            if got != expected:
+                mismatches.append((name, history, expected, got))
+
+        mask = rng.randint(1, streak_core.EVERY_DAY)
+        excluded = {streak_core.from_ordinal(today.toordinal() - rng.randint(0, 30)) for _ in range(rng.randint(0, 3))}
+        schedule = streak_core.Schedule(mask, excluded)
+        expected = reference_walk(
+            history, frozen, today,
+            lambda day: bool(mask >> date.fromordinal(day).weekday() & 1) and streak_core.from_ordinal(day) not in excluded
+        )
+        got = streak_core.habit_status(history, frozen=frozen, today=today, schedule=schedule)[1]
+        if got != expected:
+            mismatches.append(("schedule", history, expected, got))
+
+        day_start = f"{rng.randint(0, 6):02d}:{rng.choice((0, 30)):02d}"
+        for day in history[:20]:
+            moment = datetime.combine(date.fromisoformat(day), clock(rng.randint(0, 23), rng.randint(0, 59)))
+            expected, got = reference_day(moment, day_start), streak_core.day_key(moment, day_start)
+            if got != expected:
+                mismatches.append((f"day_key {day_start}", history, expected, got))
+    return mismatches
+
+
+def bench(fn, histories, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for history in histories:
+            fn(history)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def import_cost():
+    """Cumulative import time of streak_core in microseconds, from -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import streak_core"],
+        capture_output=True, text=True
+    )
+    for line in result.stderr.splitlines():
+        if line.rstrip().endswith("streak_core"):
+            return int(line.split("|")[1])
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--histories", type=int, default=300)
+    parser.add_argument("--days", type=int, default=1825)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    today = date.today()
+    histories = [generate_history(rng, rng.randint(1, args.days), today) for _ in range(args.histories)]
+
+    leaked = [name for name in UI_MODULES if name in sys.modules]
+    print(f"UI modules pulled in by streak_core: {', '.join(leaked) or 'none'}")
+    print(f"streak_core import time: {import_cost()} us")
+
+    mismatches = differential(histories, today, rng)
+    print(f"Differential check: {len(histories)} histories, {len(mismatches)} mismatches")
+    for name, history, expected, got in mismatches[:5]:
+        print(f"  {name}: expected {expected}, got {got} (last day {max(history)})")
+
+    timings = [
+        ("streak_core.get_streak", lambda h: streak_core.get_streak(h, today=today)),
+        ("legacy sorted walk", lambda h: legacy_sorted_walk(h, today)),
+        ("legacy counter replay", lambda h: legacy_counter(h, today)),
+        ("RunIndex build + query", lambda h: streak_core.RunIndex(h).streak_as_of(today.toordinal())),
+    ]
+    print(f"\n{'implementation':<26}{'best of ' + str(args.repeat):>14}")
+    for name, fn in timings:
+        print(f"{name:<26}{bench(fn, histories, args.repeat) * 1000:>11.1f} ms")
+
+    return 1 if mismatches or leaked else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+📅 Planned items for Consistency Tracker.
+Keeps each day's calendar items in time order and the days grouped by
+month, so the planner reads one month at a time without sorting anything.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+
+def month_of(date_key):
+    """"YYYY-MM" of a "YYYY-MM-DD" key."""
+    return date_key[:7]
+
+
+def item_time(item):
+    return item.get("time", "00:00")
+
+
+class CalendarIndex:
+    """Month and day views over data["calendar"] ({"YYYY-MM-DD": [item, ...]}).
+
+    Each day's list is kept sorted by time in the data itself (add() and
+    update() put an item straight into place) and the days holding items
+    are kept in a sorted list per month, so a month is a dict lookup plus
+    lists that are already in order. Items are addressed by their "id",
+    never by their position, which moves whenever the day changes.
+    """
+
+    def __init__(self, calendar):
+        self._calendar = calendar
+        self._months = {}
+        self._month_keys = []
+        for date_key, items in calendar.items():
+            items.sort(key=item_time)
+            if items:
+                self._add_day(date_key)
+
+    def _add_day(self, date_key):
+        month = month_of(date_key)
+        days = self._months.get(month)
+        if days is None:
+            days = self._months[month] = []
+            insort(self._month_keys, month)
+        i = bisect_left(days, date_key)
+        if i == len(days) or days[i] != date_key:
+            days.insert(i, date_key)
+
+    def _drop_day(self, date_key):
+        month = month_of(date_key)
+        days = self._months[month]
+        del days[bisect_left(days, date_key)]
+        if not days:
+            del self._months[month]
+            del self._month_keys[bisect_left(self._month_keys, month)]
+
+    def day(self, date_key):
+        """The day's items, earliest first."""
+        return self._calendar.get(date_key, [])
+
+    def find(self, date_key, item_id):
+        return next((item for item in self.day(date_key) if item.get("id") == item_id), None)
+
+    def add(self, date_key, item):
+        """Insert item after any others at the same time."""
+        items = self._calendar.setdefault(date_key, [])
+        items.insert(bisect_right([item_time(other) for other in items], item_time(item)), item)
+        if len(items) == 1:
+            self._add_day(date_key)
+
+    def remove(self, date_key, item):
+        items = self._calendar.get(date_key, [])
+        for i, other in enumerate(items):
+            if other is item:
+                del items[i]
+                break
+        else:
+            return
+        if not items:
+            del self._calendar[date_key]
+            self._drop_day(date_key)
+
+    def update(self, date_key, item, **fields):
+        """Change an item's fields, moving it if its time changed."""
+        moved = "time" in fields and fields["time"] != item_time(item)
+        if moved:
+            self.remove(date_key, item)
+        item.update(fields)
+        if moved:
+            self.add(date_key, item)
+
+    def months_from(self, month):
+        """Months holding items from month on, in order."""
+        return self._month_keys[bisect_left(self._month_keys, month):]
+
+    def month_items(self, month):
+        """[(date key, item)] for month in date, then time, order."""
+        return [(date_key, item) for date_key in self._months.get(month, ()) for item in self._calendar[date_key]]
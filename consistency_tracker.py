@@ -7,9 +7,11 @@ A terminal-based app with Mac notifications.
 import json
 import os
 import subprocess
-from datetime import datetime, timedelta
 from pathlib import Path
 
+import streak_core
+from batch import Batch
+
 # Data file location
 DATA_FILE = Path.home() / ".consistency_tracker_data.json"
 
@@ -105,26 +107,43 @@ def print_header():
 
 def get_today():
     """Get today's date as string."""
-    return datetime.now().strftime("%Y-%m-%d")
+    return streak_core.day_key()
 
 
 def get_streak_status(activity):
     """Get the current streak status of an activity."""
-    if not activity.get("checked_in_dates"):
+    dates = activity.get("checked_in_dates")
+    if not dates:
         return "no_streak", 0
     
-    dates = sorted(activity["checked_in_dates"], reverse=True)
-    today = get_today()
-    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    streak = streak_core.get_streak(dates, activity.get("frozen", []))
     
-    if dates[0] == today:
-        return "checked_in_today", activity["current_streak"]
-    elif dates[0] == yesterday:
-        return "at_risk", activity["current_streak"]
+    if get_today() in dates:
+        return "checked_in_today", streak
+    elif streak > 0:
+        return "at_risk", streak
     else:
         return "broken", 0
 
 
+def apply_freeze_tokens(data, batch=None):
+    """Spend freeze tokens on missed days so active streaks survive."""
+    batch = batch or Batch(lambda: save_data(data), send_notification)
+    spent = 0
+    for activity in data["activities"]:
+        days = streak_core.spend_freeze_tokens(
+            activity.get("checked_in_dates", []), activity.get("frozen", []), data.get("freeze_tokens", 0)
+        )
+        if days:
+            activity.setdefault("frozen", []).extend(days)
+            data["freeze_tokens"] -= len(days)
+            spent += len(days)
+            batch.notify("❄️ Streak Frozen", f"{activity['name']}: used {len(days)} freeze token(s)")
+    if spent:
+        batch.save()
+    return spent
+
+
 def check_and_award_badges(data, activity):
     """Check if any new badges should be awarded."""
     streak = activity["current_streak"]
@@ -288,7 +307,9 @@ def check_in(data):
         return
     
     today = get_today()
-    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    # "Check in ALL" saves once and sends one merged notification
+    batch = Batch(lambda: save_data(data), send_notification).begin()
+    apply_freeze_tokens(data, batch)
     
     for idx in indices:
         activity = activities[idx]
@@ -299,19 +320,14 @@ def check_in(data):
                 print(f"\n  {Colors.YELLOW}Already checked in for {activity['name']} today!{Colors.END}")
             continue
         
-        # Update streak
-        if activity["checked_in_dates"] and activity["checked_in_dates"][-1] == yesterday:
-            activity["current_streak"] += 1
-        else:
-            activity["current_streak"] = 1
+        activity["checked_in_dates"].append(today)
         
-        # Update records
+        # Update streak and records
+        _, activity["current_streak"] = get_streak_status(activity)
         activity["total_days"] += 1
         if activity["current_streak"] > activity["longest_streak"]:
             activity["longest_streak"] = activity["current_streak"]
         
-        activity["checked_in_dates"].append(today)
-        
         # Check for badges
         new_badges = check_and_award_badges(data, activity)
         
@@ -322,13 +338,13 @@ def check_in(data):
         
         # Notifications for milestones
         if streak in [7, 14, 30, 50, 100, 365]:
-            send_notification(
+            batch.notify(
                 f"🎉 Milestone: {streak} Days!",
                 f"Incredible! You've hit {streak} days of {activity['name']}!"
             )
             print(f"  {Colors.YELLOW}🎉 MILESTONE: {streak} day streak!{Colors.END}")
         else:
-            send_notification(
+            batch.notify(
                 "Check-in Complete! ✅",
                 f"{icon} {activity['name']} - Day {streak} streak!"
             )
@@ -336,9 +352,10 @@ def check_in(data):
         # Show new badges
         for badge in new_badges:
             print(f"  {Colors.YELLOW}🏆 NEW BADGE: {badge}{Colors.END}")
-            send_notification("🏆 Badge Earned!", badge)
+            batch.notify("🏆 Badge Earned!", badge)
+        batch.save()
     
-    save_data(data)
+    batch.commit()
     input("\n  Press Enter to continue...")
 
 
@@ -433,12 +450,11 @@ def main_menu(data):
 def main():
     """Main application loop."""
     data = load_data()
+    apply_freeze_tokens(data)
     
-    # Update broken streaks on startup
+    # Refresh cached streaks on startup
     for activity in data["activities"]:
-        status, _ = get_streak_status(activity)
-        if status == "broken":
-            activity["current_streak"] = 0
+        _, activity["current_streak"] = get_streak_status(activity)
     save_data(data)
     
     # Welcome notification
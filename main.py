@@ -5,9 +5,14 @@ Track your daily habits and maintain streaks!
 """
 
 import sys
+import copy
 import json
 import subprocess
-from datetime import datetime, timedelta
+import time
+import uuid
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -15,10 +20,22 @@ from PyQt6.QtWidgets import (
     QGridLayout, QSizePolicy, QSpacerItem, QInputDialog, QTextEdit,
     QComboBox, QColorDialog, QListWidget, QListWidgetItem, QSplitter,
     QDialog, QDialogButtonBox, QSpinBox, QSlider, QTabWidget, QCheckBox,
-    QCalendarWidget
+    QCalendarWidget, QDateEdit, QListView, QStyledItemDelegate, QStyle, QStackedWidget
 )
-from PyQt6.QtCore import Qt, QTimer, QSize
-from PyQt6.QtGui import QFont, QColor, QPalette, QIcon, QTextCharFormat, QTextCursor, QTextListFormat
+from PyQt6.QtCore import (
+    Qt, QTimer, QSize, QDate, QAbstractListModel, QModelIndex, QPointF, QRect, QEvent, QSortFilterProxyModel, pyqtSignal,
+    QObject, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import QFont, QColor, QPalette, QIcon, QTextCharFormat, QTextCursor, QTextListFormat, QPainter, QPainterPath, QPen, QPolygonF
+
+import streak_core
+from batch import Batch
+from calendar_index import CalendarIndex, month_of
+from search_index import SearchIndex, html_to_text
+from session_index import SessionIndex, day_minute, format_clock, json_default, parse_clock
+from store import ACTIVITY, BADGE, CALENDAR, CHECKINS, GOAL, NOTE, SETTINGS, TODAY, Store
+from streak_core import EVERY_DAY, WEEKDAYS, DayIndex, DayTotals, RunIndex, Schedule, day_key, to_ordinal, from_ordinal
+from time_series import combined_series
 
 # Data storage
 DATA_DIR = Path.home() / ".consistency_tracker"
@@ -37,6 +54,9 @@ QWidget {
     color: #ffffff;
     font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', sans-serif;
 }
+QFrame#mainArea, QWidget#content {
+    background-color: #0f0f1a;
+}
 QFrame#sidebar {
     background-color: #1a1a2e;
     border-right: 1px solid #2a2a4a;
@@ -81,10 +101,8 @@ QPushButton#checkin {
 QPushButton#checkin:hover {
     background-color: #ff5a75;
 }
-QPushButton#done {
+QPushButton#checkin[done="true"], QPushButton#checkin[done="true"]:hover {
     background-color: #00bf63;
-    border: none;
-    border-radius: 25px;
 }
 QPushButton#preset {
     background-color: #1e1e3f;
@@ -124,6 +142,266 @@ QScrollBar::handle:vertical {
 QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
     height: 0px;
 }
+QDialog {
+    background-color: #1a1a2e;
+}
+QLabel#muted {
+    color: #8888aa;
+}
+QLabel#accentText {
+    color: #4cc9f0;
+}
+QLabel[loading="true"] {
+    color: #3a3a6a;
+}
+QFrame#panel {
+    background-color: #1e1e3f;
+    border-radius: 15px;
+}
+QFrame#tile {
+    background-color: #1e1e3f;
+    border-radius: 12px;
+}
+QFrame#dayBox {
+    background-color: #2a2a5a;
+    border-radius: 6px;
+}
+QFrame#dayBox[active="true"] {
+    background-color: #00bf63;
+}
+QFrame#activityCard {
+    background-color: #1e1e3f;
+    border-radius: 15px;
+    border-left: 5px solid #e94560;
+}
+QLabel#cardStatus, QLabel#cardStreak {
+    color: #8888aa;
+}
+QLabel#cardStreak[active="true"] {
+    color: #ff6b35;
+}
+QLabel#cardToday[kind="note"] {
+    color: #9b5de5;
+}
+QLabel#cardToday[kind="time"] {
+    color: #00bf63;
+}
+QPushButton#iconButton {
+    background-color: #2a2a5a;
+    border: none;
+    border-radius: 10px;
+    font-size: 16px;
+}
+QPushButton#iconButton:hover {
+    background-color: #3a3a6a;
+}
+QPushButton#deleteButton {
+    background-color: transparent;
+    border: none;
+    color: #666688;
+    font-size: 18px;
+}
+QPushButton#deleteButton:hover {
+    color: #e94560;
+}
+QPushButton#secondary, QPushButton#danger {
+    background-color: #2a2a5a;
+    border: none;
+    border-radius: 10px;
+    color: white;
+    font-size: 14px;
+}
+QPushButton#secondary:hover {
+    background-color: #3a3a6a;
+}
+QPushButton#danger:hover {
+    background-color: #ff4757;
+}
+QPushButton#save {
+    background-color: #e94560;
+    border: none;
+    border-radius: 10px;
+    color: white;
+    font-size: 14px;
+    font-weight: bold;
+}
+QPushButton#save:hover {
+    background-color: #ff5a75;
+}
+QPushButton#toolbar {
+    background-color: #2a2a5a;
+    border: none;
+    border-radius: 8px;
+    color: white;
+    padding: 0 12px;
+}
+QPushButton#toolbar:hover {
+    background-color: #3a3a6a;
+}
+QPushButton#chip {
+    background-color: #2a2a5a;
+    border: 1px solid #3a3a6a;
+    border-radius: 8px;
+    color: white;
+    font-size: 12px;
+}
+QPushButton#chip:hover {
+    background-color: #e94560;
+    border-color: #e94560;
+}
+QPushButton#mood {
+    background-color: #2a2a5a;
+    border: 2px solid #3a3a6a;
+    border-radius: 12px;
+}
+QPushButton#mood:hover {
+    background-color: #3a3a6a;
+    border-color: #e94560;
+}
+QPushButton#mood[selected="true"] {
+    background-color: #e94560;
+    border-color: #ff5a75;
+}
+QPushButton#noteColor {
+    border: 3px solid transparent;
+    border-radius: 15px;
+}
+QPushButton#noteColor:hover, QPushButton#noteColor[selected="true"] {
+    border-color: white;
+}
+QListView#notesList {
+    background-color: transparent;
+    border: none;
+    outline: none;
+}
+QListView#notesList::item {
+    background-color: #2a2a5a;
+    border-radius: 10px;
+    padding: 12px;
+    margin-bottom: 8px;
+    color: white;
+}
+QListView#notesList::item:selected {
+    background-color: #e94560;
+}
+QListView#notesList::item:hover:!selected {
+    background-color: #3a3a6a;
+}
+QLineEdit#noteTitle, QTextEdit#noteEditor {
+    background-color: #2a2a5a;
+    border: 2px solid #3a3a6a;
+    border-radius: 10px;
+    padding: 10px 15px;
+    font-size: 16px;
+}
+QTextEdit#noteEditor {
+    padding: 15px;
+    font-size: 14px;
+    color: white;
+    selection-background-color: #e94560;
+}
+QLineEdit#noteTitle:focus, QTextEdit#noteEditor:focus {
+    border-color: #e94560;
+}
+QPushButton#noteDelete {
+    background-color: #2a2a5a;
+    border: 2px solid #3a3a6a;
+    border-radius: 12px;
+    color: white;
+}
+QPushButton#noteDelete:hover {
+    background-color: #ff4757;
+    border-color: #ff4757;
+}
+QFrame#noteToolbar {
+    background-color: #2a2a5a;
+    border-radius: 10px;
+}
+QFrame#toolbarSep {
+    background-color: #4a4a7a;
+}
+QPushButton#format {
+    background-color: #3a3a6a;
+    border: none;
+    border-radius: 8px;
+    color: white;
+    font-size: 14px;
+}
+QPushButton#format:hover {
+    background-color: #4a4a7a;
+}
+QPushButton#format:pressed {
+    background-color: #e94560;
+}
+QPushButton#format[kind="bold"] {
+    font-weight: bold;
+}
+QPushButton#format[kind="italic"] {
+    font-style: italic;
+}
+QPushButton#format[kind="underline"] {
+    text-decoration: underline;
+}
+QPushButton#format[kind="picker"] {
+    font-size: 16px;
+}
+QPushButton#format[kind="bullet"] {
+    font-size: 18px;
+    font-weight: bold;
+}
+QPushButton#format[kind="numbered"] {
+    font-size: 12px;
+    font-weight: bold;
+}
+QPushButton#textColor {
+    border: 2px solid #4a4a7a;
+    border-radius: 12px;
+}
+QPushButton#textColor:hover {
+    border-color: white;
+}
+QComboBox#heading {
+    background-color: #3a3a6a;
+    border: none;
+    border-radius: 8px;
+    padding: 5px 10px;
+    color: white;
+}
+QComboBox#heading::drop-down {
+    border: none;
+    width: 20px;
+}
+QComboBox#heading::down-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 5px solid white;
+    margin-right: 5px;
+}
+QComboBox#heading QAbstractItemView {
+    background-color: #2a2a5a;
+    border: 1px solid #3a3a6a;
+    selection-background-color: #e94560;
+    color: white;
+}
+QLineEdit#clock, QDateEdit#dayPicker, QTextEdit#field {
+    background-color: #2a2a5a;
+    border: 2px solid #3a3a6a;
+    border-radius: 8px;
+    color: white;
+    padding: 6px 10px;
+}
+QDateEdit#dayPicker {
+    padding: 4px 8px;
+}
+QTextEdit#field {
+    border-radius: 10px;
+    padding: 10px;
+    font-size: 13px;
+}
+QLineEdit#clock:focus, QDateEdit#dayPicker:focus, QTextEdit#field:focus {
+    border-color: #e94560;
+}
 """
 
 PRESETS = [
@@ -139,6 +417,114 @@ PRESETS = [
     ("🔧", "Project", "#06d6a0"),
 ]
 
+FREQUENCY_CHOICES = [("Every day", None)] + [
+    (f"{n}× per week", {"count": n, "per": "week"}) for n in range(1, 7)
+] + [
+    (f"{n}× per month", {"count": n, "per": "month"}) for n in (1, 2, 4, 8, 12, 16, 20)
+]
+
+NOTE_COLORS = [
+    ("#e94560", "Red"),
+    ("#4361ee", "Blue"),
+    ("#00bf63", "Green"),
+    ("#ffd166", "Yellow"),
+    ("#9b5de5", "Purple"),
+    ("#4cc9f0", "Cyan"),
+]
+
+TEXT_COLORS = [
+    ("#ffffff", "White"),
+    ("#e94560", "Red"),
+    ("#00bf63", "Green"),
+    ("#4361ee", "Blue"),
+    ("#ffd166", "Yellow"),
+    ("#9b5de5", "Purple"),
+    ("#4cc9f0", "Cyan"),
+    ("#ff6b35", "Orange"),
+]
+
+# Status colour and boldness, shared by the stylesheet and the painted dashboard
+STATUS_STYLES = {
+    "done": ("#00bf63", True),
+    "frozen": ("#a0c4ff", True),
+    "on_track": ("#4cc9f0", True),
+    "rest": ("#8888aa", False),
+    "at_risk": ("#ff9f1c", True),
+    "start": ("#8888aa", False),
+}
+
+PRESET_COLORS = sorted({color for _, _, color in PRESETS})
+
+# Rules keyed on property values, so a state change is a property flip rather than a new stylesheet
+STYLE += "".join(
+    f'QFrame#activityCard[accent="{color}"] {{ border-left: 5px solid {color}; }}\n'
+    for color in PRESET_COLORS
+) + "".join(
+    f'QLabel#cardStatus[status="{status}"] {{ color: {color};{" font-weight: bold;" if bold else ""} }}\n'
+    for status, (color, bold) in STATUS_STYLES.items()
+) + "".join(
+    f'QPushButton#noteColor[color="{color}"] {{ background-color: {color}; }}\n'
+    for color, _ in NOTE_COLORS
+) + "".join(
+    f'QPushButton#textColor[color="{color}"] {{ background-color: {color}; }}\n'
+    for color, _ in TEXT_COLORS
+)
+
+ROLLING_WINDOWS = (7, 30, 90, 365)
+
+# From this many activities the dashboard paints rows in a list view instead of building card widgets
+LIST_DASHBOARD_AT = 150
+
+# Widgets hidden pages may keep alive between visits; past it the least
+# recently shown pages are dropped, so a few large ones don't pile up
+PAGE_WIDGET_BUDGET = 8000
+
+# Changes that leave a hidden page out of date, so it rebuilds on its next visit.
+# Home and Notes are patched in place instead (refresh_home, on_notes_changed).
+PAGE_TOPICS = {
+    "Add Activity": {ACTIVITY},
+    "Calendar": {CALENDAR},
+    "Badges": {ACTIVITY, BADGE},
+    "Statistics": {ACTIVITY, CHECKINS, GOAL, BADGE, TODAY},
+    "Settings": {SETTINGS},
+}
+
+
+def set_state(widget, **properties):
+    """Set the dynamic properties STYLE matches on; re-polish only if one changed."""
+    changed = False
+    for name, value in properties.items():
+        if widget.property(name) != value:
+            widget.setProperty(name, value)
+            changed = True
+    if changed:
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+
+def format_duration(minutes):
+    return f"{minutes // 60}h {minutes % 60}m" if minutes >= 60 else f"{minutes}m"
+
+
+def habit_period(info):
+    """"day", "week" or "month": the unit an activity's streaks are counted in."""
+    return (info.get("frequency") or {}).get("per", "day")
+
+
+def best_streak_text(streaks):
+    """Best of (streak, period) pairs, never comparing across units.
+    
+    Daily habits win if there are any, then weekly, then monthly ones;
+    units other than days are spelled out.
+    """
+    best = {}
+    for streak, per in streaks:
+        best[per] = max(best.get(per, 0), streak)
+    for per, units in streak_core.PERIOD_UNITS.items():
+        if per in best:
+            return str(best[per]) if per == "day" else f"{best[per]} {units}"
+    return "0"
+
 BADGES = {
     1: ("⭐", "First Step", "Complete your first day"),
     7: ("🔥", "Week Warrior", "7 day streak"),
@@ -150,6 +536,655 @@ BADGES = {
 }
 
 
+MOOD_EMOJI = ['😩', '😕', '😐', '😊', '🤩']
+
+
+class SessionListModel(QAbstractListModel):
+    """Newest-first sessions of one activity in a date range, exposed a page at a time.
+
+    Rows map straight onto positions in the SessionIndex, so nothing is
+    copied; the view only asks for the rows it paints and fetchMore()
+    grows the row count as the user scrolls.
+    """
+
+    PAGE_SIZE = 100
+    SessionRole = Qt.ItemDataRole.UserRole
+    KeyRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, session_index, parent=None):
+        super().__init__(parent)
+        self.session_index = session_index
+        self._lo, self._hi = session_index.span()
+        self._loaded = min(self.PAGE_SIZE, self.total())
+
+    def total(self):
+        return self._hi - self._lo
+
+    def set_range(self, first_day=None, last_day=None):
+        """Show only sessions dated first_day..last_day."""
+        self.beginResetModel()
+        self._lo, self._hi = self.session_index.span(first_day, last_day)
+        self._loaded = min(self.PAGE_SIZE, self.total())
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._loaded < self.total()
+
+    def fetchMore(self, parent):
+        count = min(self.PAGE_SIZE, self.total() - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def key(self, row):
+        return self.session_index.key_at(self._hi - 1 - row)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        key = self.key(index.row())
+        if role == self.KeyRole:
+            return key
+        session = self.session_index.get(key)
+        if role == self.SessionRole:
+            return session
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{key[0]} {format_clock(key[1])}"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return session.get("note") or None
+        return None
+
+    def row_for_day(self, day):
+        """Row of the newest session on or before day, loading pages up to it."""
+        if not self.total():
+            return -1
+        position = min(max(self.session_index.count_through(day), self._lo + 1), self._hi)
+        row = self._hi - position
+        while self._loaded <= row:
+            self.fetchMore(QModelIndex())
+        return row
+
+
+class SessionDelegate(QStyledItemDelegate):
+    """Paints a session row as a card: date, time span, duration, mood, note."""
+
+    ROW_HEIGHT = 64
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        session = index.data(SessionListModel.SessionRole)
+        key = index.data(SessionListModel.KeyRole)
+        if session is None:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = option.rect.adjusted(0, 4, -8, -4)
+        selected = option.state & QStyle.StateFlag.State_Selected
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#2a2a5a" if selected else "#1e1e3f"))
+        painter.drawRoundedRect(rect, 10, 10)
+        
+        mins = session.get("minutes", 0)
+        top = rect.adjusted(15, 6, -15, -rect.height() // 2)
+        painter.setFont(QFont("SF Pro Display", 12, QFont.Weight.Bold))
+        painter.setPen(QColor("white"))
+        painter.drawText(top, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, f"📅 {key[0]}")
+        painter.setFont(QFont("SF Pro Display", 11))
+        painter.setPen(QColor("#8888aa"))
+        painter.drawText(
+            top.adjusted(120, 0, 0, 0), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"🕒 {format_clock(key[1])}–{format_clock((key[1] + mins) % 1440)}"
+        )
+        mood = MOOD_EMOJI[min(max(session.get("mood", 3), 1), 5) - 1]
+        painter.setFont(QFont("SF Pro Display", 12, QFont.Weight.Bold))
+        painter.setPen(QColor("#4cc9f0"))
+        painter.drawText(top, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, f"⏱ {format_duration(mins)}  {mood}")
+        
+        note = session.get("note", "")
+        if note:
+            bottom = rect.adjusted(15, rect.height() // 2, -15, -6)
+            painter.setFont(QFont("SF Pro Display", 11))
+            painter.setPen(QColor("#9b5de5"))
+            elided = painter.fontMetrics().elidedText(" ".join(note.split()), Qt.TextElideMode.ElideRight, bottom.width())
+            painter.drawText(bottom, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided)
+        painter.restore()
+
+
+class ActivityListModel(QAbstractListModel):
+    """Activities as rows for the painted dashboard.
+
+    A row's card summary is computed the first time the view paints it and
+    kept until refresh() names that activity, so a check-in recomputes one
+    row and scrolling through a thousand activities only ever summarizes
+    the rows that come into view.
+    """
+
+    SummaryRole = Qt.ItemDataRole.UserRole
+    NameRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, names, summarize, parent=None):
+        super().__init__(parent)
+        self._names = list(names)
+        self._rows = {name: row for row, name in enumerate(self._names)}
+        self._summaries = {}
+        self._summarize = summarize
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._names):
+            return None
+        name = self._names[index.row()]
+        if role in (self.NameRole, Qt.ItemDataRole.DisplayRole):
+            return name
+        if role in (self.SummaryRole, Qt.ItemDataRole.ToolTipRole):
+            summary = self._summaries.get(name)
+            if summary is None:
+                summary = self._summaries[name] = self._summarize(name)
+            return summary if role == self.SummaryRole else summary["rolling"][1]
+        return None
+
+    def __contains__(self, name):
+        return name in self._rows
+
+    def refresh(self, names):
+        """Drop the cached summaries of names and repaint their rows."""
+        for name in names:
+            row = self._rows.get(name)
+            if row is not None:
+                self._summaries.pop(name, None)
+                self.dataChanged.emit(self.index(row), self.index(row))
+
+    def insert(self, position, name):
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._names.insert(position, name)
+        self._rows = {name: row for row, name in enumerate(self._names)}
+        self.endInsertRows()
+
+    def remove(self, name):
+        row = self._rows.get(name)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._names[row]
+        self._rows = {name: row for row, name in enumerate(self._names)}
+        self._summaries.pop(name, None)
+        self.endRemoveRows()
+
+
+class ActivityDelegate(QStyledItemDelegate):
+    """Paints an activity row like a dashboard card, with its buttons as hit-tested regions.
+
+    triggered(name, action) fires on a click in the history, check-in,
+    delete or (when selecting) checkbox region.
+    """
+
+    ROW_HEIGHT = 132
+    CARD_HEIGHT = 120
+    triggered = pyqtSignal(str, str)
+
+    def __init__(self, selected, parent=None):
+        super().__init__(parent)
+        self.selected = selected
+        self.selecting = False
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def card_rect(self, rect):
+        return QRect(rect.left(), rect.top(), rect.width() - 10, self.CARD_HEIGHT)
+
+    def regions(self, rect):
+        """{action: QRect} for the clickable parts of the card painted in rect."""
+        card = self.card_rect(rect)
+        middle = card.center().y()
+        delete = QRect(card.right() - 15 - 30, middle - 15, 30, 30)
+        checkin = QRect(delete.left() - 6 - 50, middle - 25, 50, 50)
+        history = QRect(checkin.left() - 6 - 40, middle - 20, 40, 40)
+        regions = {"history": history, "checkin": checkin, "delete": delete}
+        if self.selecting:
+            regions["select"] = QRect(card.left() + 20, middle - 9, 18, 18)
+        return regions
+
+    def paint(self, painter, option, index):
+        summary = index.data(ActivityListModel.SummaryRole)
+        name = index.data(ActivityListModel.NameRole)
+        if summary is None:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        card = self.card_rect(option.rect)
+        regions = self.regions(option.rect)
+        
+        # Card with its colour strip down the left edge
+        path = QPainterPath()
+        path.addRoundedRect(card.x(), card.y(), card.width(), card.height(), 15, 15)
+        painter.setClipPath(path)
+        painter.fillRect(card, QColor("#1e1e3f"))
+        painter.fillRect(QRect(card.left(), card.top(), 5, card.height()), QColor(summary["color"]))
+        painter.setClipping(False)
+        
+        left = card.left() + 20
+        if self.selecting:
+            box = regions["select"]
+            painter.setPen(QPen(QColor("#8888aa"), 2))
+            painter.setBrush(QColor("#e94560") if name in self.selected else Qt.BrushStyle.NoBrush)
+            painter.drawRoundedRect(box, 4, 4)
+            if name in self.selected:
+                painter.setPen(QColor("white"))
+                painter.drawText(box, Qt.AlignmentFlag.AlignCenter, "✓")
+            left = box.right() + 12
+        right = regions["history"].left() - 10
+        
+        def text(x, y, height, value, color, font, elide=False):
+            painter.setFont(font)
+            painter.setPen(QColor(color))
+            if elide:
+                value = painter.fontMetrics().elidedText(value, Qt.TextElideMode.ElideRight, max(right - x, 0))
+            painter.drawText(QRect(x, y, max(right - x, 0), height), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, value)
+            return x + painter.fontMetrics().horizontalAdvance(value)
+        
+        # Title row
+        title_font = QFont("SF Pro Display", 16, QFont.Weight.Bold)
+        x = text(left, card.top() + 12, 26, name, "white", title_font)
+        status_key, status_text = summary["status"]
+        status_color, status_bold = STATUS_STYLES[status_key]
+        status_font = QFont("SF Pro Display", 12, QFont.Weight.Bold if status_bold else QFont.Weight.Normal)
+        text(x + 10, card.top() + 12, 26, status_text, status_color, status_font)
+        
+        # Stats row
+        x = left
+        y = card.top() + 44
+        streak_text, streak_active = summary["streak"]
+        x = text(x, y, 24, streak_text, "#ff6b35" if streak_active else "#8888aa", QFont("SF Pro Display", 12, QFont.Weight.Bold)) + 15
+        small = QFont("SF Pro Display", 11)
+        x = text(x, y, 24, summary["longest"], "#8888aa", small) + 15
+        x = text(x, y, 24, summary["time"], "#4cc9f0", small) + 15
+        x = text(x, y, 24, summary["total"], "#8888aa", small) + 15
+        text(x, y, 24, summary["rolling"][0], "#8888aa", small)
+        
+        # Today's note or time
+        today_text, today_kind = summary["today"]
+        if today_text:
+            text(left, card.top() + 74, 22, today_text, "#9b5de5" if today_kind == "note" else "#00bf63", QFont("SF Pro Display", 10), elide=True)
+        
+        # Buttons
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#2a2a5a"))
+        painter.drawRoundedRect(regions["history"], 10, 10)
+        painter.setBrush(QColor("#00bf63" if summary["checked"] else "#e94560"))
+        painter.drawEllipse(regions["checkin"])
+        painter.setFont(QFont("SF Pro Display", 16))
+        painter.setPen(QColor("white"))
+        painter.drawText(regions["history"], Qt.AlignmentFlag.AlignCenter, "📋")
+        painter.setFont(QFont("SF Pro Display", 20, QFont.Weight.Bold))
+        painter.drawText(regions["checkin"], Qt.AlignmentFlag.AlignCenter, "✓" if summary["checked"] else "+")
+        painter.setFont(QFont("SF Pro Display", 18))
+        painter.setPen(QColor("#666688"))
+        painter.drawText(regions["delete"], Qt.AlignmentFlag.AlignCenter, "×")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            point = event.position().toPoint()
+            for action, region in self.regions(option.rect).items():
+                if region.contains(point):
+                    self.triggered.emit(index.data(ActivityListModel.NameRole), action)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+
+class CalendarListModel(QAbstractListModel):
+    """Planned items from one month on, loaded a month at a time.
+
+    The window opens on a month with about PAGE_SIZE rows (whole months),
+    and fetchMore() appends the next months holding items as the list is
+    scrolled, so plans further out are only read when someone looks.
+    """
+
+    PAGE_SIZE = 50
+    IdRole = Qt.ItemDataRole.UserRole
+    DateRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, calendar_index, month, parent=None):
+        super().__init__(parent)
+        self.calendar_index = calendar_index
+        self.month = month
+        self._months = []
+        self._next = 0
+        self._rows = []
+        self.set_month(month)
+
+    def set_month(self, month):
+        """Start the window at month ("YYYY-MM")."""
+        self.beginResetModel()
+        self.month = month
+        self._months = self.calendar_index.months_from(month)
+        self._next = 0
+        self._rows = self._take()
+        self.endResetModel()
+
+    def reload(self):
+        """Re-read the window after items were added, edited or removed."""
+        self.set_month(self.month)
+
+    def _take(self):
+        """Rows of the next whole months, about PAGE_SIZE of them."""
+        rows = []
+        while self._next < len(self._months) and len(rows) < self.PAGE_SIZE:
+            rows.extend(self.calendar_index.month_items(self._months[self._next]))
+            self._next += 1
+        return rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._next < len(self._months)
+
+    def fetchMore(self, parent):
+        rows = self._take()
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        date_key, item = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{date_key} · {item.get('time', '00:00')} — {item.get('title', '')}"
+        if role == self.IdRole:
+            return item["id"]
+        if role == self.DateRole:
+            return date_key
+        return None
+
+    def row_for_day(self, date_key):
+        """First row dated date_key or later, loading months up to it; -1 if none."""
+        while True:
+            row = bisect_left([day for day, _ in self._rows], date_key)
+            if row < len(self._rows) or not self.canFetchMore(QModelIndex()):
+                return row if row < len(self._rows) else -1
+            self.fetchMore(QModelIndex())
+
+    def row_of(self, item_id):
+        """Row showing the item, loading months until it turns up; -1 if outside the window."""
+        row = 0
+        while True:
+            for row in range(row, len(self._rows)):
+                if self._rows[row][1]["id"] == item_id:
+                    return row
+            row = len(self._rows)
+            if not self.canFetchMore(QModelIndex()):
+                return -1
+            self.fetchMore(QModelIndex())
+
+
+class PlanCalendar(QCalendarWidget):
+    """Calendar marking each day's check-ins (a dot per activity, in its colour) and planned items.
+
+    marks(year, month) gives {day: (colours, planned count)} for a month;
+    the app caches it per month, so paging months only looks marks up.
+    """
+
+    DOT = 6
+    MAX_DOTS = 4
+
+    def __init__(self, marks, parent=None):
+        super().__init__(parent)
+        self.marks = marks
+
+    def paintCell(self, painter, rect, date):
+        super().paintCell(painter, rect, date)
+        colors, planned = self.marks(date.year(), date.month()).get(date.day(), ((), 0))
+        if not colors and not planned:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        shown = colors[:self.MAX_DOTS]
+        x = rect.center().x() - (len(shown) * (self.DOT + 3) - 3) // 2
+        for color in shown:
+            painter.setBrush(QColor(color))
+            painter.drawEllipse(x, rect.bottom() - self.DOT - 3, self.DOT, self.DOT)
+            x += self.DOT + 3
+        if len(colors) > len(shown):
+            painter.setFont(QFont("SF Pro Display", 8))
+            painter.setPen(QColor("#8888aa"))
+            painter.drawText(x - 1, rect.bottom() - 1, "+")
+        if planned:
+            painter.setFont(QFont("SF Pro Display", 8, QFont.Weight.Bold))
+            painter.setPen(QColor("#ffd166"))
+            painter.drawText(rect.adjusted(0, 2, -4, 0), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop, str(planned))
+        painter.restore()
+
+
+class NoteListModel(QAbstractListModel):
+    """Notes as rows keyed by their stable id, most recently updated first.
+
+    The model keeps that order itself rather than leaving it to a sorting
+    proxy, which would call data() n log n times on every build. A save
+    moves one row to the top and a new or deleted note is one row insert
+    or removal, so the view keeps its selection and a filtering proxy on
+    top only re-checks the rows that changed.
+    """
+
+    IdRole = Qt.ItemDataRole.UserRole
+    TitleRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, notes, parent=None):
+        super().__init__(parent)
+        self._ids = []
+        self._notes = {}
+        self._rows = {}
+        self.reset(notes)
+
+    def reset(self, notes):
+        self.beginResetModel()
+        newest = sorted(notes, key=lambda note: note.get("updated", note.get("created", "")), reverse=True)
+        self._ids = [note["id"] for note in newest]
+        self._notes = {note["id"]: note for note in notes}
+        self._rows = {note_id: row for row, note_id in enumerate(self._ids)}
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._ids):
+            return None
+        note = self._notes[self._ids[index.row()]]
+        updated = note.get("updated", note.get("created", ""))
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{note.get('title', 'Untitled')}\n📅 {updated[:10] if updated else 'No date'}"
+        if role == self.IdRole:
+            return note["id"]
+        if role == self.TitleRole:
+            return note.get("title", "Untitled")
+        return None
+
+    def note(self, note_id):
+        return self._notes.get(note_id)
+
+    def row_of(self, note_id):
+        return self._rows.get(note_id, -1)
+
+    def sync(self, notes, note_ids):
+        """Catch up with saves and deletes of note_ids (None: anything) in the notes list."""
+        if None in note_ids:
+            self.reset(notes)
+            return
+        current = {note.get("id"): note for note in notes if note.get("id") in note_ids}
+        for note_id in note_ids:
+            note = current.get(note_id)
+            row = self._rows.get(note_id)
+            if note is None:
+                if row is not None:
+                    self.beginRemoveRows(QModelIndex(), row, row)
+                    del self._ids[row]
+                    del self._notes[note_id]
+                    self._rows = {note_id: row for row, note_id in enumerate(self._ids)}
+                    self.endRemoveRows()
+            elif row is None:
+                self.beginInsertRows(QModelIndex(), 0, 0)
+                self._ids.insert(0, note_id)
+                self._notes[note_id] = note
+                self._rows = {note_id: row for row, note_id in enumerate(self._ids)}
+                self.endInsertRows()
+            else:
+                # Just saved, so now the newest
+                if row:
+                    self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), 0)
+                    self._ids.insert(0, self._ids.pop(row))
+                    self._rows = {note_id: row for row, note_id in enumerate(self._ids)}
+                    self.endMoveRows()
+                self._notes[note_id] = note
+                self.dataChanged.emit(self.index(0), self.index(0))
+
+
+class TrendChart(QWidget):
+    """Line chart of minutes over a long range, asking for one point per pixel at most."""
+
+    def __init__(self, series, first, last, parent=None):
+        super().__init__(parent)
+        self.series = series
+        self.first = first
+        self.last = last
+        self._points = {}
+        self.setFixedHeight(170)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#1e1e3f"))
+        painter.drawRoundedRect(self.rect(), 12, 12)
+        
+        plot = self.rect().adjusted(20, 30, -20, -28)
+        width = max(plot.width(), 3)
+        if width not in self._points:
+            # Repaints at the same size reuse the thinned series
+            self._points = {width: combined_series(self.series, self.first, self.last, width)}
+        per, points = self._points[width]
+        peak = max((minutes for _, minutes in points), default=0)
+        
+        painter.setFont(QFont("SF Pro Display", 10))
+        painter.setPen(QColor("#8888aa"))
+        painter.drawText(
+            self.rect().adjusted(20, 8, -20, 0), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+            f"Minutes per {per} · peak {format_duration(peak)}"
+        )
+        painter.drawText(
+            self.rect().adjusted(20, 0, -20, -8), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom,
+            from_ordinal(self.first)
+        )
+        painter.drawText(
+            self.rect().adjusted(20, 0, -20, -8), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom,
+            from_ordinal(self.last)
+        )
+        if len(points) < 2 or not peak:
+            return
+        
+        span = max(self.last - self.first, 1)
+        line = QPolygonF([
+            QPointF(
+                plot.left() + (start - self.first) / span * plot.width(),
+                plot.bottom() - minutes / peak * plot.height()
+            )
+            for start, minutes in points
+        ])
+        painter.setPen(QPen(QColor("#4cc9f0"), 2))
+        painter.drawPolyline(line)
+
+
+class StatsSignals(QObject):
+    totals = pyqtSignal(object, object)
+    activity = pyqtSignal(object, object)
+    finished = pyqtSignal(object)
+
+
+class StatsWorker(QRunnable):
+    """Computes the Statistics page on a QThreadPool thread from a snapshot.
+
+    The snapshot holds tuples copied from the data, so the UI can keep
+    changing it meanwhile. Activities the UI has no session index for
+    carry their raw sessions; the worker indexes them and hands each index
+    back, with the list it came from and the rows to persist in its place,
+    for adopt_sessions(). Every activity's result carries the minute
+    series the trend chart draws, so the UI never indexes sessions for it.
+    Results go out
+    through signals, tagged with the page's view: the headline totals,
+    then one activity at a time, then finished.
+    """
+
+    def __init__(self, view, snapshot):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.view = view
+        self.snapshot = snapshot
+        self.signals = StatsSignals()
+        self.cancelled = False
+
+    def run(self):
+        today = self.snapshot["today"]
+        activities = self.snapshot["activities"]
+        active = 0
+        for activity in activities:
+            if self.cancelled:
+                return
+            schedule = None
+            if activity["schedule"] != EVERY_DAY or activity["excluded"]:
+                schedule = Schedule(activity["schedule"], activity["excluded"])
+            status = streak_core.habit_status(
+                activity["dates"], activity["frequency"], activity["frozen"],
+                today=self.snapshot["date"], schedule=schedule
+            )
+            active += status[1] > 0
+        self.signals.totals.emit(self.view, {
+            "days": sum(len(activity["dates"]) for activity in activities),
+            "active": active,
+            "best": best_streak_text((activity["longest"], activity["per"]) for activity in activities),
+        })
+        
+        for activity in activities:
+            if self.cancelled:
+                return
+            checked = {to_ordinal(day) for day in activity["dates"]}
+            days = sorted(checked)
+            index = rows = None
+            minutes, series = activity["minutes"], activity["series"]
+            if minutes is None:
+                index = SessionIndex(activity["sessions"], self.snapshot["day_start"])
+                minutes = [index.minute_totals.window(today - span + 1, today) for span in ROLLING_WINDOWS]
+                series, rows = index.minute_series, index.sessions()
+            windows = [
+                (span, total, bisect_right(days, today) - bisect_left(days, today - span + 1))
+                for span, total in zip(ROLLING_WINDOWS, minutes)
+            ]
+            week = [today - i in checked for i in range(6, -1, -1)]
+            self.signals.activity.emit(self.view, {
+                "name": activity["name"],
+                "windows": windows,
+                "week": week,
+                "index": index,
+                "rows": rows,
+                "source": activity["source"],
+                "series": series,
+            })
+        self.signals.finished.emit(self.view)
+
+
 class ConsistencyApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -159,6 +1194,26 @@ class ConsistencyApp(QMainWindow):
         
         # Load data
         self.data = self.load_data()
+        self.batch = Batch(self.write_data, self.post_notification, self.snapshot_data, self.restore_data)
+        self.store = Store(self.batch)
+        self.current_page = None
+        self.page_cache = OrderedDict()
+        self.today = None
+        self.selecting = False
+        self.selected_activities = set()
+        self.cards = {}
+        self.activity_model = None
+        self.runs = {}
+        self.rank_runs = {}
+        self.day_index = DayIndex.build(self.data.get("activities", {}))
+        self.session_indexes = {}
+        self.checkin_totals = {}
+        self.search_index = None
+        self.calendar_index = None
+        self.calendar_marks = {}
+        self.stats_view = None
+        self.statuses = {}
+        self.best_streak = self.store.derived(self.compute_best_streak)
         
         # Central widget
         central = QWidget()
@@ -174,6 +1229,12 @@ class ConsistencyApp(QMainWindow):
         # Apply styles
         self.setStyleSheet(STYLE)
         
+        # Views refresh from the changes a mutation reports, not after every call
+        self.store.subscribe(self.on_text_changed, NOTE, CALENDAR)
+        self.store.subscribe(self.on_notes_changed, NOTE)
+        self.store.subscribe(self.on_activities_changed, ACTIVITY, CHECKINS, GOAL, TODAY)
+        self.store.subscribe(self.on_pages_changed)
+        
         # Show home
         self.show_home()
         
@@ -187,6 +1248,8 @@ class ConsistencyApp(QMainWindow):
         def ensure_defaults(data):
             if "notes" not in data:
                 data["notes"] = []
+            for note in data["notes"]:
+                note.setdefault("id", uuid.uuid4().hex)
             if "calendar" not in data:
                 data["calendar"] = {}
             else:
@@ -198,14 +1261,17 @@ class ConsistencyApp(QMainWindow):
                         for item in items:
                             if isinstance(item, dict):
                                 new_items.append({
+                                    "id": item.get("id") or uuid.uuid4().hex,
                                     "title": item.get("title", ""),
                                     "time": item.get("time", "00:00")
                                 })
                             else:
-                                new_items.append({"title": str(item), "time": "00:00"})
+                                new_items.append({"id": uuid.uuid4().hex, "title": str(item), "time": "00:00"})
                         normalized[date_key] = new_items
                 if normalized:
                     data["calendar"] = normalized
+            if "day_start" not in data:
+                data["day_start"] = "00:00"
             if "reminders" not in data:
                 data["reminders"] = {
                     "enabled": True,
@@ -215,6 +1281,9 @@ class ConsistencyApp(QMainWindow):
                         "evening": "20:00"
                     }
                 }
+            for activity in data.get("activities", {}).values():
+                # Session totals persisted by earlier versions; they are recomputed on load
+                activity.pop("stats", None)
             return data
 
         # Prefer local data, fall back to iCloud if local missing
@@ -231,6 +1300,7 @@ class ConsistencyApp(QMainWindow):
             "badges": [],
             "notes": [],
             "calendar": {},
+            "day_start": "00:00",
             "reminders": {
                 "enabled": True,
                 "times": {
@@ -242,40 +1312,280 @@ class ConsistencyApp(QMainWindow):
         }
     
     def save_data(self):
+        """Persist now, or once when the open batch commits."""
+        self.batch.save()
+    
+    def snapshot_data(self):
+        """Copy of the data for a bulk batch to roll back to.
+        
+        Session lists are shared rather than copied: they are only ever
+        replaced (sync_sessions), never edited, and hold most of the data.
+        """
+        self.sync_sessions()
+        shared = {
+            id(info["sessions"]): info["sessions"]
+            for info in self.data.get("activities", {}).values() if "sessions" in info
+        }
+        return copy.deepcopy(self.data, shared)
+    
+    def restore_data(self, snapshot):
+        """Roll back to a snapshot after a failed batch, dropping every derived index.
+        
+        Batches without a snapshot (single check-ins) can't undo what they
+        changed; the data is kept as it stands and the indexes are rebuilt
+        from it, so they never disagree.
+        """
+        if snapshot is None:
+            self.sync_sessions()
+        else:
+            self.data = snapshot
+        self.runs = {}
+        self.rank_runs = {}
+        self.session_indexes = {}
+        self.checkin_totals = {}
+        self.search_index = None
+        self.calendar_index = None
+        self.calendar_marks = {}
+        self.statuses = {}
+        self.store.reset()
+        self.day_index = DayIndex.build(self.data.get("activities", {}))
+        for page in self.page_cache.values():
+            page.stale = True
+        self.show_home()
+    
+    def rekey_sessions(self):
+        """Drop session indexes and session search docs after the day boundary moved.
+        
+        Session keys count minutes from the logical day's midnight, which
+        the boundary decides, so they are rebuilt on next use.
+        """
+        self.sync_sessions()
+        self.session_indexes = {}
+        self.search_index = None
+        for name in self.data.get("activities", {}):
+            self.store.emit(CHECKINS, name)
+    
+    def sync_sessions(self):
+        """Write back session lists that were added to, edited or trimmed."""
+        for name, index in self.session_indexes.items():
+            if name not in self.data.get("activities", {}):
+                continue
+            if index.dirty:
+                self.data["activities"][name]["sessions"] = index.sessions()
+                index.dirty = False
+    
+    def write_data(self):
+        self.sync_sessions()
         with open(DATA_FILE, 'w') as f:
-            json.dump(self.data, f, indent=2)
+            json.dump(self.data, f, indent=2, default=json_default)
         # iCloud backup (best-effort)
         try:
             ICLOUD_DIR.mkdir(parents=True, exist_ok=True)
             with open(ICLOUD_FILE, 'w') as f:
-                json.dump(self.data, f, indent=2)
+                json.dump(self.data, f, indent=2, default=json_default)
         except Exception:
             pass
     
     def get_today(self):
-        return datetime.now().strftime("%Y-%m-%d")
-    
-    def get_streak(self, dates):
-        if not dates:
-            return 0
-        dates = sorted(set(dates), reverse=True)
-        today = datetime.now().date()
-        yesterday = today - timedelta(days=1)
-        last_date = datetime.strptime(dates[0], "%Y-%m-%d").date()
-        if last_date != today and last_date != yesterday:
-            return 0
-        streak = 0
-        expected = last_date
-        for date_str in dates:
-            date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            if date == expected:
-                streak += 1
-                expected = date - timedelta(days=1)
-            elif date < expected:
-                break
-        return streak
+        today = day_key(day_start=self.data.get("day_start", "00:00"))
+        if today != self.today:
+            # Statuses computed for yesterday go stale; views hear of it from check_reminders
+            self.today = today
+            self.store.invalidate(TODAY)
+        self.store.read(TODAY)
+        return today
+    
+    
+    def day_start_minute(self):
+        """The day boundary in minutes after midnight; session starts are measured from the midnight before it."""
+        return streak_core.day_start_minutes(self.data.get("day_start", "00:00"))
+    def get_runs(self, name):
+        """Run-interval index for an activity, built on first use."""
+        self.store.read(CHECKINS, name)
+        if name not in self.runs:
+            info = self.data["activities"].get(name, {})
+            self.runs[name] = RunIndex(info.get("dates", []), info.get("frozen", []))
+        return self.runs[name]
+    
+    def get_streak(self, dates, frozen=()):
+        today = datetime.strptime(self.get_today(), "%Y-%m-%d").date()
+        return streak_core.get_streak(dates, frozen, today=today)
+    
+    def get_sessions(self, name):
+        """Session index for an activity, built on first use."""
+        self.store.read(CHECKINS, name)
+        if name not in self.session_indexes:
+            info = self.data["activities"].get(name, {})
+            index = SessionIndex(info.get("sessions", []), self.day_start_minute())
+            if "sessions" in info:
+                # Hold the columnar rows instead of the parsed dicts
+                info["sessions"] = index.sessions()
+            self.session_indexes[name] = index
+        return self.session_indexes[name]
+    
+    def get_checkin_totals(self, name):
+        """Check-ins per day ordinal as a DayTotals tree, built on first use."""
+        if name not in self.checkin_totals:
+            info = self.data["activities"].get(name, {})
+            self.checkin_totals[name] = DayTotals((to_ordinal(day), 1) for day in set(info.get("dates", [])))
+        return self.checkin_totals[name]
+    
+    def get_window_totals(self, name):
+        """[(days, minutes, check-ins)] for each rolling window ending today."""
+        today = to_ordinal(self.get_today())
+        minutes = self.get_sessions(name).minute_totals
+        checkins = self.get_checkin_totals(name)
+        return [
+            (days, minutes.window(today - days + 1, today), checkins.window(today - days + 1, today))
+            for days in ROLLING_WINDOWS
+        ]
+    
+    def get_search_index(self):
+        """Search index over notes, session notes and calendar items, built on first search."""
+        if self.search_index is None:
+            self.search_index = SearchIndex()
+            for note in self.data.get("notes", []):
+                self.index_note(note)
+            for name in self.data.get("activities", {}):
+                session_index = self.get_sessions(name)
+                for session in session_index.newest():
+                    self.index_session(name, session_index.key_of(session), session)
+            for date_key in self.data.get("calendar", {}):
+                self.index_calendar_day(date_key, fresh=True)
+        return self.search_index
+    
+    def get_calendar_index(self):
+        if self.calendar_index is None:
+            self.calendar_index = CalendarIndex(self.data.setdefault("calendar", {}))
+        return self.calendar_index
+    
+    def get_calendar_marks(self, year, month):
+        """{day: (check-in colours, planned count)} for a month, cached until they change."""
+        if (year, month) not in self.calendar_marks:
+            self.calendar_marks[year, month] = self.store.derived(lambda: self.compute_calendar_marks(year, month))
+        return self.calendar_marks[year, month].get()
+    
+    def compute_calendar_marks(self, year, month):
+        self.store.read(ACTIVITY)
+        self.store.read(CHECKINS)
+        activities = self.data.get("activities", {})
+        calendar = self.data.get("calendar", {})
+        marks = {}
+        for day in range(1, QDate(year, month, 1).daysInMonth() + 1):
+            date_key = f"{year:04d}-{month:02d}-{day:02d}"
+            self.store.read(CALENDAR, date_key)
+            colors = [
+                activities.get(name, {}).get("color", "#e94560")
+                for name in self.day_index.names_on(to_ordinal(date_key))
+            ]
+            planned = len(calendar.get(date_key, ()))
+            if colors or planned:
+                marks[day] = (colors, planned)
+        return marks
+    
+    def index_note(self, note):
+        if self.search_index is not None:
+            text = note.get("text")
+            if text is None:
+                text = html_to_text(note.get("content", ""))
+            self.search_index.set(("note", note["id"]), text, note.get("title", ""))
+    
+    def index_session(self, name, key, session):
+        if self.search_index is not None:
+            self.search_index.set(("session", name, key), session.get("note", ""))
+    
+    def unindex(self, doc_id):
+        if self.search_index is not None:
+            self.search_index.discard(doc_id)
+    
+    def index_calendar_day(self, date_key, fresh=False):
+        """Re-index one day's planned items, as ("calendar", date key, item id)."""
+        if self.search_index is not None:
+            if not fresh:
+                self.search_index.discard_where("calendar", date_key)
+            for item in self.data.get("calendar", {}).get(date_key, []):
+                self.search_index.set(("calendar", date_key, item["id"]), item.get("title", ""))
+    
+    def get_streak_runs(self, name):
+        """(schedule, runs) for streak math; runs are in rank space for scheduled activities."""
+        self.store.read(GOAL, name)
+        info = self.data["activities"].get(name, {})
+        mask = info.get("schedule", EVERY_DAY)
+        if mask == EVERY_DAY and not info.get("excluded"):
+            return None, self.get_runs(name)
+        if name not in self.rank_runs:
+            schedule = Schedule(mask, info.get("excluded", []))
+            self.rank_runs[name] = (schedule, schedule.rank_runs(info.get("dates", []), info.get("frozen", [])))
+        return self.rank_runs[name]
+    
+    def get_status(self, name):
+        """(status, streak, done, target), cached until the activity's check-ins, goal or today change."""
+        if name not in self.statuses:
+            self.statuses[name] = self.store.derived(lambda: self.compute_status(name))
+        return self.statuses[name].get()
+    
+    def compute_status(self, name):
+        """Status using the activity's window and schedule semantics."""
+        info = self.data["activities"].get(name, {})
+        today = datetime.strptime(self.get_today(), "%Y-%m-%d").date()
+        schedule, runs = self.get_streak_runs(name)
+        return streak_core.habit_status(
+            info.get("dates", []), info.get("frequency"), info.get("frozen", []),
+            today=today, schedule=schedule, runs=runs
+        )
+    
+    def compute_best_streak(self):
+        self.store.read(ACTIVITY)
+        activities = self.data.get("activities", {})
+        return best_streak_text((self.get_status(name)[1], habit_period(info)) for name, info in activities.items())
+    
+    def forget_status(self, name):
+        status = self.statuses.pop(name, None)
+        if status is not None:
+            status.invalidate()
+    
+    # ==================== CHANGE EVENTS ====================
+    def on_activities_changed(self, changes):
+        """Patch the dashboard (if built, even while hidden) and the sidebar streak after activity changes."""
+        home = self.page_cache.get("Home")
+        if home is not None and not home.stale:
+            self.refresh_home(changes)
+        else:
+            self.update_streak_display()
+    
+    def on_notes_changed(self, changes):
+        """Update just the rows of saved or deleted notes in the notes list."""
+        if "Notes" not in self.page_cache:
+            return
+        self.notes_model.sync(self.data.get("notes", []), {change.key for change in changes})
+    
+    def on_pages_changed(self, changes):
+        """Mark hidden pages showing data that changed for a rebuild on their next visit."""
+        topics = {change.topic for change in changes}
+        for name, page in self.page_cache.items():
+            if name != self.current_page and topics & PAGE_TOPICS.get(name, set()):
+                page.stale = True
+    
+    def on_text_changed(self, changes):
+        """Keep the search index in step with saved notes and planned items."""
+        if self.search_index is None:
+            return
+        note_ids = {change.key for change in changes if change.topic == NOTE}
+        if note_ids:
+            for note in self.data.get("notes", []):
+                if note.get("id") in note_ids:
+                    self.index_note(note)
+                    note_ids.discard(note["id"])
+            for note_id in note_ids:
+                self.unindex(("note", note_id))
+        for change in changes:
+            if change.topic == CALENDAR:
+                self.index_calendar_day(change.key)
     
     def send_notification(self, title, message):
+        self.batch.notify(title, message)
+    
+    def post_notification(self, title, message):
         script = f'display notification "{message}" with title "{title}" sound name "default"'
         subprocess.run(["osascript", "-e", script], capture_output=True)
     
@@ -300,7 +1610,7 @@ class ConsistencyApp(QMainWindow):
         
         subtitle = QLabel("Tracker")
         subtitle.setFont(QFont("SF Pro Display", 12))
-        subtitle.setStyleSheet("color: #8888aa;")
+        subtitle.setObjectName("muted")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         sidebar_layout.addWidget(subtitle)
         
@@ -319,14 +1629,15 @@ class ConsistencyApp(QMainWindow):
         ]
         
         for text, callback in nav_items:
+            page = text.split("  ")[1]
             btn = QPushButton(text)
             btn.setObjectName("nav")
             btn.setCheckable(True)
             btn.setFont(QFont("SF Pro Display", 13))
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(callback)
+            btn.clicked.connect(lambda _, page=page, build=callback: self.open_page(page, build))
             sidebar_layout.addWidget(btn)
-            self.nav_buttons[text.split("  ")[1]] = btn
+            self.nav_buttons[page] = btn
         
         sidebar_layout.addStretch()
         
@@ -349,7 +1660,7 @@ class ConsistencyApp(QMainWindow):
         
         streak_subtitle = QLabel("Best Streak")
         streak_subtitle.setFont(QFont("SF Pro Display", 11))
-        streak_subtitle.setStyleSheet("color: #8888aa;")
+        streak_subtitle.setObjectName("muted")
         streak_subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         streak_layout.addWidget(streak_subtitle)
         
@@ -359,7 +1670,7 @@ class ConsistencyApp(QMainWindow):
     
     def create_main_area(self, parent_layout):
         main = QFrame()
-        main.setStyleSheet("background-color: #0f0f1a;")
+        main.setObjectName("mainArea")
         main_layout = QVBoxLayout(main)
         main_layout.setContentsMargins(30, 25, 30, 25)
         main_layout.setSpacing(0)
@@ -369,55 +1680,123 @@ class ConsistencyApp(QMainWindow):
         header_layout = QVBoxLayout(header)
         header_layout.setContentsMargins(0, 0, 0, 20)
         
+        title_row = QHBoxLayout()
         self.header_title = QLabel("Dashboard")
         self.header_title.setFont(QFont("SF Pro Display", 26, QFont.Weight.Bold))
-        header_layout.addWidget(self.header_title)
+        title_row.addWidget(self.header_title)
+        title_row.addStretch()
+        
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔎 Search notes, sessions, plans…")
+        self.search_input.setFixedSize(280, 38)
+        self.search_input.setStyleSheet("""
+            QLineEdit {
+                background-color: #1e1e3f;
+                border: 2px solid #2a2a5a;
+                border-radius: 10px;
+                color: white;
+                padding: 4px 12px;
+                font-size: 13px;
+            }
+            QLineEdit:focus { border-color: #e94560; }
+        """)
+        self.search_input.returnPressed.connect(lambda: self.show_search(self.search_input.text()))
+        title_row.addWidget(self.search_input)
+        header_layout.addLayout(title_row)
         
-        date_label = QLabel(datetime.now().strftime("%A, %B %d, %Y"))
+        date_label = QLabel(datetime.strptime(self.get_today(), "%Y-%m-%d").strftime("%A, %B %d, %Y"))
         date_label.setFont(QFont("SF Pro Display", 13))
-        date_label.setStyleSheet("color: #8888aa;")
+        date_label.setObjectName("muted")
         header_layout.addWidget(date_label)
         
         main_layout.addWidget(header)
         
-        # Scrollable content
+        # One scrollable page per sidebar entry, built on first visit and kept
+        self.pages = QStackedWidget()
+        main_layout.addWidget(self.pages)
+        
+        parent_layout.addWidget(main)
+    
+    # ==================== PAGES ====================
+    def new_page(self, name, title):
+        """Replace page name with an empty one and show it; the caller fills self.content_layout."""
+        self.discard_page(name)
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
-        self.content = QWidget()
-        self.content_layout = QVBoxLayout(self.content)
-        self.content_layout.setContentsMargins(0, 0, 10, 0)
-        self.content_layout.setSpacing(12)
-        self.content_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        scroll.setWidget(self.content)
-        main_layout.addWidget(scroll)
-        
-        parent_layout.addWidget(main)
+        content = QWidget()
+        content.setObjectName("content")
+        layout = QVBoxLayout(content)
+        layout.setContentsMargins(0, 0, 10, 0)
+        layout.setSpacing(12)
+        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        scroll.setWidget(content)
+        
+        scroll.title = title
+        scroll.content_layout = layout
+        scroll.stale = False
+        scroll.widget_count = 0
+        self.pages.addWidget(scroll)
+        self.page_cache[name] = scroll
+        self.raise_page(name)
     
-    def clear_content(self):
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    def open_page(self, name, build):
+        """Show the page kept for name, calling build() if it was never built, dropped or went stale."""
+        page = self.page_cache.get(name)
+        if page is None or page.stale:
+            build()
+        else:
+            self.raise_page(name)
+    
+    def raise_page(self, name):
+        previous = self.current_page
+        page = self.page_cache[name]
+        self.page_cache.move_to_end(name)
+        self.pages.setCurrentWidget(page)
+        self.content_layout = page.content_layout
+        self.set_active_nav(name)
+        self.header_title.setText(page.title)
+        if previous == name or previous not in self.page_cache:
+            return
+        if previous not in self.nav_buttons:
+            # Search results are not kept
+            self.discard_page(previous)
+            return
+        hidden = self.page_cache[previous]
+        hidden.widget_count = len(hidden.findChildren(QWidget))
+        hidden_pages = list(self.page_cache)[:-1]
+        total = sum(self.page_cache[other].widget_count for other in hidden_pages)
+        for other in hidden_pages:
+            if total <= PAGE_WIDGET_BUDGET:
+                break
+            total -= self.page_cache[other].widget_count
+            self.discard_page(other)
+    
+    def discard_page(self, name):
+        page = self.page_cache.pop(name, None)
+        if page is None:
+            return
+        if name == "Home":
+            self.cards = {}
+            self.activity_model = None
+        elif name == "Statistics" and self.stats_view is not None:
+            self.stats_view["worker"].cancelled = True
+            self.stats_view = None
+        self.pages.removeWidget(page)
+        page.deleteLater()
     
     def update_streak_display(self):
-        max_streak = 0
-        for info in self.data.get("activities", {}).values():
-            streak = self.get_streak(info.get("dates", []))
-            max_streak = max(max_streak, streak)
-        self.streak_label.setText(f"🔥 {max_streak}")
+        self.streak_label.setText(f"🔥 {self.best_streak.get()}")
     
     def set_active_nav(self, name):
+        self.current_page = name
         for btn_name, btn in self.nav_buttons.items():
             btn.setChecked(btn_name == name)
     
     # ==================== HOME ====================
     def show_home(self):
-        self.clear_content()
-        self.set_active_nav("Home")
-        self.header_title.setText("Dashboard")
+        self.new_page("Home", "Dashboard")
         self.update_streak_display()
         
         activities = self.data.get("activities", {})
@@ -426,8 +1805,128 @@ class ConsistencyApp(QMainWindow):
             self.show_empty_state()
             return
         
-        for name, info in activities.items():
-            self.create_activity_card(name, info)
+        self.create_bulk_toolbar()
+        if len(activities) >= LIST_DASHBOARD_AT:
+            self.show_activity_list(activities)
+            return
+        for name, info in activities.items():
+            self.cards[name] = self.create_activity_card(name, info)
+            self.content_layout.addWidget(self.cards[name])
+    
+    def show_activity_list(self, activities):
+        """Dashboard as one list view whose delegate paints the cards, for very many activities."""
+        self.activity_model = ActivityListModel(activities, self.get_card_summary, self)
+        delegate = ActivityDelegate(self.selected_activities, self)
+        delegate.selecting = self.selecting
+        delegate.triggered.connect(self.activity_row_triggered)
+        
+        view = QListView()
+        view.setModel(self.activity_model)
+        view.setItemDelegate(delegate)
+        view.setUniformItemSizes(True)
+        view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        view.setMouseTracking(True)
+        view.setMinimumHeight(max(480, self.pages.height() - 50))
+        view.setStyleSheet("""
+            QListView {
+                background-color: transparent;
+                border: none;
+                outline: none;
+            }
+        """)
+        self.content_layout.addWidget(view)
+    
+    def activity_row_triggered(self, name, action):
+        if action == "history":
+            self.show_activity_history(name)
+        elif action == "checkin":
+            self.show_checkin_dialog(name)
+        elif action == "delete":
+            self.delete_activity(name)
+        elif action == "select":
+            self.toggle_selected(name, name not in self.selected_activities)
+            self.activity_model.refresh([name])
+    
+    def refresh_home(self, changes):
+        """Patch the dashboard for changes: only touched cards update, cards come and go with activities."""
+        activities = self.data.get("activities", {})
+        self.update_streak_display()
+        if not activities or not (self.cards or self.activity_model):
+            # To or from the empty state: rebuild now if showing, else on the next visit
+            if self.current_page == "Home":
+                self.show_home()
+            else:
+                self.page_cache["Home"].stale = True
+            return
+        if self.selecting:
+            self.bulk_count_label.setText(f"{len(self.selected_activities)} selected")
+        if any(change.key is None for change in changes):
+            names = set(activities) | set(self.cards)
+        else:
+            names = {change.key for change in changes}
+        if self.activity_model is not None:
+            self.refresh_activity_list(activities, names)
+            return
+        # The dashboard's own layout: it may be patched while another page shows
+        layout = self.page_cache["Home"].content_layout
+        for name in names - set(activities):
+            card = self.cards.pop(name, None)
+            if card is not None:
+                layout.removeWidget(card)
+                card.deleteLater()
+        for position, name in enumerate(activities):
+            if name not in names:
+                continue
+            card = self.cards.get(name)
+            if card is None:
+                # After the toolbar, in the activities' order
+                self.cards[name] = self.create_activity_card(name, activities[name])
+                layout.insertWidget(position + 1, self.cards[name])
+            else:
+                self.update_activity_card(card, name)
+    
+    def refresh_activity_list(self, activities, names):
+        model = self.activity_model
+        for name in names - set(activities):
+            model.remove(name)
+        for position, name in enumerate(activities):
+            if name in names and name not in model:
+                model.insert(position, name)
+        model.refresh(names)
+    
+    def create_bulk_toolbar(self):
+        toolbar = QWidget()
+        toolbar_layout = QHBoxLayout(toolbar)
+        toolbar_layout.setContentsMargins(0, 0, 0, 0)
+        toolbar_layout.setSpacing(8)
+        
+        select_btn = QPushButton("✖ Done" if self.selecting else "☑ Select")
+        select_btn.setFixedHeight(32)
+        select_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        select_btn.setObjectName("toolbar")
+        select_btn.clicked.connect(self.toggle_selecting)
+        toolbar_layout.addWidget(select_btn)
+        
+        if self.selecting:
+            self.bulk_count_label = QLabel(f"{len(self.selected_activities)} selected")
+            self.bulk_count_label.setObjectName("muted")
+            toolbar_layout.addWidget(self.bulk_count_label)
+            
+            for text, callback in (
+                ("✅ Check In", self.bulk_check_in),
+                ("🎨 Color", self.bulk_recolor),
+                ("🗑 Delete", self.bulk_delete),
+            ):
+                action_btn = QPushButton(text)
+                action_btn.setFixedHeight(32)
+                action_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+                action_btn.setObjectName("toolbar")
+                action_btn.clicked.connect(callback)
+                toolbar_layout.addWidget(action_btn)
+        
+        toolbar_layout.addStretch()
+        self.content_layout.addWidget(toolbar)
     
     def show_empty_state(self):
         card = QFrame()
@@ -455,7 +1954,7 @@ class ConsistencyApp(QMainWindow):
         
         subtitle = QLabel("Add your first activity to start building streaks")
         subtitle.setFont(QFont("SF Pro Display", 13))
-        subtitle.setStyleSheet("color: #8888aa;")
+        subtitle.setObjectName("muted")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle)
         
@@ -470,36 +1969,20 @@ class ConsistencyApp(QMainWindow):
         self.content_layout.addWidget(card)
     
     def create_activity_card(self, name, info):
-        dates = info.get("dates", [])
-        streak = self.get_streak(dates)
-        longest = info.get("longest", 0)
-        total = len(dates)
-        checked_today = self.get_today() in dates
-        color = info.get("color", "#e94560")
-        sessions = info.get("sessions", [])
-        
-        # Calculate total time
-        total_minutes = sum(s.get("minutes", 0) for s in sessions)
-        total_hours = total_minutes // 60
-        remaining_mins = total_minutes % 60
-        time_str = f"{total_hours}h {remaining_mins}m" if total_hours > 0 else f"{remaining_mins}m"
-        
-        # Get today's session info
-        today_session = next((s for s in sessions if s.get("date") == self.get_today()), None)
-        
+        """Build an activity card's widgets; update_activity_card fills in the figures."""
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: #1e1e3f;
-                border-radius: 15px;
-                border-left: 5px solid {color};
-            }}
-        """)
+        card.setObjectName("activityCard")
         card.setFixedHeight(120)
         
         layout = QHBoxLayout(card)
         layout.setContentsMargins(20, 12, 15, 12)
         
+        if self.selecting:
+            select_box = QCheckBox()
+            select_box.setChecked(name in self.selected_activities)
+            select_box.toggled.connect(lambda checked: self.toggle_selected(name, checked))
+            layout.addWidget(select_box)
+        
         # Info section
         info_widget = QWidget()
         info_layout = QVBoxLayout(info_widget)
@@ -515,18 +1998,10 @@ class ConsistencyApp(QMainWindow):
         title.setFont(QFont("SF Pro Display", 16, QFont.Weight.Bold))
         title_layout.addWidget(title)
         
-        # Status
-        if checked_today:
-            status = QLabel("✓ Done")
-            status.setStyleSheet("color: #00bf63; font-weight: bold;")
-        elif streak > 0:
-            status = QLabel("⚠ At Risk")
-            status.setStyleSheet("color: #ff9f1c; font-weight: bold;")
-        else:
-            status = QLabel("○ Start")
-            status.setStyleSheet("color: #8888aa;")
-        status.setFont(QFont("SF Pro Display", 12))
-        title_layout.addWidget(status)
+        card.status_label = QLabel()
+        card.status_label.setObjectName("cardStatus")
+        card.status_label.setFont(QFont("SF Pro Display", 12))
+        title_layout.addWidget(card.status_label)
         title_layout.addStretch()
         
         info_layout.addWidget(title_widget)
@@ -537,49 +2012,42 @@ class ConsistencyApp(QMainWindow):
         stats_layout.setContentsMargins(0, 0, 0, 0)
         stats_layout.setSpacing(15)
         
-        fire = "🔥" * min(streak // 7 + (1 if streak > 0 else 0), 5)
-        streak_label = QLabel(f"🔥 {streak} days {fire}")
-        streak_label.setFont(QFont("SF Pro Display", 12, QFont.Weight.Bold))
-        streak_label.setStyleSheet(f"color: {'#ff6b35' if streak > 0 else '#8888aa'};")
-        stats_layout.addWidget(streak_label)
-        
-        best_label = QLabel(f"🏆 {longest}")
-        best_label.setFont(QFont("SF Pro Display", 11))
-        best_label.setStyleSheet("color: #8888aa;")
-        best_label.setToolTip("Best streak")
-        stats_layout.addWidget(best_label)
-        
-        time_label = QLabel(f"⏱ {time_str}")
-        time_label.setFont(QFont("SF Pro Display", 11))
-        time_label.setStyleSheet("color: #4cc9f0;")
-        time_label.setToolTip("Total time")
-        stats_layout.addWidget(time_label)
-        
-        total_label = QLabel(f"📅 {total}")
-        total_label.setFont(QFont("SF Pro Display", 11))
-        total_label.setStyleSheet("color: #8888aa;")
-        total_label.setToolTip("Total days")
-        stats_layout.addWidget(total_label)
+        card.streak_label = QLabel()
+        card.streak_label.setObjectName("cardStreak")
+        card.streak_label.setFont(QFont("SF Pro Display", 12, QFont.Weight.Bold))
+        stats_layout.addWidget(card.streak_label)
+        
+        card.best_label = QLabel()
+        card.best_label.setFont(QFont("SF Pro Display", 11))
+        card.best_label.setObjectName("muted")
+        card.best_label.setToolTip("Best streak")
+        stats_layout.addWidget(card.best_label)
+        
+        card.time_label = QLabel()
+        card.time_label.setFont(QFont("SF Pro Display", 11))
+        card.time_label.setObjectName("accentText")
+        card.time_label.setToolTip("Total time")
+        stats_layout.addWidget(card.time_label)
+        
+        card.total_label = QLabel()
+        card.total_label.setFont(QFont("SF Pro Display", 11))
+        card.total_label.setObjectName("muted")
+        card.total_label.setToolTip("Total days")
+        stats_layout.addWidget(card.total_label)
+        
+        card.rolling_label = QLabel()
+        card.rolling_label.setFont(QFont("SF Pro Display", 11))
+        card.rolling_label.setObjectName("muted")
+        stats_layout.addWidget(card.rolling_label)
         
         stats_layout.addStretch()
         info_layout.addWidget(stats_widget)
         
-        # Today's session note (if exists)
-        if today_session and today_session.get("note"):
-            note_preview = today_session.get("note", "")[:50]
-            if len(today_session.get("note", "")) > 50:
-                note_preview += "..."
-            note_label = QLabel(f"📝 {note_preview}")
-            note_label.setFont(QFont("SF Pro Display", 10))
-            note_label.setStyleSheet("color: #9b5de5;")
-            info_layout.addWidget(note_label)
-        elif today_session:
-            mins = today_session.get("minutes", 0)
-            today_time = f"{mins // 60}h {mins % 60}m" if mins >= 60 else f"{mins}m"
-            time_today = QLabel(f"✅ Today: {today_time}")
-            time_today.setFont(QFont("SF Pro Display", 10))
-            time_today.setStyleSheet("color: #00bf63;")
-            info_layout.addWidget(time_today)
+        # Today's session note, or today's time when there is no note
+        card.today_label = QLabel()
+        card.today_label.setObjectName("cardToday")
+        card.today_label.setFont(QFont("SF Pro Display", 10))
+        info_layout.addWidget(card.today_label)
         
         layout.addWidget(info_widget, stretch=1)
         
@@ -588,74 +2056,154 @@ class ConsistencyApp(QMainWindow):
         history_btn.setFixedSize(40, 40)
         history_btn.setToolTip("View History")
         history_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        history_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a2a5a;
-                border: none;
-                border-radius: 10px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #3a3a6a;
-            }
-        """)
+        history_btn.setObjectName("iconButton")
         history_btn.clicked.connect(lambda: self.show_activity_history(name))
         layout.addWidget(history_btn)
         
         # Check-in button
-        if checked_today:
-            btn = QPushButton("✓")
-            btn.setObjectName("done")
-            btn.setToolTip("Already checked in!")
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(lambda: self.show_checkin_dialog(name, edit_mode=True))
-        else:
-            btn = QPushButton("+")
-            btn.setObjectName("checkin")
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(lambda: self.show_checkin_dialog(name))
-        
-        btn.setFixedSize(50, 50)
-        btn.setFont(QFont("SF Pro Display", 20, QFont.Weight.Bold))
-        layout.addWidget(btn)
+        card.checkin_btn = QPushButton()
+        card.checkin_btn.setObjectName("checkin")
+        card.checkin_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        card.checkin_btn.clicked.connect(lambda: self.show_checkin_dialog(name))
+        card.checkin_btn.setFixedSize(50, 50)
+        card.checkin_btn.setFont(QFont("SF Pro Display", 20, QFont.Weight.Bold))
+        layout.addWidget(card.checkin_btn)
         
         # Delete button
         del_btn = QPushButton("×")
         del_btn.setFixedSize(30, 30)
-        del_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                color: #666688;
-                font-size: 18px;
-            }
-            QPushButton:hover {
-                color: #e94560;
-            }
-        """)
+        del_btn.setObjectName("deleteButton")
         del_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         del_btn.clicked.connect(lambda: self.delete_activity(name))
         layout.addWidget(del_btn)
         
-        self.content_layout.addWidget(card)
+        # Last values applied, so a refresh only touches what changed
+        card.shown = {}
+        self.update_activity_card(card, name)
+        return card
+    
+    def get_card_summary(self, name):
+        """Display values for an activity's card, shared by widget cards and painted rows."""
+        info = self.data["activities"][name]
+        dates = info.get("dates", [])
+        status_key, streak, done, target = self.get_status(name)
+        per = habit_period(info)
+        session_index = self.get_sessions(name)
+        
+        # Calculate total time
+        total_minutes = session_index.stats.total_minutes
+        total_hours = total_minutes // 60
+        remaining_mins = total_minutes % 60
+        time_str = f"{total_hours}h {remaining_mins}m" if total_hours > 0 else f"{remaining_mins}m"
+        
+        # Get today's sessions
+        today_sessions = session_index.day_sessions(self.get_today())
+        today_note = next((s["note"] for s in reversed(today_sessions) if s.get("note")), "")
+        
+        # Status text; its colour comes from STATUS_STYLES
+        progress = f" {done}/{target} this {per}" if per != "day" else ""
+        if status_key == "done":
+            status_text = f"✓ Done{progress}"
+        elif status_key == "frozen":
+            status_text = "❄ Frozen"
+        elif status_key == "on_track":
+            status_text = f"◔{progress}"
+        elif status_key == "rest":
+            status_text = "☾ Rest day"
+        elif status_key == "at_risk":
+            status_text = f"⚠ At Risk{progress}"
+        else:
+            status_key, status_text = "start", "○ Start"
+        
+        fire = "🔥" * min(streak // 7 + (1 if streak > 0 else 0), 5)
+        window_totals = self.get_window_totals(name)
+        
+        # Today's session note (if exists)
+        if today_note:
+            note_preview = today_note[:50]
+            if len(today_note) > 50:
+                note_preview += "..."
+            today = (f"📝 {note_preview}", "note")
+        elif today_sessions:
+            mins = session_index.day_minutes(self.get_today())
+            today_time = f"{mins // 60}h {mins % 60}m" if mins >= 60 else f"{mins}m"
+            if len(today_sessions) > 1:
+                today_time += f" ({len(today_sessions)} sessions)"
+            today = (f"✅ Today: {today_time}", "time")
+        else:
+            today = ("", "")
+        
+        return {
+            "color": info.get("color", "#e94560"),
+            "status": (status_key, status_text),
+            "streak": (f"🔥 {streak} {streak_core.PERIOD_UNITS[per]} {fire}", streak > 0),
+            "longest": f"🏆 {info.get('longest', 0)} {streak_core.PERIOD_UNITS[per]}",
+            "time": f"⏱ {time_str}",
+            "total": f"📅 {len(dates)}",
+            "rolling": (
+                f"📈 {format_duration(window_totals[0][1])}/7d",
+                "\n".join(
+                    f"Last {days} days: {format_duration(mins)} over {checkins} days, avg {format_duration(mins // days)}/day"
+                    for days, mins, checkins in window_totals
+                ),
+            ),
+            "today": today,
+            "checked": self.day_index.has(to_ordinal(self.get_today()), name),
+        }
+    
+    def update_activity_card(self, card, name):
+        """Patch a card's labels, styles and check-in button to the activity's current figures."""
+        summary = self.get_card_summary(name)
+        shown = card.shown
+        
+        def changed(key):
+            if shown.get(key) == summary[key]:
+                return False
+            shown[key] = summary[key]
+            return True
+        
+        if changed("color"):
+            color = summary["color"]
+            set_state(card, accent=color)
+            # Preset colours have a STYLE rule; only a custom colour needs its own sheet
+            if color not in PRESET_COLORS:
+                card.setStyleSheet(f"QFrame#activityCard {{ border-left: 5px solid {color}; }}")
+            elif card.styleSheet():
+                card.setStyleSheet("")
+        if changed("status"):
+            status_key, text = summary["status"]
+            card.status_label.setText(text)
+            set_state(card.status_label, status=status_key)
+        if changed("streak"):
+            text, active = summary["streak"]
+            card.streak_label.setText(text)
+            set_state(card.streak_label, active=active)
+        if changed("longest"):
+            card.best_label.setText(summary["longest"])
+        if changed("time"):
+            card.time_label.setText(summary["time"])
+        if changed("total"):
+            card.total_label.setText(summary["total"])
+        if changed("rolling"):
+            card.rolling_label.setText(summary["rolling"][0])
+            card.rolling_label.setToolTip(summary["rolling"][1])
+        if changed("today"):
+            text, kind = summary["today"]
+            card.today_label.setText(text)
+            set_state(card.today_label, kind=kind)
+            card.today_label.setVisible(bool(text))
+        if changed("checked"):
+            checked_today = summary["checked"]
+            btn = card.checkin_btn
+            btn.setText("✓" if checked_today else "+")
+            btn.setToolTip("Checked in! Click to log another session" if checked_today else "")
+            set_state(btn, done=checked_today)
     
-    def show_checkin_dialog(self, name, edit_mode=False):
-        """Show check-in dialog with time tracking and notes"""
+    def show_checkin_dialog(self, name, session_key=None, day=None):
+        """Show check-in dialog with time tracking and notes; session_key edits a logged session"""
         dialog = QDialog(self)
         dialog.setWindowTitle(f"Check In: {name}")
         dialog.setFixedSize(790, 720)
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #1a1a2e;
-            }
-            QLabel {
-                color: white;
-                background-color: transparent;
-            }
-            QWidget {
-                color: white;
-            }
-        """)
         
         layout = QVBoxLayout(dialog)
         layout.setContentsMargins(25, 20, 25, 20)
@@ -669,12 +2217,57 @@ class ConsistencyApp(QMainWindow):
         
         today = self.get_today()
         activity = self.data["activities"].get(name, {})
-        sessions = activity.get("sessions", [])
-        existing_session = next((s for s in sessions if s.get("date") == today), None)
+        session_index = self.get_sessions(name)
+        existing_session = session_index.get(session_key) if session_key else None
+        day = existing_session["date"] if existing_session else (day or today)
+        day_start = self.day_start_minute()
+        if existing_session:
+            default_start = session_key[1]
+        elif day == today:
+            now = datetime.now()
+            default_start = max(day_minute(now.hour * 60 + now.minute, day_start) - 30, day_start)
+        else:
+            default_start = day_minute(12 * 60, day_start)
+        
+        # Day picker (backfill or edit a past day)
+        day_widget = QWidget()
+        day_layout = QHBoxLayout(day_widget)
+        day_layout.setContentsMargins(0, 0, 0, 0)
+        day_layout.setSpacing(10)
+        
+        day_label = QLabel("📅 Day:")
+        day_label.setFont(QFont("SF Pro Display", 13))
+        day_layout.addWidget(day_label)
+        
+        day_input = QDateEdit(QDate.fromString(day, "yyyy-MM-dd"))
+        day_input.setCalendarPopup(True)
+        day_input.setDisplayFormat("yyyy-MM-dd")
+        day_input.setMaximumDate(QDate.fromString(today, "yyyy-MM-dd"))
+        day_input.setFixedSize(150, 36)
+        day_input.setObjectName("dayPicker")
+        day_layout.addWidget(day_input)
+        
+        logged_label = QLabel()
+        logged_label.setFont(QFont("SF Pro Display", 11))
+        logged_label.setObjectName("muted")
+        day_layout.addWidget(logged_label)
+        day_layout.addStretch()
+        layout.addWidget(day_widget)
+        
+        def describe_day(selected):
+            spans = []
+            for session in session_index.day_sessions(selected):
+                key = session_index.key_of(session)
+                if key != session_key:
+                    end = (key[1] + session.get("minutes", 0)) % 1440
+                    spans.append(f"{format_clock(key[1])}–{format_clock(end)}")
+            logged_label.setText(f"Logged: {', '.join(spans)}" if spans else "")
+        
+        describe_day(day)
         
         # Time tracking section
         time_frame = QFrame()
-        time_frame.setStyleSheet("background-color: #1e1e3f; border-radius: 15px;")
+        time_frame.setObjectName("panel")
         time_layout = QVBoxLayout(time_frame)
         time_layout.setContentsMargins(15, 15, 15, 15)
         time_layout.setSpacing(10)
@@ -685,7 +2278,6 @@ class ConsistencyApp(QMainWindow):
         
         # Hours and minutes row
         time_input_widget = QWidget()
-        time_input_widget.setStyleSheet("background-color: transparent;")
         time_input_layout = QHBoxLayout(time_input_widget)
         time_input_layout.setContentsMargins(0, 5, 0, 0)
         time_input_layout.setSpacing(10)
@@ -704,23 +2296,26 @@ class ConsistencyApp(QMainWindow):
         time_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
         time_input.setFont(QFont("Menlo", 14, QFont.Weight.Bold))
         time_input.setText(f"{default_hours}:{default_mins:02d}")
-        time_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #2a2a5a;
-                border: 2px solid #3a3a6a;
-                border-radius: 8px;
-                color: white;
-                padding: 6px 10px;
-            }
-            QLineEdit:focus { border-color: #e94560; }
-        """)
+        time_input.setObjectName("clock")
         time_input_layout.addWidget(time_input)
+        
+        start_label = QLabel("Started at:")
+        start_label.setFont(QFont("SF Pro Display", 13))
+        time_input_layout.addWidget(start_label)
+        
+        start_input = QLineEdit()
+        start_input.setInputMask("99:99")
+        start_input.setFixedSize(130, 50)
+        start_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        start_input.setFont(QFont("Menlo", 14, QFont.Weight.Bold))
+        start_input.setText(format_clock(default_start))
+        start_input.setObjectName("clock")
+        time_input_layout.addWidget(start_input)
         time_input_layout.addStretch()
         time_layout.addWidget(time_input_widget)
         
         # Quick time buttons
         quick_widget = QWidget()
-        quick_widget.setStyleSheet("background-color: transparent;")
         quick_layout = QHBoxLayout(quick_widget)
         quick_layout.setContentsMargins(0, 5, 0, 0)
         quick_layout.setSpacing(8)
@@ -730,19 +2325,7 @@ class ConsistencyApp(QMainWindow):
             btn = QPushButton(label)
             btn.setFixedSize(55, 32)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2a2a5a;
-                    border: 1px solid #3a3a6a;
-                    border-radius: 8px;
-                    color: white;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #e94560;
-                    border-color: #e94560;
-                }
-            """)
+            btn.setObjectName("chip")
             btn.clicked.connect(lambda _, m=mins: time_input.setText(f"{m // 60}:{m % 60:02d}"))
             quick_layout.addWidget(btn)
         quick_layout.addStretch()
@@ -752,7 +2335,7 @@ class ConsistencyApp(QMainWindow):
         
         # Notes section
         notes_frame = QFrame()
-        notes_frame.setStyleSheet("background-color: #1e1e3f; border-radius: 15px;")
+        notes_frame.setObjectName("panel")
         notes_layout = QVBoxLayout(notes_frame)
         notes_layout.setContentsMargins(15, 15, 15, 15)
         notes_layout.setSpacing(8)
@@ -765,24 +2348,14 @@ class ConsistencyApp(QMainWindow):
         notes_input.setPlaceholderText("What did you work on?")
         notes_input.setFixedHeight(80)
         notes_input.setText(existing_session.get("note", "") if existing_session else "")
-        notes_input.setStyleSheet("""
-            QTextEdit {
-                background-color: #2a2a5a;
-                border: 2px solid #3a3a6a;
-                border-radius: 10px;
-                padding: 10px;
-                color: white;
-                font-size: 13px;
-            }
-            QTextEdit:focus { border-color: #e94560; }
-        """)
+        notes_input.setObjectName("field")
         notes_layout.addWidget(notes_input)
         
         layout.addWidget(notes_frame)
         
         # Mood section
         mood_frame = QFrame()
-        mood_frame.setStyleSheet("background-color: #1e1e3f; border-radius: 15px;")
+        mood_frame.setObjectName("panel")
         mood_layout = QVBoxLayout(mood_frame)
         mood_layout.setContentsMargins(15, 15, 15, 15)
         mood_layout.setSpacing(8)
@@ -792,7 +2365,6 @@ class ConsistencyApp(QMainWindow):
         mood_layout.addWidget(mood_label)
         
         mood_widget = QWidget()
-        mood_widget.setStyleSheet("background-color: transparent;")
         mood_btn_layout = QHBoxLayout(mood_widget)
         mood_btn_layout.setContentsMargins(0, 5, 0, 0)
         mood_btn_layout.setSpacing(12)
@@ -806,33 +2378,14 @@ class ConsistencyApp(QMainWindow):
             btn.setFixedSize(50, 50)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.setFont(QFont("Apple Color Emoji", 22))
+            btn.setObjectName("mood")
             btn.setProperty("mood_value", int(value))
             mood_buttons.append(btn)
             mood_btn_layout.addWidget(btn)
         
         def update_mood_buttons():
             for b in mood_buttons:
-                val = b.property("mood_value")
-                if val == selected_mood[0]:
-                    b.setStyleSheet("""
-                        QPushButton {
-                            background-color: #e94560;
-                            border: 2px solid #ff5a75;
-                            border-radius: 12px;
-                        }
-                    """)
-                else:
-                    b.setStyleSheet("""
-                        QPushButton {
-                            background-color: #2a2a5a;
-                            border: 2px solid #3a3a6a;
-                            border-radius: 12px;
-                        }
-                        QPushButton:hover {
-                            background-color: #3a3a6a;
-                            border-color: #e94560;
-                        }
-                    """)
+                set_state(b, selected=b.property("mood_value") == selected_mood[0])
         
         for btn in mood_buttons:
             btn.clicked.connect(lambda checked, b=btn: (
@@ -849,42 +2402,35 @@ class ConsistencyApp(QMainWindow):
         
         # Buttons
         btn_widget = QWidget()
-        btn_widget.setStyleSheet("background-color: transparent;")
         btn_layout = QHBoxLayout(btn_widget)
         btn_layout.setContentsMargins(0, 10, 0, 0)
         
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setFixedSize(100, 45)
         cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a2a5a;
-                border: none;
-                border-radius: 10px;
-                color: white;
-                font-size: 14px;
-            }
-            QPushButton:hover { background-color: #3a3a6a; }
-        """)
+        cancel_btn.setObjectName("secondary")
         cancel_btn.clicked.connect(dialog.reject)
         btn_layout.addWidget(cancel_btn)
         
+        remove_btn = QPushButton("🗑 Remove Session" if session_key else "🗑 Remove Day")
+        remove_btn.setFixedSize(150, 45)
+        remove_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        remove_btn.setObjectName("danger")
+        remove_btn.setVisible(session_key is not None or day in activity.get("dates", []))
+        btn_layout.addWidget(remove_btn)
+        
         btn_layout.addStretch()
         
-        save_btn = QPushButton("✅ Check In" if not edit_mode else "💾 Update")
+        if session_key:
+            save_text = "💾 Update"
+        elif day in activity.get("dates", []):
+            save_text = "➕ Add Session"
+        else:
+            save_text = "✅ Check In"
+        save_btn = QPushButton(save_text)
         save_btn.setFixedSize(140, 45)
         save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e94560;
-                border: none;
-                border-radius: 10px;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #ff5a75; }
-        """)
+        save_btn.setObjectName("save")
         
         def save_checkin():
             raw = time_input.text().strip()
@@ -895,62 +2441,212 @@ class ConsistencyApp(QMainWindow):
             except ValueError:
                 hours, mins = 0, 30
             total_mins = max(0, hours) * 60 + max(0, mins)
+            start = day_minute(parse_clock(start_input.text(), default_start), day_start)
+            selected = day_input.date().toString("yyyy-MM-dd")
+            clash = session_index.conflict(selected, start, total_mins, ignore=session_key)
+            if clash is not None:
+                clash_start = session_index.key_of(clash)[1]
+                clash_end = (clash_start + clash.get("minutes", 0)) % 1440
+                QMessageBox.warning(
+                    dialog, "Overlapping Session",
+                    f"This overlaps the {clash['date']} session "
+                    f"{format_clock(clash_start)}–{format_clock(clash_end)}."
+                )
+                return
             note = notes_input.toPlainText().strip()
             mood = selected_mood[0]
-            self.check_in(name, total_mins, note, mood)
+            self.check_in(name, total_mins, note, mood, day=selected, start=start, replace=session_key)
             dialog.accept()
         
+        def remove_day():
+            selected = day_input.date().toString("yyyy-MM-dd")
+            if session_key:
+                question = f"Remove the {session_key[0]} {format_clock(session_key[1])} session for '{name}'?"
+            else:
+                question = f"Remove the {selected} check-in for '{name}'?"
+            reply = QMessageBox.question(
+                dialog, "Remove Session" if session_key else "Remove Day", question,
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                if session_key:
+                    self.remove_session(name, session_key)
+                else:
+                    self.remove_checkin(name, selected)
+                dialog.accept()
+        
+        def load_day():
+            selected = day_input.date().toString("yyyy-MM-dd")
+            describe_day(selected)
+            if session_key:
+                return
+            checked = selected in activity.get("dates", [])
+            save_btn.setText("➕ Add Session" if checked else "✅ Check In")
+            remove_btn.setVisible(checked)
+        
         save_btn.clicked.connect(save_checkin)
+        remove_btn.clicked.connect(remove_day)
+        day_input.dateChanged.connect(load_day)
         btn_layout.addWidget(save_btn)
         
         layout.addWidget(btn_widget)
         
         dialog.exec()
     
-    def check_in(self, name, minutes=30, note="", mood=3):
+    def check_in(self, name, minutes=30, note="", mood=3, day=None, start=None, replace=None):
+        """Log a session on day; replace is the (day, start) key of a session being edited.
+        
+        Without a start (quick and bulk check-ins) the session ends now; one
+        overlapping a logged session is refused with a warning, as the
+        check-in dialog does. Returns whether the session was logged.
+        """
         today = self.get_today()
+        day = day or today
+        if name not in self.data["activities"]:
+            return False
+        
+        session_index = self.get_sessions(name)
+        now = datetime.now().astimezone()
+        if start is None:
+            # Measured from the logical day's midnight, so it never starts before the day does
+            day_start = self.day_start_minute()
+            if day == today:
+                start = max(day_minute(now.hour * 60 + now.minute, day_start) - minutes, day_start)
+            else:
+                start = day_minute(12 * 60, day_start)
+            clash = session_index.conflict(day, start, minutes, ignore=replace)
+            if clash is not None:
+                clash_start = session_index.key_of(clash)[1]
+                clash_end = (clash_start + clash.get("minutes", 0)) % 1440
+                QMessageBox.warning(
+                    self, "Overlapping Session",
+                    f"{name}: a {minutes} min session ending now overlaps the {clash['date']} session "
+                    f"{format_clock(clash_start)}–{format_clock(clash_end)}."
+                )
+                return False
+        
+        with self.batch:
+            activity = self.data["activities"][name]
+            runs = self.get_runs(name)
+            # Built from "dates" on first use, so fetch it before the day is added
+            checkin_totals = self.get_checkin_totals(name)
+            
+            # Add to dates if not already there
+            if day not in activity.get("dates", []):
+                activity.setdefault("dates", []).append(day)
+                checkin_totals.add(to_ordinal(day), 1)
+            runs.add(to_ordinal(day))
+            self.day_index.add(to_ordinal(day), name)
+            schedule, streak_runs = self.get_streak_runs(name)
+            if schedule is not None and schedule.is_scheduled(to_ordinal(day)):
+                streak_runs.add(schedule.rank(to_ordinal(day)))
+            
+            # Add a session, or replace the one being edited
+            existing = session_index.get(replace) if replace else None
+            
+            session_data = {
+                "date": day,
+                "start": format_clock(start),
+                "minutes": minutes,
+                "note": note,
+                "mood": mood,
+            }
+            if existing is not None and existing.get("time"):
+                session_data["time"] = existing["time"]
+                if existing.get("ts"):
+                    session_data["ts"] = existing["ts"]
+            elif day == today:
+                # Timezone-aware stamp; the day key above is never re-derived from it
+                session_data["time"] = now.strftime("%H:%M")
+                session_data["ts"] = now.isoformat(timespec="seconds")
+            
+            key = session_index.add(session_data, replace=replace)
+            if replace:
+                self.unindex(("session", name, replace))
+            self.index_session(name, key, session_index.get(key))
+            if replace and replace[0] != day and replace[0] not in session_index:
+                # The edited session moved off its old day, leaving nothing there
+                self.unmark_day(name, replace[0])
+            self.store.emit(CHECKINS, name)
+            
+            per = habit_period(activity)
+            _, streak, _, _ = self.get_status(name)
+            if per != "day":
+                activity["longest"] = max(activity.get("longest", 0), streak)
+            elif schedule is None:
+                activity["longest"] = max(activity.get("longest", 0), runs.run_length(to_ordinal(day)))
+            elif schedule.is_scheduled(to_ordinal(day)):
+                activity["longest"] = max(activity.get("longest", 0), streak_runs.run_length(schedule.rank(to_ordinal(day))))
+            
+            self.save_data()
+            if per == "day":
+                self.check_badges(name, streak)
+            
+            day_minutes = session_index.day_minutes(day)
+            time_str = f"{day_minutes // 60}h {day_minutes % 60}m" if day_minutes >= 60 else f"{day_minutes}m"
+            self.send_notification("✅ Checked In!", f"{name}: 🔥 {streak} {streak_core.PERIOD_UNITS[per]} | ⏱ {time_str}")
+        return True
+    
+    def remove_checkin(self, name, day):
+        """Delete a mistaken check-in and all its sessions, splitting the streak run."""
+        if name not in self.data["activities"]:
+            return
+        with self.batch:
+            session_index = self.get_sessions(name)
+            for session in session_index.day_sessions(day):
+                self.unindex(("session", name, session_index.key_of(session)))
+            session_index.delete_day(day)
+            self.unmark_day(name, day)
+            self.save_data()
+    
+    def remove_session(self, name, key):
+        """Delete one session; the day stays checked in while others remain."""
         if name not in self.data["activities"]:
             return
+        with self.batch:
+            session_index = self.get_sessions(name)
+            session_index.delete(key)
+            self.unindex(("session", name, key))
+            if key[0] not in session_index:
+                self.unmark_day(name, key[0])
+            self.store.emit(CHECKINS, name)
+            self.save_data()
+    
+    def unmark_day(self, name, day):
+        """Drop day from an activity's check-ins and streak indexes.
         
+        The stored longest streak only drops when the day was in the run
+        that set it; records from history the indexes don't hold stay.
+        """
         activity = self.data["activities"][name]
+        # All three are built from "dates" on first use, so fetch them before the day goes
+        checkin_totals = self.get_checkin_totals(name)
+        runs = self.get_runs(name)
+        schedule, streak_runs = self.get_streak_runs(name)
+        ordinal = to_ordinal(day)
+        position = ordinal if schedule is None else schedule.rank(ordinal)
+        counted = schedule is None or schedule.is_scheduled(ordinal)
+        held_record = (
+            counted and not activity.get("frequency")
+            and streak_runs.run_length(position) == activity.get("longest", 0)
+        )
         
-        # Add to dates if not already there
-        if today not in activity.get("dates", []):
-            activity.setdefault("dates", []).append(today)
-        
-        # Add or update session
-        sessions = activity.setdefault("sessions", [])
-        existing_idx = next((i for i, s in enumerate(sessions) if s.get("date") == today), None)
-        
-        session_data = {
-            "date": today,
-            "minutes": minutes,
-            "note": note,
-            "mood": mood,
-            "time": datetime.now().strftime("%H:%M")
-        }
-        
-        if existing_idx is not None:
-            sessions[existing_idx] = session_data
-        else:
-            sessions.insert(0, session_data)
-        
-        streak = self.get_streak(activity["dates"])
-        if streak > activity.get("longest", 0):
-            activity["longest"] = streak
-        
-        self.save_data()
-        self.check_badges(name, streak)
-        
-        time_str = f"{minutes // 60}h {minutes % 60}m" if minutes >= 60 else f"{minutes}m"
-        self.send_notification("✅ Checked In!", f"{name}: 🔥 {streak} days | ⏱ {time_str}")
-        self.show_home()
+        if day in activity.get("dates", []):
+            activity["dates"].remove(day)
+            checkin_totals.add(ordinal, -1)
+        runs.remove(ordinal)
+        self.day_index.remove(ordinal, name)
+        if schedule is not None and counted:
+            streak_runs.remove(position)
+        if held_record:
+            activity["longest"] = streak_runs.longest()
+        self.store.emit(CHECKINS, name)
     
     def show_activity_history(self, name):
         """Show activity history dialog"""
         dialog = QDialog(self)
         dialog.setWindowTitle(f"History: {name}")
-        dialog.setFixedSize(500, 600)
+        dialog.setFixedSize(560, 640)
         dialog.setStyleSheet("""
             QDialog {
                 background-color: #1a1a2e;
@@ -965,12 +2661,63 @@ class ConsistencyApp(QMainWindow):
         layout.setSpacing(15)
         
         # Header
+        header_widget = QWidget()
+        header_layout = QHBoxLayout(header_widget)
+        header_layout.setContentsMargins(0, 0, 0, 0)
+        
         header = QLabel(f"📋 {name} History")
         header.setFont(QFont("SF Pro Display", 18, QFont.Weight.Bold))
-        layout.addWidget(header)
+        header_layout.addWidget(header)
+        header_layout.addStretch()
         
-        activity = self.data["activities"].get(name, {})
-        sessions = activity.get("sessions", [])
+        # Actions picked inside this dialog run after it closes
+        pending = []
+        
+        backfill_btn = QPushButton("➕ Backfill Day")
+        backfill_btn.setFixedSize(130, 34)
+        backfill_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        backfill_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #e94560;
+                border: none;
+                border-radius: 10px;
+                color: white;
+                font-weight: bold;
+            }
+            QPushButton:hover { background-color: #ff5a75; }
+        """)
+        yesterday = from_ordinal(to_ordinal(self.get_today()) - 1)
+        backfill_btn.clicked.connect(lambda: (pending.append(("add", yesterday)), dialog.accept()))
+        header_layout.addWidget(backfill_btn)
+        
+        goal_btn = QPushButton("🎯")
+        goal_btn.setFixedSize(34, 34)
+        goal_btn.setToolTip("Frequency goal")
+        goal_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        goal_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #2a2a5a;
+                border: none;
+                border-radius: 10px;
+                font-size: 15px;
+            }
+            QPushButton:hover { background-color: #3a3a6a; }
+        """)
+        goal_btn.clicked.connect(lambda: (pending.append(("goal", None)), dialog.accept()))
+        header_layout.addWidget(goal_btn)
+        
+        schedule_btn = QPushButton("📆")
+        schedule_btn.setFixedSize(34, 34)
+        schedule_btn.setToolTip("Scheduled days")
+        schedule_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        schedule_btn.setStyleSheet(goal_btn.styleSheet())
+        schedule_btn.clicked.connect(lambda: (pending.append(("schedule", None)), dialog.accept()))
+        header_layout.addWidget(schedule_btn)
+        
+        layout.addWidget(header_widget)
+        
+        session_index = self.get_sessions(name)
+        session_stats = session_index.stats
         
         # Stats summary
         stats_frame = QFrame()
@@ -983,13 +2730,13 @@ class ConsistencyApp(QMainWindow):
         stats_layout = QHBoxLayout(stats_frame)
         stats_layout.setContentsMargins(15, 15, 15, 15)
         
-        total_mins = sum(s.get("minutes", 0) for s in sessions)
-        avg_mins = total_mins // len(sessions) if sessions else 0
-        avg_mood = sum(s.get("mood", 3) for s in sessions) / len(sessions) if sessions else 3
+        total_mins = session_stats.total_minutes
+        avg_mins = session_stats.avg_minutes
+        avg_mood = session_stats.avg_mood
         
         stats = [
             ("⏱", f"{total_mins // 60}h {total_mins % 60}m", "Total Time"),
-            ("📅", str(len(sessions)), "Sessions"),
+            ("📅", str(session_stats.count), "Sessions"),
             ("⏳", f"{avg_mins}m", "Avg/Session"),
             ("😊", ['😩', '😕', '😐', '😊', '🤩'][min(int(avg_mood) - 1, 4)], "Avg Mood"),
         ]
@@ -1007,7 +2754,7 @@ class ConsistencyApp(QMainWindow):
             
             desc_label = QLabel(label)
             desc_label.setFont(QFont("SF Pro Display", 10))
-            desc_label.setStyleSheet("color: #8888aa;")
+            desc_label.setObjectName("muted")
             desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             stat_layout.addWidget(desc_label)
             
@@ -1015,89 +2762,146 @@ class ConsistencyApp(QMainWindow):
         
         layout.addWidget(stats_frame)
         
-        # Sessions list
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
+        # Recent streak runs (last 90 days)
+        today_ord = to_ordinal(self.get_today())
+        recent_runs = self.get_runs(name).runs_between(today_ord - 89, today_ord)
+        if recent_runs:
+            runs_text = "   ".join(
+                f"{from_ordinal(start)[5:]} → {from_ordinal(end)[5:]} ({end - start + 1}d)"
+                for start, end in reversed(recent_runs[-4:])
+            )
+            runs_label = QLabel(f"🔥 {runs_text}")
+            runs_label.setFont(QFont("SF Pro Display", 11))
+            runs_label.setStyleSheet("color: #ff6b35;")
+            runs_label.setToolTip("Recent streak runs")
+            layout.addWidget(runs_label)
+        
+        # Sessions list: model-backed, so only the visible rows are painted
+        date_style = """
+            QDateEdit {
+                background-color: #2a2a5a;
+                border: 2px solid #3a3a6a;
+                border-radius: 8px;
+                color: white;
+                padding: 2px 6px;
+            }
+            QDateEdit:focus { border-color: #e94560; }
+        """
+        small_btn_style = """
+            QPushButton {
+                background-color: #2a2a5a;
+                border: none;
+                border-radius: 8px;
+                color: white;
+                padding: 0 10px;
+            }
+            QPushButton:hover { background-color: #3a3a6a; }
+        """
+        today_date = QDate.fromString(self.get_today(), "yyyy-MM-dd")
+        first_date = QDate.fromString(session_index.key_at(0)[0], "yyyy-MM-dd") if session_index.span()[1] else today_date
+        
+        filter_widget = QWidget()
+        filter_layout = QHBoxLayout(filter_widget)
+        filter_layout.setContentsMargins(0, 0, 0, 0)
+        filter_layout.setSpacing(8)
+        
+        date_inputs = []
+        for text, value in (("From", first_date), ("To", today_date)):
+            date_label = QLabel(text)
+            date_label.setObjectName("muted")
+            filter_layout.addWidget(date_label)
+            date_input = QDateEdit(value)
+            date_input.setCalendarPopup(True)
+            date_input.setDisplayFormat("yyyy-MM-dd")
+            date_input.setFixedHeight(30)
+            date_input.setStyleSheet(date_style)
+            filter_layout.addWidget(date_input)
+            date_inputs.append(date_input)
+        from_input, to_input = date_inputs
+        filter_layout.addStretch()
+        
+        jump_input = QDateEdit(today_date)
+        jump_input.setCalendarPopup(True)
+        jump_input.setDisplayFormat("yyyy-MM-dd")
+        jump_input.setFixedHeight(30)
+        jump_input.setStyleSheet(date_style)
+        filter_layout.addWidget(jump_input)
+        
+        jump_btn = QPushButton("⤓ Jump")
+        jump_btn.setFixedHeight(30)
+        jump_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        jump_btn.setStyleSheet(small_btn_style)
+        filter_layout.addWidget(jump_btn)
+        layout.addWidget(filter_widget)
+        
+        model = SessionListModel(session_index, dialog)
+        session_list = QListView()
+        session_list.setModel(model)
+        session_list.setItemDelegate(SessionDelegate(session_list))
+        session_list.setUniformItemSizes(True)
+        session_list.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        session_list.setStyleSheet("""
+            QListView {
                 border: none;
                 background-color: transparent;
+                outline: none;
             }
         """)
+        layout.addWidget(session_list, stretch=1)
+        
+        count_label = QLabel()
+        count_label.setObjectName("muted")
+        count_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(count_label)
+        
+        def apply_range():
+            model.set_range(
+                from_input.date().toString("yyyy-MM-dd"),
+                to_input.date().toString("yyyy-MM-dd")
+            )
+            if not len(session_index):
+                count_label.setText("No sessions yet. Check in to start tracking!")
+            else:
+                count_label.setText(f"{model.total()} sessions in range")
+        
+        def jump_to_day():
+            row = model.row_for_day(jump_input.date().toString("yyyy-MM-dd"))
+            if row >= 0:
+                index = model.index(row)
+                session_list.setCurrentIndex(index)
+                session_list.scrollTo(index, QListView.ScrollHint.PositionAtTop)
+        
+        def selected_key():
+            index = session_list.currentIndex()
+            return index.data(SessionListModel.KeyRole) if index.isValid() else None
+        
+        def queue(action):
+            key = selected_key()
+            if key is not None:
+                pending.append((action, key))
+                dialog.accept()
+        
+        apply_range()
+        from_input.dateChanged.connect(apply_range)
+        to_input.dateChanged.connect(apply_range)
+        jump_btn.clicked.connect(jump_to_day)
+        session_list.doubleClicked.connect(lambda _: queue("edit"))
+        
+        # Bottom buttons
+        bottom_widget = QWidget()
+        bottom_layout = QHBoxLayout(bottom_widget)
+        bottom_layout.setContentsMargins(0, 0, 0, 0)
+        
+        for text, action, tip in (("✏️ Edit", "edit", "Edit the selected session"), ("🗑 Remove", "remove", "Remove the selected session")):
+            action_btn = QPushButton(text)
+            action_btn.setFixedHeight(40)
+            action_btn.setToolTip(tip)
+            action_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            action_btn.setStyleSheet(small_btn_style)
+            action_btn.clicked.connect(lambda _, a=action: queue(a))
+            bottom_layout.addWidget(action_btn)
+        bottom_layout.addStretch()
         
-        sessions_widget = QWidget()
-        sessions_layout = QVBoxLayout(sessions_widget)
-        sessions_layout.setContentsMargins(0, 0, 10, 0)
-        sessions_layout.setSpacing(10)
-        
-        if not sessions:
-            empty_label = QLabel("No sessions yet. Check in to start tracking!")
-            empty_label.setStyleSheet("color: #8888aa;")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            sessions_layout.addWidget(empty_label)
-        else:
-            for session in sessions[:50]:  # Show last 50 sessions
-                card = QFrame()
-                card.setStyleSheet("""
-                    QFrame {
-                        background-color: #1e1e3f;
-                        border-radius: 10px;
-                    }
-                """)
-                card_layout = QVBoxLayout(card)
-                card_layout.setContentsMargins(15, 12, 15, 12)
-                card_layout.setSpacing(5)
-                
-                # Top row: date and time
-                top_widget = QWidget()
-                top_layout = QHBoxLayout(top_widget)
-                top_layout.setContentsMargins(0, 0, 0, 0)
-                
-                date_str = session.get("date", "")
-                time_str = session.get("time", "")
-                mins = session.get("minutes", 0)
-                duration = f"{mins // 60}h {mins % 60}m" if mins >= 60 else f"{mins}m"
-                
-                date_label = QLabel(f"📅 {date_str}")
-                date_label.setFont(QFont("SF Pro Display", 12, QFont.Weight.Bold))
-                top_layout.addWidget(date_label)
-                
-                if time_str:
-                    time_label = QLabel(f"🕒 {time_str}")
-                    time_label.setFont(QFont("SF Pro Display", 11))
-                    time_label.setStyleSheet("color: #8888aa;")
-                    top_layout.addWidget(time_label)
-                
-                top_layout.addStretch()
-                
-                duration_label = QLabel(f"⏱ {duration}")
-                duration_label.setFont(QFont("SF Pro Display", 12, QFont.Weight.Bold))
-                duration_label.setStyleSheet("color: #4cc9f0;")
-                top_layout.addWidget(duration_label)
-                
-                mood = session.get("mood", 3)
-                mood_emoji = ['😩', '😕', '😐', '😊', '🤩'][min(mood - 1, 4)]
-                mood_label = QLabel(mood_emoji)
-                mood_label.setFont(QFont("Arial", 16))
-                top_layout.addWidget(mood_label)
-                
-                card_layout.addWidget(top_widget)
-                
-                # Note if exists
-                if session.get("note"):
-                    note_label = QLabel(session.get("note"))
-                    note_label.setFont(QFont("SF Pro Display", 11))
-                    note_label.setStyleSheet("color: #9b5de5;")
-                    note_label.setWordWrap(True)
-                    card_layout.addWidget(note_label)
-                
-                sessions_layout.addWidget(card)
-        
-        sessions_layout.addStretch()
-        scroll.setWidget(sessions_widget)
-        layout.addWidget(scroll)
-        
-        # Close button
         close_btn = QPushButton("Close")
         close_btn.setFixedSize(100, 40)
         close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -1113,9 +2917,122 @@ class ConsistencyApp(QMainWindow):
             }
         """)
         close_btn.clicked.connect(dialog.accept)
-        layout.addWidget(close_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        bottom_layout.addWidget(close_btn)
+        layout.addWidget(bottom_widget)
         
         dialog.exec()
+        
+        if pending:
+            action, target = pending[0]
+            if action == "goal":
+                self.edit_frequency(name)
+            elif action == "schedule":
+                self.edit_schedule(name)
+            elif action == "add":
+                self.show_checkin_dialog(name, day=target)
+            elif action == "edit":
+                self.show_checkin_dialog(name, session_key=target)
+            else:
+                reply = QMessageBox.question(
+                    self, "Remove Session",
+                    f"Remove the {target[0]} {format_clock(target[1])} session for '{name}'?",
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                )
+                if reply == QMessageBox.StandardButton.Yes:
+                    self.remove_session(name, target)
+            self.show_activity_history(name)
+    
+    def edit_frequency(self, name):
+        """Pick how often an activity needs doing (daily, N per week, N per month)."""
+        activity = self.data["activities"].get(name)
+        if activity is None:
+            return
+        labels = [label for label, _ in FREQUENCY_CHOICES]
+        current = next(
+            (i for i, (_, freq) in enumerate(FREQUENCY_CHOICES) if freq == activity.get("frequency")), 0
+        )
+        label, ok = QInputDialog.getItem(self, "Frequency Goal", f"How often for {name}?", labels, current, False)
+        if not ok:
+            return
+        frequency = FREQUENCY_CHOICES[labels.index(label)][1]
+        if frequency:
+            activity["frequency"] = dict(frequency)
+        else:
+            activity.pop("frequency", None)
+        self.save_data()
+        self.store.emit(GOAL, name)
+    
+    def edit_schedule(self, name):
+        """Choose the weekdays an activity is due and any excluded dates."""
+        activity = self.data["activities"].get(name)
+        if activity is None:
+            return
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"Schedule: {name}")
+        dialog.setStyleSheet("""
+            QDialog {
+                background-color: #1a1a2e;
+            }
+            QLabel, QCheckBox {
+                color: white;
+            }
+        """)
+        layout = QVBoxLayout(dialog)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(12)
+        
+        title = QLabel("📆 Due on")
+        title.setFont(QFont("SF Pro Display", 15, QFont.Weight.Bold))
+        layout.addWidget(title)
+        
+        mask = activity.get("schedule", EVERY_DAY)
+        day_row = QHBoxLayout()
+        day_boxes = []
+        for weekday, label in enumerate(WEEKDAYS):
+            box = QCheckBox(label)
+            box.setChecked(bool(mask >> weekday & 1))
+            box.setCursor(Qt.CursorShape.PointingHandCursor)
+            day_row.addWidget(box)
+            day_boxes.append(box)
+        layout.addLayout(day_row)
+        
+        excluded_label = QLabel("Skip dates (YYYY-MM-DD, comma separated)")
+        excluded_label.setFont(QFont("SF Pro Display", 12))
+        excluded_label.setObjectName("muted")
+        layout.addWidget(excluded_label)
+        
+        excluded_input = QLineEdit(", ".join(activity.get("excluded", [])))
+        excluded_input.setPlaceholderText("e.g. 2025-12-25, 2026-01-01")
+        layout.addWidget(excluded_input)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        
+        new_mask = sum(1 << weekday for weekday, box in enumerate(day_boxes) if box.isChecked()) or EVERY_DAY
+        excluded = []
+        for part in excluded_input.text().split(","):
+            try:
+                excluded.append(datetime.strptime(part.strip(), "%Y-%m-%d").strftime("%Y-%m-%d"))
+            except ValueError:
+                continue
+        
+        if new_mask == EVERY_DAY:
+            activity.pop("schedule", None)
+        else:
+            activity["schedule"] = new_mask
+        if excluded:
+            activity["excluded"] = sorted(set(excluded))
+        else:
+            activity.pop("excluded", None)
+        self.rank_runs.pop(name, None)
+        self.save_data()
+        self.store.emit(GOAL, name)
     
     def check_badges(self, name, streak):
         if streak in BADGES:
@@ -1123,26 +3040,94 @@ class ConsistencyApp(QMainWindow):
             if badge_key not in self.data.get("badges", []):
                 self.data.setdefault("badges", []).append(badge_key)
                 self.save_data()
+                self.store.emit(BADGE, badge_key)
                 icon, badge_name, _ = BADGES[streak]
                 self.send_notification("🏆 Badge Earned!", f"{icon} {badge_name}")
     
-    def delete_activity(self, name):
+    def delete_activity(self, name):
+        reply = QMessageBox.question(
+            self, "Delete Activity",
+            f"Delete '{name}'?\n\nThis will remove all streak data.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.remove_activity(name)
+    
+    def remove_activity(self, name):
+        """Delete an activity and everything indexed about it, without asking."""
+        if name not in self.data.get("activities", {}):
+            return
+        del self.data["activities"][name]
+        self.runs.pop(name, None)
+        self.rank_runs.pop(name, None)
+        self.day_index.remove_activity(name)
+        self.session_indexes.pop(name, None)
+        self.checkin_totals.pop(name, None)
+        self.forget_status(name)
+        self.selected_activities.discard(name)
+        if self.search_index is not None:
+            self.search_index.discard_where("session", name)
+        self.save_data()
+        self.store.emit(ACTIVITY, name)
+    
+    # ==================== BULK ACTIONS ====================
+    def toggle_selecting(self):
+        self.selecting = not self.selecting
+        self.selected_activities.clear()
+        self.show_home()
+    
+    def toggle_selected(self, name, checked):
+        if checked:
+            self.selected_activities.add(name)
+        else:
+            self.selected_activities.discard(name)
+        self.bulk_count_label.setText(f"{len(self.selected_activities)} selected")
+    
+    def bulk_check_in(self):
+        """Check in every selected activity for today with one save and one notification."""
+        names = [name for name in self.selected_activities if name in self.data["activities"]]
+        if not names:
+            return
+        minutes, ok = QInputDialog.getInt(self, "Check In Selected", "Minutes for each activity:", 30, 0, 1440)
+        if not ok:
+            return
+        today = to_ordinal(self.get_today())
+        with self.batch(snapshot=True):
+            for name in sorted(names):
+                if not self.day_index.has(today, name):
+                    self.check_in(name, minutes)
+    
+    def bulk_recolor(self):
+        names = [name for name in self.selected_activities if name in self.data["activities"]]
+        if not names:
+            return
+        color = QColorDialog.getColor(QColor("#e94560"), self, "Color for selected activities")
+        if not color.isValid():
+            return
+        with self.batch(snapshot=True):
+            for name in names:
+                self.data["activities"][name]["color"] = color.name()
+                self.store.emit(ACTIVITY, name)
+            self.save_data()
+    
+    def bulk_delete(self):
+        names = [name for name in self.selected_activities if name in self.data["activities"]]
+        if not names:
+            return
         reply = QMessageBox.question(
-            self, "Delete Activity",
-            f"Delete '{name}'?\n\nThis will remove all streak data.",
+            self, "Delete Activities",
+            f"Delete {len(names)} activities?\n\n" + "\n".join(sorted(names)) + "\n\nThis will remove all their streak data.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
-        if reply == QMessageBox.StandardButton.Yes:
-            if name in self.data.get("activities", {}):
-                del self.data["activities"][name]
-                self.save_data()
-                self.show_home()
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        with self.batch(snapshot=True):
+            for name in names:
+                self.remove_activity(name)
     
     # ==================== ADD ACTIVITY ====================
     def show_add_activity(self):
-        self.clear_content()
-        self.set_active_nav("Add Activity")
-        self.header_title.setText("Add Activity")
+        self.new_page("Add Activity", "Add Activity")
         
         # Presets label
         label = QLabel("Quick Add Presets")
@@ -1210,6 +3195,25 @@ class ConsistencyApp(QMainWindow):
         self.custom_input.setFixedHeight(50)
         custom_layout.addWidget(self.custom_input)
         
+        self.frequency_combo = QComboBox()
+        self.frequency_combo.addItems([label for label, _ in FREQUENCY_CHOICES])
+        self.frequency_combo.setFixedHeight(40)
+        self.frequency_combo.setStyleSheet("""
+            QComboBox {
+                background-color: #2a2a5a;
+                border: 2px solid #3a3a6a;
+                border-radius: 10px;
+                padding: 5px 12px;
+                color: white;
+            }
+            QComboBox QAbstractItemView {
+                background-color: #2a2a5a;
+                selection-background-color: #e94560;
+                color: white;
+            }
+        """)
+        custom_layout.addWidget(self.frequency_combo)
+        
         add_btn = QPushButton("Add Activity")
         add_btn.setObjectName("primary")
         add_btn.setFixedHeight(50)
@@ -1228,6 +3232,7 @@ class ConsistencyApp(QMainWindow):
                 "dates": [], "longest": 0, "color": color
             }
             self.save_data()
+            self.store.emit(ACTIVITY, full_name)
             self.send_notification("✨ Activity Added!", f"{full_name}")
             self.show_add_activity()
     
@@ -1237,15 +3242,17 @@ class ConsistencyApp(QMainWindow):
             self.data.setdefault("activities", {})[name] = {
                 "dates": [], "longest": 0, "color": "#e94560"
             }
+            frequency = FREQUENCY_CHOICES[self.frequency_combo.currentIndex()][1]
+            if frequency:
+                self.data["activities"][name]["frequency"] = dict(frequency)
             self.save_data()
+            self.store.emit(ACTIVITY, name)
             self.send_notification("✨ Activity Added!", name)
             self.show_home()
     
     # ==================== BADGES ====================
     def show_badges(self):
-        self.clear_content()
-        self.set_active_nav("Badges")
-        self.header_title.setText("Badges")
+        self.new_page("Badges", "Badges")
         
         earned = self.data.get("badges", [])
         
@@ -1268,13 +3275,7 @@ class ConsistencyApp(QMainWindow):
                         icon, name, _ = BADGES[days]
                         
                         badge = QFrame()
-                        badge.setStyleSheet("""
-                            QFrame {
-                                background-color: #1e1e3f;
-                                border-radius: 15px;
-                                padding: 15px;
-                            }
-                        """)
+                        badge.setObjectName("card")
                         badge.setFixedSize(130, 120)
                         badge_layout = QVBoxLayout(badge)
                         badge_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1302,12 +3303,7 @@ class ConsistencyApp(QMainWindow):
         
         for days, (icon, name, desc) in BADGES.items():
             row = QFrame()
-            row.setStyleSheet("""
-                QFrame {
-                    background-color: #1e1e3f;
-                    border-radius: 12px;
-                }
-            """)
+            row.setObjectName("tile")
             row.setFixedHeight(70)
             
             row_layout = QHBoxLayout(row)
@@ -1328,7 +3324,7 @@ class ConsistencyApp(QMainWindow):
             
             desc_lbl = QLabel(desc)
             desc_lbl.setFont(QFont("SF Pro Display", 11))
-            desc_lbl.setStyleSheet("color: #8888aa;")
+            desc_lbl.setObjectName("muted")
             info_layout.addWidget(desc_lbl)
             
             row_layout.addWidget(info)
@@ -1340,38 +3336,29 @@ class ConsistencyApp(QMainWindow):
     
     # ==================== STATS ====================
     def show_stats(self):
-        self.clear_content()
-        self.set_active_nav("Statistics")
-        self.header_title.setText("Statistics")
+        """Skeleton cards now; a StatsWorker fills them in as its results arrive."""
+        self.new_page("Statistics", "Statistics")
         
         activities = self.data.get("activities", {})
-        
-        total_days = sum(len(a.get("dates", [])) for a in activities.values())
-        total_activities = len(activities)
-        best_streak = max((a.get("longest", 0) for a in activities.values()), default=0)
-        active_streaks = sum(1 for a in activities.values() if self.get_streak(a.get("dates", [])) > 0)
-        badges_count = len(self.data.get("badges", []))
+        view = {"windows": [], "weeks": {}, "totals": [[0, 0] for _ in ROLLING_WINDOWS], "week_total": 0, "series": []}
         
         stats = [
-            ("📅", str(total_days), "Total Days"),
-            ("📋", str(total_activities), "Activities"),
-            ("🔥", str(active_streaks), "Active"),
-            ("🏆", str(best_streak), "Best Streak"),
-            ("⭐", str(badges_count), "Badges"),
+            ("days", "📅", None, "Total Days"),
+            ("activities", "📋", str(len(activities)), "Activities"),
+            ("active", "🔥", None, "Active"),
+            ("best", "🏆", None, "Best Streak"),
+            ("badges", "⭐", str(len(self.data.get("badges", []))), "Badges"),
+            ("week", "⏱", None, "Last 7 Days"),
         ]
         
         stats_widget = QWidget()
         stats_grid = QGridLayout(stats_widget)
         stats_grid.setSpacing(15)
         
-        for i, (icon, value, label) in enumerate(stats):
+        view["cards"] = {}
+        for i, (key, icon, value, label) in enumerate(stats):
             card = QFrame()
-            card.setStyleSheet("""
-                QFrame {
-                    background-color: #1e1e3f;
-                    border-radius: 15px;
-                }
-            """)
+            card.setObjectName("panel")
             card.setFixedHeight(120)
             card_layout = QVBoxLayout(card)
             card_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1381,14 +3368,16 @@ class ConsistencyApp(QMainWindow):
             icon_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
             card_layout.addWidget(icon_lbl)
             
-            val_lbl = QLabel(value)
+            val_lbl = QLabel(value or "—")
             val_lbl.setFont(QFont("SF Pro Display", 24, QFont.Weight.Bold))
             val_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            val_lbl.setProperty("loading", value is None)
             card_layout.addWidget(val_lbl)
+            view["cards"][key] = val_lbl
             
             lbl = QLabel(label)
             lbl.setFont(QFont("SF Pro Display", 11))
-            lbl.setStyleSheet("color: #8888aa;")
+            lbl.setObjectName("muted")
             lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
             card_layout.addWidget(lbl)
             
@@ -1396,56 +3385,258 @@ class ConsistencyApp(QMainWindow):
         
         self.content_layout.addWidget(stats_widget)
         
-        # Weekly heatmap
+        # Rolling windows
         self.content_layout.addSpacing(20)
-        label = QLabel("📊 Last 7 Days")
+        label = QLabel("📈 Rolling Totals")
         label.setFont(QFont("SF Pro Display", 15, QFont.Weight.Bold))
         self.content_layout.addWidget(label)
         
-        today = datetime.now().date()
+        windows_widget = QWidget()
+        windows_layout = QHBoxLayout(windows_widget)
+        windows_layout.setContentsMargins(0, 0, 0, 0)
+        windows_layout.setSpacing(15)
         
-        for name, info in activities.items():
-            row = QFrame()
-            row.setStyleSheet("""
-                QFrame {
-                    background-color: #1e1e3f;
-                    border-radius: 12px;
-                }
-            """)
-            row.setFixedHeight(60)
+        for days in ROLLING_WINDOWS:
+            card = QFrame()
+            card.setObjectName("tile")
+            card_layout = QVBoxLayout(card)
+            card_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
             
-            row_layout = QHBoxLayout(row)
+            period_lbl = QLabel(f"Last {days} days")
+            period_lbl.setFont(QFont("SF Pro Display", 11))
+            period_lbl.setObjectName("muted")
+            period_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            card_layout.addWidget(period_lbl)
             
-            name_lbl = QLabel(name[:18])
-            name_lbl.setFont(QFont("SF Pro Display", 12))
-            name_lbl.setFixedWidth(160)
-            row_layout.addWidget(name_lbl)
+            val_lbl = QLabel("⏱ —")
+            val_lbl.setFont(QFont("SF Pro Display", 16, QFont.Weight.Bold))
+            val_lbl.setObjectName("accentText")
+            val_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            val_lbl.setProperty("loading", True)
+            card_layout.addWidget(val_lbl)
             
-            dates = info.get("dates", [])
-            for i in range(6, -1, -1):
-                day = (today - timedelta(days=i)).strftime("%Y-%m-%d")
-                is_active = day in dates
-                
-                box = QFrame()
-                box.setFixedSize(32, 32)
-                box.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: {'#00bf63' if is_active else '#2a2a5a'};
-                        border-radius: 6px;
-                    }}
-                """)
-                row_layout.addWidget(box)
+            avg_lbl = QLabel("✅ — check-ins")
+            avg_lbl.setFont(QFont("SF Pro Display", 10))
+            avg_lbl.setObjectName("muted")
+            avg_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            card_layout.addWidget(avg_lbl)
             
-            row_layout.addStretch()
-            self.content_layout.addWidget(row)
+            view["windows"].append((days, val_lbl, avg_lbl))
+            windows_layout.addWidget(card)
+        
+        self.content_layout.addWidget(windows_widget)
+        
+        # Long-range trend, added once every activity's sessions are indexed
+        view["trend"] = QWidget()
+        trend_layout = QVBoxLayout(view["trend"])
+        trend_layout.setContentsMargins(0, 20, 0, 0)
+        trend_layout.setSpacing(12)
+        view["trend"].hide()
+        self.content_layout.addWidget(view["trend"])
+        
+        # Weekly heatmap, a row per activity as its results arrive
+        self.content_layout.addSpacing(20)
+        label = QLabel("📊 Last 7 Days")
+        label.setFont(QFont("SF Pro Display", 15, QFont.Weight.Bold))
+        self.content_layout.addWidget(label)
+        
+        heatmap = QWidget()
+        view["rows"] = QVBoxLayout(heatmap)
+        view["rows"].setContentsMargins(0, 0, 0, 0)
+        view["rows"].setSpacing(12)
+        self.content_layout.addWidget(heatmap)
+        self.content_layout.addStretch()
+        
+        view["worker"] = StatsWorker(view, self.stats_snapshot())
+        view["worker"].signals.totals.connect(self.on_stats_totals)
+        view["worker"].signals.activity.connect(self.on_stats_activity)
+        view["worker"].signals.finished.connect(self.on_stats_finished)
+        self.stats_view = view
+        QThreadPool.globalInstance().start(view["worker"])
+    
+    def stats_snapshot(self):
+        """What StatsWorker reads, copied so it never touches the live data or indexes."""
+        today = self.get_today()
+        day = to_ordinal(today)
+        activities = []
+        for name, info in self.data.get("activities", {}).items():
+            source = info.get("sessions")
+            index = self.session_indexes.get(name)
+            activities.append({
+                "name": name,
+                "dates": tuple(info.get("dates", [])),
+                "frequency": dict(info["frequency"]) if info.get("frequency") else None,
+                "frozen": tuple(info.get("frozen", [])),
+                "schedule": info.get("schedule", EVERY_DAY),
+                "excluded": tuple(info.get("excluded", [])),
+                "longest": info.get("longest", 0),
+                "per": habit_period(info),
+                # Minutes per rolling window when already indexed, else the sessions to index
+                "minutes": None if index is None else [index.minute_totals.window(day - span + 1, day) for span in ROLLING_WINDOWS],
+                "sessions": tuple(source or ()) if index is None else (),
+                "source": source,
+                # Read on the UI thread only, once the worker hands it back
+                "series": None if index is None else index.minute_series,
+            })
+        return {
+            "today": day,
+            "date": datetime.strptime(today, "%Y-%m-%d").date(),
+            "day_start": self.day_start_minute(),
+            "activities": activities,
+        }
+    
+    def adopt_sessions(self, name, index, source, rows):
+        """Keep a session index built off the UI thread, unless its sessions changed meanwhile.
+        
+        rows is the index's persisted list, also built by the worker.
+        """
+        info = self.data.get("activities", {}).get(name)
+        if info is None or name in self.session_indexes or info.get("sessions") is not source:
+            return
+        if index.day_start != self.day_start_minute():
+            return
+        if "sessions" in info:
+            info["sessions"] = rows
+        self.session_indexes[name] = index
+    
+    def on_stats_totals(self, view, totals):
+        if view is not self.stats_view:
+            return
+        for key, value in totals.items():
+            view["cards"][key].setText(str(value))
+            set_state(view["cards"][key], loading=False)
+    
+    def on_stats_activity(self, view, result):
+        if result["index"] is not None:
+            # Worth keeping even if the page it was computed for is gone
+            self.adopt_sessions(result["name"], result["index"], result["source"], result["rows"])
+        if view is not self.stats_view:
+            return
+        name = result["name"]
+        for total, (_, minutes, checkins) in zip(view["totals"], result["windows"]):
+            total[0] += minutes
+            total[1] += checkins
+        week_minutes = result["windows"][0][1]
+        view["week_total"] += week_minutes
+        view["series"].append(result["series"])
+        
+        row = QFrame()
+        row.setObjectName("tile")
+        row.setFixedHeight(60)
+        
+        row_layout = QHBoxLayout(row)
+        
+        name_lbl = QLabel(name[:18])
+        name_lbl.setFont(QFont("SF Pro Display", 12))
+        name_lbl.setFixedWidth(160)
+        row_layout.addWidget(name_lbl)
+        
+        for is_active in result["week"]:
+            box = QFrame()
+            box.setFixedSize(32, 32)
+            box.setObjectName("dayBox")
+            box.setProperty("active", is_active)
+            row_layout.addWidget(box)
+        
+        row_layout.addStretch()
+        
+        week_lbl = QLabel(f"⏱ {format_duration(week_minutes)}")
+        week_lbl.setFont(QFont("SF Pro Display", 11))
+        week_lbl.setObjectName("accentText")
+        week_lbl.setToolTip("Time tracked in the last 7 days")
+        row_layout.addWidget(week_lbl)
+        view["rows"].addWidget(row)
+    
+    def on_stats_finished(self, view):
+        if view is not self.stats_view:
+            return
+        view["cards"]["week"].setText(format_duration(view["week_total"]))
+        set_state(view["cards"]["week"], loading=False)
+        for (days, val_lbl, avg_lbl), (mins, checkins) in zip(view["windows"], view["totals"]):
+            val_lbl.setText(f"⏱ {format_duration(mins)}")
+            set_state(val_lbl, loading=False)
+            avg_lbl.setText(f"✅ {checkins} check-ins · avg {format_duration(mins // days)}/day")
+        
+        series = view["series"]
+        first_days = [one.first_day() for one in series if one.first_day() is not None]
+        if first_days:
+            label = QLabel("📉 Trend")
+            label.setFont(QFont("SF Pro Display", 15, QFont.Weight.Bold))
+            view["trend"].layout().addWidget(label)
+            view["trend"].layout().addWidget(TrendChart(series, min(first_days), to_ordinal(self.get_today())))
+            view["trend"].show()
+    
+    # ==================== SEARCH ====================
+    def show_search(self, query):
+        query = query.strip()
+        if not query:
+            return
+        self.new_page("Search", "Search")
+        
+        index = self.get_search_index()
+        start = time.perf_counter()
+        results = index.search(query, limit=100)
+        elapsed = (time.perf_counter() - start) * 1000
+        
+        summary = QLabel(f"{len(results)} results for “{query}” · {elapsed:.1f} ms across {len(index)} entries")
+        summary.setFont(QFont("SF Pro Display", 12))
+        summary.setObjectName("muted")
+        self.content_layout.addWidget(summary)
+        
+        results_list = QListWidget()
+        results_list.setMinimumHeight(480)
+        results_list.setWordWrap(True)
+        results_list.setStyleSheet("""
+            QListWidget {
+                background-color: transparent;
+                border: none;
+                outline: none;
+            }
+            QListWidget::item {
+                background-color: #1e1e3f;
+                border-radius: 10px;
+                padding: 12px;
+                margin-bottom: 8px;
+                color: white;
+            }
+            QListWidget::item:selected, QListWidget::item:hover {
+                background-color: #2a2a5a;
+            }
+        """)
         
+        for doc_id, title, snippet in results:
+            source = doc_id[0]
+            if source == "note":
+                heading = f"📝 {title or 'Untitled Note'}"
+            elif source == "session":
+                name, key = doc_id[1], doc_id[2]
+                heading = f"⏱ {name} · {key[0]} {format_clock(key[1])}"
+            else:
+                planned = self.get_calendar_index().find(doc_id[1], doc_id[2])
+                heading = f"📅 {doc_id[1]} {planned.get('time', '') if planned else ''}"
+            item = QListWidgetItem(f"{heading}\n{snippet}" if snippet else heading)
+            item.setData(Qt.ItemDataRole.UserRole, doc_id)
+            results_list.addItem(item)
+        
+        results_list.itemClicked.connect(lambda item: self.open_search_result(item.data(Qt.ItemDataRole.UserRole)))
+        self.content_layout.addWidget(results_list)
         self.content_layout.addStretch()
     
+    def open_search_result(self, doc_id):
+        source = doc_id[0]
+        if source == "note":
+            self.open_page("Notes", self.show_notes)
+            self.select_note(doc_id[1])
+        elif source == "session":
+            if self.get_sessions(doc_id[1]).get(doc_id[2]) is not None:
+                self.show_checkin_dialog(doc_id[1], session_key=doc_id[2])
+        else:
+            self.open_page("Calendar", self.show_calendar)
+            self.plan_calendar.setSelectedDate(QDate.fromString(doc_id[1], "yyyy-MM-dd"))
+    
     # ==================== SETTINGS ====================
     def show_settings(self):
-        self.clear_content()
-        self.set_active_nav("Settings")
-        self.header_title.setText("Settings")
+        self.new_page("Settings", "Settings")
         
         # Notifications
         notif_card = QFrame()
@@ -1549,6 +3740,7 @@ class ConsistencyApp(QMainWindow):
                 "evening": evening_input.text() or "20:00"
             }
             self.save_data()
+            self.store.emit(SETTINGS, "reminders")
             self.sent_reminders = {"morning": False, "afternoon": False, "evening": False, "date": self.get_today()}
             self.send_notification("⏰ Reminders Updated", "Your reminder schedule has been saved.")
         
@@ -1558,6 +3750,60 @@ class ConsistencyApp(QMainWindow):
         
         self.content_layout.addWidget(remind_card)
         
+        # Day boundary
+        day_card = QFrame()
+        day_card.setStyleSheet("""
+            QFrame {
+                background-color: #1e1e3f;
+                border-radius: 15px;
+                padding: 20px;
+            }
+        """)
+        day_card_layout = QVBoxLayout(day_card)
+        
+        title_day = QLabel("🌙 Day Boundary")
+        title_day.setFont(QFont("SF Pro Display", 15, QFont.Weight.Bold))
+        day_card_layout.addWidget(title_day)
+        
+        day_hint = QLabel("Check-ins before this time count for the previous day.")
+        day_hint.setFont(QFont("SF Pro Display", 12))
+        day_hint.setObjectName("muted")
+        day_card_layout.addWidget(day_hint)
+        
+        day_row, day_start_input = build_time_row("New day starts at", "day_start")
+        day_start_input.setText(self.data.get("day_start", "00:00"))
+        day_card_layout.addLayout(day_row)
+        
+        save_day_start = QPushButton("Save Day Boundary")
+        save_day_start.setObjectName("primary")
+        save_day_start.setFixedHeight(42)
+        save_day_start.setCursor(Qt.CursorShape.PointingHandCursor)
+        
+        def _save_day_start():
+            raw = day_start_input.text()
+            minute = streak_core.parse_day_start(raw)
+            if minute is None:
+                QMessageBox.warning(
+                    self, "Invalid Day Boundary",
+                    f"\"{raw}\" isn't a time of day. Use HH:MM between 00:00 and 23:59."
+                )
+                return
+            changed = minute != self.day_start_minute()
+            self.data["day_start"] = format_clock(minute)
+            day_start_input.setText(self.data["day_start"])
+            if changed:
+                self.rekey_sessions()
+            self.save_data()
+            self.store.emit(SETTINGS, "day_start")
+            self.store.emit(TODAY)
+            self.sent_reminders = {"morning": False, "afternoon": False, "evening": False, "date": self.get_today()}
+        
+        save_day_start.clicked.connect(_save_day_start)
+        day_card_layout.addSpacing(8)
+        day_card_layout.addWidget(save_day_start)
+        
+        self.content_layout.addWidget(day_card)
+        
         # Data
         data_card = QFrame()
         data_card.setStyleSheet("""
@@ -1586,7 +3832,7 @@ class ConsistencyApp(QMainWindow):
         # About
         about = QLabel("Consistency Tracker v1.0\nBuild streaks. Stay consistent.")
         about.setFont(QFont("SF Pro Display", 12))
-        about.setStyleSheet("color: #8888aa;")
+        about.setObjectName("muted")
         about.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.content_layout.addSpacing(30)
         self.content_layout.addWidget(about)
@@ -1595,9 +3841,7 @@ class ConsistencyApp(QMainWindow):
 
     # ==================== CALENDAR ====================
     def show_calendar(self):
-        self.clear_content()
-        self.set_active_nav("Calendar")
-        self.header_title.setText("Calendar")
+        self.new_page("Calendar", "Calendar")
 
         calendar_card = QFrame()
         calendar_card.setStyleSheet("""
@@ -1614,8 +3858,9 @@ class ConsistencyApp(QMainWindow):
         title.setFont(QFont("SF Pro Display", 16, QFont.Weight.Bold))
         calendar_layout.addWidget(title)
 
-        calendar = QCalendarWidget()
+        calendar = PlanCalendar(self.get_calendar_marks)
         calendar.setGridVisible(True)
+        calendar.setMinimumHeight(320)
         calendar.setStyleSheet("""
             QCalendarWidget QWidget {
                 background-color: #1e1e3f;
@@ -1634,20 +3879,23 @@ class ConsistencyApp(QMainWindow):
         """)
         calendar_layout.addWidget(calendar)
 
-        list_title = QLabel("Planned items (all dates)")
+        list_title = QLabel()
         list_title.setFont(QFont("SF Pro Display", 14, QFont.Weight.Bold))
         calendar_layout.addWidget(list_title)
 
-        items_list = QListWidget()
+        model = CalendarListModel(self.get_calendar_index(), month_of(calendar.selectedDate().toString("yyyy-MM-dd")), calendar_card)
+        items_list = QListView()
+        items_list.setModel(model)
+        items_list.setUniformItemSizes(True)
         items_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: #2a2a5a;
                 border: 2px solid #3a3a6a;
                 border-radius: 10px;
                 padding: 8px;
                 color: white;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #e94560;
             }
         """)
@@ -1675,11 +3923,18 @@ class ConsistencyApp(QMainWindow):
         btn_row.addStretch()
         calendar_layout.addLayout(btn_row)
 
-        row_map = []
+        self.plan_calendar = calendar
 
         def selected_date_key():
             return calendar.selectedDate().toString("yyyy-MM-dd")
 
+        def selected_item():
+            index = items_list.currentIndex()
+            if not index.isValid():
+                return None, None
+            date_key = index.data(CalendarListModel.DateRole)
+            return date_key, self.get_calendar_index().find(date_key, index.data(CalendarListModel.IdRole))
+
         def normalize_time(value):
             try:
                 parts = value.strip().split(":")
@@ -1691,19 +3946,24 @@ class ConsistencyApp(QMainWindow):
             except ValueError:
                 return "00:00"
 
-        def refresh_list():
-            items_list.clear()
-            row_map.clear()
-            calendar_data = self.data.get("calendar", {})
-            for date_key in sorted(calendar_data.keys()):
-                items = calendar_data.get(date_key, [])
-                sorted_indices = sorted(range(len(items)), key=lambda i: items[i].get("time", "00:00"))
-                for idx in sorted_indices:
-                    item = items[idx]
-                    title = item.get("title", "")
-                    time_val = item.get("time", "00:00")
-                    items_list.addItem(f"{date_key} · {time_val} — {title}")
-                    row_map.append((date_key, idx))
+        def show_month():
+            # Only a new month moves the window; within one, scroll to the day
+            date_key = selected_date_key()
+            if month_of(date_key) != model.month:
+                model.set_month(month_of(date_key))
+                list_title.setText(f"Planned items from {calendar.selectedDate().toString('MMMM yyyy')}")
+            row = model.row_for_day(date_key)
+            if row >= 0:
+                items_list.scrollTo(model.index(row), QListView.ScrollHint.PositionAtTop)
+
+        def changed(date_key, item):
+            self.save_data()
+            self.store.emit(CALENDAR, date_key)
+            calendar.updateCells()
+            model.reload()
+            row = model.row_of(item["id"]) if item is not None else -1
+            if row >= 0:
+                items_list.setCurrentIndex(model.index(row))
 
         def add_item():
             date_key = selected_date_key()
@@ -1713,38 +3973,21 @@ class ConsistencyApp(QMainWindow):
             time_text, ok_time = QInputDialog.getText(self, "Add time", "Time (HH:MM)")
             if not ok_time:
                 return
-            time_val = normalize_time(time_text or "00:00")
-            self.data.setdefault("calendar", {}).setdefault(date_key, []).append({
-                "title": text.strip(),
-                "time": time_val
-            })
-            self.save_data()
-            refresh_list()
+            item = {"id": uuid.uuid4().hex, "title": text.strip(), "time": normalize_time(time_text or "00:00")}
+            self.get_calendar_index().add(date_key, item)
+            changed(date_key, item)
 
         def remove_item():
-            selected = items_list.currentRow()
-            if selected < 0 or selected >= len(row_map):
+            date_key, item = selected_item()
+            if item is None:
                 return
-            date_key, idx = row_map[selected]
-            items = self.data.get("calendar", {}).get(date_key, [])
-            if 0 <= idx < len(items):
-                items.pop(idx)
-                if items:
-                    self.data["calendar"][date_key] = items
-                else:
-                    self.data["calendar"].pop(date_key, None)
-                self.save_data()
-                refresh_list()
+            self.get_calendar_index().remove(date_key, item)
+            changed(date_key, None)
 
         def edit_item():
-            selected = items_list.currentRow()
-            if selected < 0 or selected >= len(row_map):
-                return
-            date_key, idx = row_map[selected]
-            items = self.data.get("calendar", {}).get(date_key, [])
-            if not (0 <= idx < len(items)):
+            date_key, item = selected_item()
+            if item is None:
                 return
-            item = items[idx]
             current_title = item.get("title", "")
             current_time = item.get("time", "00:00")
             text, ok = QInputDialog.getText(self, "Edit planned item", "Update item", text=current_title)
@@ -1753,43 +3996,34 @@ class ConsistencyApp(QMainWindow):
             time_text, ok_time = QInputDialog.getText(self, "Edit time", "Time (HH:MM)", text=current_time)
             if not ok_time:
                 return
-            item["title"] = text.strip()
-            item["time"] = normalize_time(time_text or current_time)
-            self.save_data()
-            refresh_list()
+            self.get_calendar_index().update(date_key, item, title=text.strip(), time=normalize_time(time_text or current_time))
+            changed(date_key, item)
 
-        calendar.selectionChanged.connect(refresh_list)
+        calendar.selectionChanged.connect(show_month)
         add_btn.clicked.connect(add_item)
         edit_btn.clicked.connect(edit_item)
         remove_btn.clicked.connect(remove_item)
 
-        refresh_list()
+        list_title.setText(f"Planned items from {calendar.selectedDate().toString('MMMM yyyy')}")
+        show_month()
 
         self.content_layout.addWidget(calendar_card)
         self.content_layout.addStretch()
     
     # ==================== NOTES ====================
     def show_notes(self):
-        self.clear_content()
-        self.set_active_nav("Notes")
-        self.header_title.setText("Notes")
+        self.new_page("Notes", "Notes")
         
         # Main container with splitter
         main_container = QFrame()
-        main_container.setStyleSheet("background-color: transparent;")
         main_layout = QHBoxLayout(main_container)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(15)
         
         # Left panel - Notes list
         left_panel = QFrame()
+        left_panel.setObjectName("panel")
         left_panel.setFixedWidth(280)
-        left_panel.setStyleSheet("""
-            QFrame {
-                background-color: #1e1e3f;
-                border-radius: 15px;
-            }
-        """)
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(15, 15, 15, 15)
         left_layout.setSpacing(10)
@@ -1803,295 +4037,122 @@ class ConsistencyApp(QMainWindow):
         new_btn.clicked.connect(self.create_new_note)
         left_layout.addWidget(new_btn)
         
-        # Notes list
-        self.notes_list = QListWidget()
-        self.notes_list.setStyleSheet("""
-            QListWidget {
-                background-color: transparent;
-                border: none;
-                outline: none;
-            }
-            QListWidget::item {
-                background-color: #2a2a5a;
-                border-radius: 10px;
-                padding: 12px;
-                margin-bottom: 8px;
-                color: white;
-            }
-            QListWidget::item:selected {
-                background-color: #e94560;
-            }
-            QListWidget::item:hover:!selected {
-                background-color: #3a3a6a;
-            }
-        """)
-        self.notes_list.currentRowChanged.connect(self.load_selected_note)
+        # Notes list: newest first, narrowed by the filter box
+        self.notes_model = NoteListModel(self.data.get("notes", []), self)
+        self.notes_proxy = QSortFilterProxyModel(self)
+        self.notes_proxy.setSourceModel(self.notes_model)
+        self.notes_proxy.setFilterRole(NoteListModel.TitleRole)
+        self.notes_proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        
+        self.notes_filter = QLineEdit()
+        self.notes_filter.setPlaceholderText("🔍 Filter notes")
+        self.notes_filter.textChanged.connect(self.notes_proxy.setFilterFixedString)
+        left_layout.addWidget(self.notes_filter)
+        
+        self.notes_list = QListView()
+        self.notes_list.setModel(self.notes_proxy)
+        self.notes_list.setObjectName("notesList")
+        self.notes_list.setUniformItemSizes(True)
+        self.notes_list.selectionModel().currentChanged.connect(
+            lambda current, _: self.load_note(current.data(NoteListModel.IdRole))
+        )
         left_layout.addWidget(self.notes_list)
         
         main_layout.addWidget(left_panel)
         
         # Right panel - Editor
         right_panel = QFrame()
-        right_panel.setStyleSheet("""
-            QFrame {
-                background-color: #1e1e3f;
-                border-radius: 15px;
-            }
-        """)
+        right_panel.setObjectName("panel")
         right_layout = QVBoxLayout(right_panel)
         right_layout.setContentsMargins(20, 20, 20, 20)
         right_layout.setSpacing(15)
         
         # Note title input
         self.note_title_input = QLineEdit()
+        self.note_title_input.setObjectName("noteTitle")
         self.note_title_input.setPlaceholderText("Note title...")
         self.note_title_input.setFixedHeight(50)
         self.note_title_input.setFont(QFont("SF Pro Display", 16, QFont.Weight.Bold))
-        self.note_title_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #2a2a5a;
-                border: 2px solid #3a3a6a;
-                border-radius: 10px;
-                padding: 10px 15px;
-                font-size: 16px;
-            }
-            QLineEdit:focus {
-                border-color: #e94560;
-            }
-        """)
         right_layout.addWidget(self.note_title_input)
         
         # Formatting toolbar
         toolbar = QFrame()
-        toolbar.setStyleSheet("background-color: #2a2a5a; border-radius: 10px;")
+        toolbar.setObjectName("noteToolbar")
         toolbar.setFixedHeight(50)
         toolbar_layout = QHBoxLayout(toolbar)
         toolbar_layout.setContentsMargins(10, 5, 10, 5)
         toolbar_layout.setSpacing(5)
         
-        # Format buttons
-        format_buttons = [
-            ("B", self.toggle_bold, "Bold"),
-            ("I", self.toggle_italic, "Italic"),
-            ("U", self.toggle_underline, "Underline"),
-            ("S", self.toggle_strikethrough, "Strikethrough"),
-        ]
-        
-        for text, callback, tooltip in format_buttons:
+        def add_format_button(text, callback, tooltip, kind):
             btn = QPushButton(text)
+            btn.setObjectName("format")
+            btn.setProperty("kind", kind)
             btn.setFixedSize(35, 35)
             btn.setToolTip(tooltip)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            if text == "B":
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #3a3a6a;
-                        border: none;
-                        border-radius: 8px;
-                        color: white;
-                        font-weight: bold;
-                        font-size: 14px;
-                    }
-                    QPushButton:hover { background-color: #4a4a7a; }
-                    QPushButton:pressed { background-color: #e94560; }
-                """)
-            elif text == "I":
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #3a3a6a;
-                        border: none;
-                        border-radius: 8px;
-                        color: white;
-                        font-style: italic;
-                        font-size: 14px;
-                    }
-                    QPushButton:hover { background-color: #4a4a7a; }
-                    QPushButton:pressed { background-color: #e94560; }
-                """)
-            elif text == "U":
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #3a3a6a;
-                        border: none;
-                        border-radius: 8px;
-                        color: white;
-                        text-decoration: underline;
-                        font-size: 14px;
-                    }
-                    QPushButton:hover { background-color: #4a4a7a; }
-                    QPushButton:pressed { background-color: #e94560; }
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #3a3a6a;
-                        border: none;
-                        border-radius: 8px;
-                        color: white;
-                        font-size: 14px;
-                    }
-                    QPushButton:hover { background-color: #4a4a7a; }
-                    QPushButton:pressed { background-color: #e94560; }
-                """)
             btn.clicked.connect(callback)
             toolbar_layout.addWidget(btn)
         
-        # Separator
-        sep = QFrame()
-        sep.setFixedWidth(2)
-        sep.setStyleSheet("background-color: #4a4a7a;")
-        toolbar_layout.addWidget(sep)
+        def add_separator():
+            sep = QFrame()
+            sep.setObjectName("toolbarSep")
+            sep.setFixedWidth(2)
+            toolbar_layout.addWidget(sep)
+        
+        # Format buttons
+        format_buttons = [
+            ("B", self.toggle_bold, "Bold", "bold"),
+            ("I", self.toggle_italic, "Italic", "italic"),
+            ("U", self.toggle_underline, "Underline", "underline"),
+            ("S", self.toggle_strikethrough, "Strikethrough", "strike"),
+        ]
+        
+        for text, callback, tooltip, kind in format_buttons:
+            add_format_button(text, callback, tooltip, kind)
+        
+        add_separator()
         
         # Heading dropdown
         self.heading_combo = QComboBox()
+        self.heading_combo.setObjectName("heading")
         self.heading_combo.addItems(["Normal", "H1", "H2", "H3"])
         self.heading_combo.setFixedSize(80, 35)
-        self.heading_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #3a3a6a;
-                border: none;
-                border-radius: 8px;
-                padding: 5px 10px;
-                color: white;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid white;
-                margin-right: 5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2a2a5a;
-                border: 1px solid #3a3a6a;
-                selection-background-color: #e94560;
-                color: white;
-            }
-        """)
         self.heading_combo.currentTextChanged.connect(self.apply_heading)
         toolbar_layout.addWidget(self.heading_combo)
         
-        # Separator
-        sep2 = QFrame()
-        sep2.setFixedWidth(2)
-        sep2.setStyleSheet("background-color: #4a4a7a;")
-        toolbar_layout.addWidget(sep2)
+        add_separator()
         
         # Color buttons
-        colors = [
-            ("#ffffff", "White"),
-            ("#e94560", "Red"),
-            ("#00bf63", "Green"),
-            ("#4361ee", "Blue"),
-            ("#ffd166", "Yellow"),
-            ("#9b5de5", "Purple"),
-            ("#4cc9f0", "Cyan"),
-            ("#ff6b35", "Orange"),
-        ]
-        
-        for color, name in colors:
+        for color, name in TEXT_COLORS:
             btn = QPushButton()
+            btn.setObjectName("textColor")
+            btn.setProperty("color", color)
             btn.setFixedSize(25, 25)
             btn.setToolTip(name)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color};
-                    border: 2px solid #4a4a7a;
-                    border-radius: 12px;
-                }}
-                QPushButton:hover {{
-                    border-color: white;
-                }}
-            """)
             btn.clicked.connect(lambda checked, c=color: self.set_text_color(c))
             toolbar_layout.addWidget(btn)
         
         # Custom color picker
-        color_picker_btn = QPushButton("🎨")
-        color_picker_btn.setFixedSize(35, 35)
-        color_picker_btn.setToolTip("Custom Color")
-        color_picker_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        color_picker_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3a3a6a;
-                border: none;
-                border-radius: 8px;
-                font-size: 16px;
-            }
-            QPushButton:hover { background-color: #4a4a7a; }
-        """)
-        color_picker_btn.clicked.connect(self.pick_custom_color)
-        toolbar_layout.addWidget(color_picker_btn)
+        add_format_button("🎨", self.pick_custom_color, "Custom Color", "picker")
         
         toolbar_layout.addStretch()
         
         # List buttons
-        bullet_btn = QPushButton("•")
-        bullet_btn.setFixedSize(35, 35)
-        bullet_btn.setToolTip("Bullet List")
-        bullet_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        bullet_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3a3a6a;
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #4a4a7a; }
-        """)
-        bullet_btn.clicked.connect(self.insert_bullet_list)
-        toolbar_layout.addWidget(bullet_btn)
-        
-        num_btn = QPushButton("1.")
-        num_btn.setFixedSize(35, 35)
-        num_btn.setToolTip("Numbered List")
-        num_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        num_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3a3a6a;
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #4a4a7a; }
-        """)
-        num_btn.clicked.connect(self.insert_numbered_list)
-        toolbar_layout.addWidget(num_btn)
+        add_format_button("•", self.insert_bullet_list, "Bullet List", "bullet")
+        add_format_button("1.", self.insert_numbered_list, "Numbered List", "numbered")
         
         right_layout.addWidget(toolbar)
         
         # Text editor
         self.note_editor = QTextEdit()
+        self.note_editor.setObjectName("noteEditor")
         self.note_editor.setPlaceholderText("Start writing your note...")
-        self.note_editor.setStyleSheet("""
-            QTextEdit {
-                background-color: #2a2a5a;
-                border: 2px solid #3a3a6a;
-                border-radius: 10px;
-                padding: 15px;
-                font-size: 14px;
-                color: white;
-                selection-background-color: #e94560;
-            }
-            QTextEdit:focus {
-                border-color: #e94560;
-            }
-        """)
         self.note_editor.setFont(QFont("SF Pro Display", 14))
         right_layout.addWidget(self.note_editor)
         
         # Action buttons
         action_bar = QFrame()
-        action_bar.setStyleSheet("background-color: transparent;")
         action_layout = QHBoxLayout(action_bar)
         action_layout.setContentsMargins(0, 0, 0, 0)
         action_layout.setSpacing(10)
@@ -2099,37 +4160,19 @@ class ConsistencyApp(QMainWindow):
         # Note color selector
         note_color_label = QLabel("Note Color:")
         note_color_label.setFont(QFont("SF Pro Display", 12))
-        note_color_label.setStyleSheet("color: #8888aa;")
+        note_color_label.setObjectName("muted")
         action_layout.addWidget(note_color_label)
         
-        note_colors = [
-            ("#e94560", "Red"),
-            ("#4361ee", "Blue"),
-            ("#00bf63", "Green"),
-            ("#ffd166", "Yellow"),
-            ("#9b5de5", "Purple"),
-            ("#4cc9f0", "Cyan"),
-        ]
-        
         self.selected_note_color = "#e94560"
         self.note_color_buttons = []
         
-        for color, name in note_colors:
+        for color, name in NOTE_COLORS:
             btn = QPushButton()
             btn.setFixedSize(30, 30)
             btn.setToolTip(name)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
+            btn.setObjectName("noteColor")
             btn.setProperty("color", color)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color};
-                    border: 3px solid transparent;
-                    border-radius: 15px;
-                }}
-                QPushButton:hover {{
-                    border-color: white;
-                }}
-            """)
             btn.clicked.connect(lambda checked, c=color, b=btn: self.select_note_color(c, b))
             action_layout.addWidget(btn)
             self.note_color_buttons.append(btn)
@@ -2147,21 +4190,10 @@ class ConsistencyApp(QMainWindow):
         
         # Delete button
         delete_btn = QPushButton("🗑️ Delete")
+        delete_btn.setObjectName("noteDelete")
         delete_btn.setFixedSize(100, 45)
         delete_btn.setFont(QFont("SF Pro Display", 13))
         delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2a2a5a;
-                border: 2px solid #3a3a6a;
-                border-radius: 12px;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #ff4757;
-                border-color: #ff4757;
-            }
-        """)
         delete_btn.clicked.connect(self.delete_current_note)
         action_layout.addWidget(delete_btn)
         
@@ -2172,67 +4204,40 @@ class ConsistencyApp(QMainWindow):
         self.content_layout.addWidget(main_container)
         
         # Track current note
-        self.current_note_index = -1
-        
-        # Load notes list
-        self.refresh_notes_list()
+        self.current_note_id = None
     
-    def refresh_notes_list(self):
-        self.notes_list.clear()
-        notes = self.data.get("notes", [])
-        
-        for i, note in enumerate(notes):
-            title = note.get("title", "Untitled")
-            color = note.get("color", "#e94560")
-            date = note.get("updated", note.get("created", ""))
-            
-            item = QListWidgetItem(f"{title}\n📅 {date[:10] if date else 'No date'}")
-            item.setData(Qt.ItemDataRole.UserRole, i)
-            self.notes_list.addItem(item)
+    def select_note(self, note_id):
+        """Make note_id the current row (clearing a filter that hides it), which loads it."""
+        row = self.notes_model.row_of(note_id)
+        if row < 0:
+            return
+        index = self.notes_proxy.mapFromSource(self.notes_model.index(row))
+        if not index.isValid():
+            self.notes_filter.clear()
+            index = self.notes_proxy.mapFromSource(self.notes_model.index(row))
+        self.notes_list.setCurrentIndex(index)
     
     def create_new_note(self):
-        self.current_note_index = -1
+        self.current_note_id = None
+        self.notes_list.setCurrentIndex(QModelIndex())
         self.note_title_input.clear()
         self.note_editor.clear()
         self.selected_note_color = "#e94560"
         self.note_title_input.setFocus()
     
-    def load_selected_note(self, row):
-        if row < 0:
-            return
-        
-        notes = self.data.get("notes", [])
-        if row >= len(notes):
+    def load_note(self, note_id):
+        note = self.notes_model.note(note_id)
+        if note is None:
             return
         
-        note = notes[row]
-        self.current_note_index = row
+        self.current_note_id = note_id
         self.note_title_input.setText(note.get("title", ""))
         self.note_editor.setHtml(note.get("content", ""))
         self.selected_note_color = note.get("color", "#e94560")
         
         # Update color button selection
         for btn in self.note_color_buttons:
-            if btn.property("color") == self.selected_note_color:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {self.selected_note_color};
-                        border: 3px solid white;
-                        border-radius: 15px;
-                    }}
-                """)
-            else:
-                color = btn.property("color")
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {color};
-                        border: 3px solid transparent;
-                        border-radius: 15px;
-                    }}
-                    QPushButton:hover {{
-                        border-color: white;
-                    }}
-                """)
+            set_state(btn, selected=btn.property("color") == self.selected_note_color)
     
     def save_current_note(self):
         title = self.note_title_input.text().strip()
@@ -2245,6 +4250,8 @@ class ConsistencyApp(QMainWindow):
         note_data = {
             "title": title,
             "content": content,
+            # Plain text is extracted here once so search never parses the HTML
+            "text": self.note_editor.toPlainText(),
             "color": self.selected_note_color,
             "updated": now
         }
@@ -2252,26 +4259,30 @@ class ConsistencyApp(QMainWindow):
         if "notes" not in self.data:
             self.data["notes"] = []
         
-        if self.current_note_index >= 0 and self.current_note_index < len(self.data["notes"]):
-            # Update existing note
-            note_data["created"] = self.data["notes"][self.current_note_index].get("created", now)
-            self.data["notes"][self.current_note_index] = note_data
+        previous = self.notes_model.note(self.current_note_id)
+        if previous is not None:
+            # Update existing note in place; the list row follows by id
+            note_data["created"] = previous.get("created", now)
+            previous.update(note_data)
+            note_data = previous
         else:
             # Create new note
             note_data["created"] = now
+            note_data["id"] = uuid.uuid4().hex
             self.data["notes"].insert(0, note_data)
-            self.current_note_index = 0
         
         self.save_data()
-        self.refresh_notes_list()
+        self.store.emit(NOTE, note_data["id"])
         self.send_notification("📝 Note Saved!", title)
         
         # Select the saved note
-        if self.current_note_index >= 0:
-            self.notes_list.setCurrentRow(self.current_note_index)
+        if self.current_note_id != note_data["id"]:
+            self.current_note_id = note_data["id"]
+            self.select_note(note_data["id"])
     
     def delete_current_note(self):
-        if self.current_note_index < 0:
+        note = self.notes_model.note(self.current_note_id)
+        if note is None:
             return
         
         reply = QMessageBox.question(
@@ -2281,37 +4292,18 @@ class ConsistencyApp(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            if self.current_note_index < len(self.data.get("notes", [])):
-                del self.data["notes"][self.current_note_index]
-                self.save_data()
-                self.current_note_index = -1
-                self.note_title_input.clear()
-                self.note_editor.clear()
-                self.refresh_notes_list()
+            self.data["notes"].remove(note)
+            self.save_data()
+            self.current_note_id = None
+            self.notes_list.setCurrentIndex(QModelIndex())
+            self.note_title_input.clear()
+            self.note_editor.clear()
+            self.store.emit(NOTE, note["id"])
     
     def select_note_color(self, color, button):
         self.selected_note_color = color
         for btn in self.note_color_buttons:
-            btn_color = btn.property("color")
-            if btn == button:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {btn_color};
-                        border: 3px solid white;
-                        border-radius: 15px;
-                    }}
-                """)
-            else:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {btn_color};
-                        border: 3px solid transparent;
-                        border-radius: 15px;
-                    }}
-                    QPushButton:hover {{
-                        border-color: white;
-                    }}
-                """)
+            set_state(btn, selected=btn == button)
     
     # Text formatting methods
     def toggle_bold(self):
@@ -2391,17 +4383,21 @@ class ConsistencyApp(QMainWindow):
         
         if self.sent_reminders["date"] != today:
             self.sent_reminders = {"morning": False, "afternoon": False, "evening": False, "date": today}
+            # Past midnight (or the day boundary): statuses and today's totals all move
+            self.store.emit(TODAY)
         
         reminders = self.data.get("reminders", {})
         if not reminders.get("enabled", True):
             return
 
-        checked_in = any(
-            today in info.get("dates", [])
-            for info in self.data.get("activities", {}).values()
+        checked_in = self.day_index.any_on(to_ordinal(today))
+        # Weekly/monthly habits that are on track don't need a nudge today
+        due = any(
+            self.get_status(name)[0] in ("at_risk", "start")
+            for name in self.data.get("activities", {})
         )
         
-        if checked_in or not self.data.get("activities"):
+        if checked_in or not due:
             return
         
         times = reminders.get("times", {})
@@ -10,6 +10,8 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+import streak_core
+
 DATA_FILE = Path.home() / ".consistency_tracker_data.json"
 
 def send_notification(title, message):
@@ -36,7 +38,7 @@ def load_data():
 
 def get_today():
     """Get today's date as string."""
-    return datetime.now().strftime("%Y-%m-%d")
+    return streak_core.day_key()
 
 
 def check_pending_activities():
@@ -59,7 +61,10 @@ def get_total_streak(data):
     """Get the maximum current streak."""
     if not data or not data.get("activities"):
         return 0
-    return max((a["current_streak"] for a in data["activities"]), default=0)
+    return max(
+        (streak_core.get_streak(a.get("checked_in_dates", []), a.get("frozen", [])) for a in data["activities"]),
+        default=0
+    )
 
 
 def main():
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+🔎 Full-text search for Consistency Tracker.
+An inverted index over notes, session notes and calendar items, updated as
+they change so a query never re-reads (or re-parses) the stored text.
+"""
+
+import math
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from html.parser import HTMLParser
+
+TOKEN = re.compile(r"\w+")
+TITLE_WEIGHT = 3
+SNIPPET_LENGTH = 90
+
+
+def tokenize(text):
+    return TOKEN.findall(text.lower())
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("style", "script", "head"):
+            self._skip += 1
+        elif tag in ("p", "br", "li", "div", "h1", "h2", "h3"):
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in ("style", "script", "head") and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.parts.append(data)
+
+
+def html_to_text(html):
+    """Plain text of a Qt rich-text document, for notes saved before "text" was stored."""
+    extractor = _TextExtractor()
+    extractor.feed(html or "")
+    return " ".join("".join(extractor.parts).split())
+
+
+class SearchIndex:
+    """Inverted index from token to {doc id: weighted term count}.
+
+    Doc ids are tuples whose first item names the source ("note",
+    "session", "calendar"). Tokens are kept in a sorted list too, so every
+    query word matches as a prefix with a bisect. Results must match all
+    query words and are ranked by tf-idf, title hits counting extra.
+    Each proper prefix of a doc id maps to the docs under it, so dropping a
+    day's plans or an activity's sessions doesn't scan the whole index.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._tokens = []
+        self._docs = {}
+        self._groups = {}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, doc_id):
+        return doc_id in self._docs
+
+    def set(self, doc_id, text, title=""):
+        """Index (or re-index) a document's title and plain text."""
+        self.discard(doc_id)
+        counts = Counter(tokenize(text))
+        for token in tokenize(title):
+            counts[token] += TITLE_WEIGHT
+        if not counts:
+            return
+        for token, count in counts.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = {}
+                insort(self._tokens, token)
+            posting[doc_id] = count
+        snippet = " ".join(text.split())
+        if len(snippet) > SNIPPET_LENGTH:
+            snippet = snippet[:SNIPPET_LENGTH].rsplit(" ", 1)[0] + "…"
+        self._docs[doc_id] = (title, snippet, tuple(counts))
+        for end in range(1, len(doc_id)):
+            self._groups.setdefault(doc_id[:end], set()).add(doc_id)
+
+    def discard(self, doc_id):
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for end in range(1, len(doc_id)):
+            group = self._groups[doc_id[:end]]
+            group.discard(doc_id)
+            if not group:
+                del self._groups[doc_id[:end]]
+        for token in doc[2]:
+            posting = self._postings[token]
+            del posting[doc_id]
+            if not posting:
+                del self._postings[token]
+                del self._tokens[bisect_left(self._tokens, token)]
+
+    def discard_where(self, *prefix):
+        """Drop every doc whose id starts with prefix, e.g. ("session", name)."""
+        for doc_id in list(self._groups.get(prefix, ())):
+            self.discard(doc_id)
+
+    def _expand(self, word):
+        """Tokens starting with word."""
+        i = bisect_left(self._tokens, word)
+        matches = []
+        while i < len(self._tokens) and self._tokens[i].startswith(word):
+            matches.append(self._tokens[i])
+            i += 1
+        return matches
+
+    def search(self, query, limit=50):
+        """[(doc id, title, snippet)] best first for docs matching every query word."""
+        words = tokenize(query)
+        if not words:
+            return []
+        total = len(self._docs)
+        scores = None
+        for word in sorted(set(words), key=len, reverse=True):
+            word_scores = {}
+            for token in self._expand(word):
+                posting = self._postings[token]
+                idf = math.log(1 + total / len(posting))
+                # Whole-word hits outrank longer words that merely share the prefix
+                boost = 1.0 if token == word else 0.6
+                for doc_id, count in posting.items():
+                    score = (1 + math.log(count)) * idf * boost
+                    if score > word_scores.get(doc_id, 0):
+                        word_scores[doc_id] = score
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {doc_id: score + word_scores[doc_id] for doc_id, score in scores.items() if doc_id in word_scores}
+            if not scores:
+                return []
+        best = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(doc_id, *self._docs[doc_id][:2]) for doc_id, _ in best]
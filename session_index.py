@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+📋 Session indexes for Consistency Tracker.
+Keeps an activity's sessions keyed by day and start time so lookups don't scan lists.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from itertools import compress
+
+from streak_core import DayTotals, from_ordinal, to_ordinal
+from time_series import MinuteSeries
+
+
+class SessionAggregates:
+    """Running totals over an activity's sessions; add() and remove() are O(1)."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_minutes = 0
+        self.total_mood = 0
+
+    @property
+    def avg_minutes(self):
+        return self.total_minutes // self.count if self.count else 0
+
+    @property
+    def avg_mood(self):
+        return self.total_mood / self.count if self.count else 3
+
+    def add(self, session):
+        self.count += 1
+        self.total_minutes += session.get("minutes", 0)
+        self.total_mood += session.get("mood", 3)
+
+    def remove(self, session):
+        self.count -= 1
+        self.total_minutes -= session.get("minutes", 0)
+        self.total_mood -= session.get("mood", 3)
+
+
+def parse_clock(value, default=0):
+    """Minutes after midnight for an HH:MM string."""
+    try:
+        hours, minutes = (int(part) for part in str(value).split(":"))
+    except ValueError:
+        return default
+    return max(0, min(23, hours)) * 60 + max(0, min(59, minutes))
+
+
+def format_clock(minute):
+    """HH:MM for a minute of the day; minutes past midnight of the next day wrap."""
+    minute %= 1440
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def day_minute(clock, day_start=0):
+    """Minute of the logical day for a wall-clock minute.
+
+    A day runs from day_start to day_start the next morning, so clock
+    times before the boundary come 1440 minutes later in it.
+    """
+    return clock + 1440 if clock < day_start else clock
+
+
+def session_start(session, day_start=0):
+    """Start minute of a session in its logical day; older entries only logged when they were saved."""
+    if session.get("start"):
+        return day_minute(parse_clock(session["start"]), day_start)
+    if session.get("time"):
+        return max(day_minute(parse_clock(session["time"]), day_start) - session.get("minutes", 0), day_start)
+    return day_start
+
+
+NO_CLOCK = 0xFFFF
+
+
+class SessionColumns:
+    """Columnar store for an activity's sessions.
+
+    One typed array per field instead of a dict per session: day ordinals
+    ('i', 0 when undated), minutes and start/logged minute-of-day ('H',
+    NO_CLOCK when absent), mood ('b') and an offset table into one UTF-8
+    notes buffer. Anything else a session carries (the "ts" stamp, keys
+    from older versions) lives in a sparse per-row dict. Rows are only
+    appended; discard() marks a row dead so analytics skip it.
+    """
+
+    def __init__(self):
+        self.days = array("i")
+        self.minutes = array("H")
+        self.moods = array("b")
+        self.starts = array("H")
+        self.times = array("H")
+        self.note_offsets = array("I", [0])
+        self.notes = bytearray()
+        self.live = bytearray()
+        self.extras = {}
+
+    def __len__(self):
+        return len(self.days)
+
+    @classmethod
+    def from_sessions(cls, sessions):
+        columns = cls()
+        return columns, [columns.append(session) for session in sessions]
+
+    def append(self, session):
+        """Copy a session mapping into the columns and return its row façade."""
+        if isinstance(session, SessionRow) and session._columns is self:
+            return session
+        row = len(self.days)
+        day = session.get("date")
+        self.days.append(to_ordinal(day) if day else 0)
+        self.minutes.append(max(0, min(int(session.get("minutes", 0)), NO_CLOCK - 1)))
+        self.moods.append(max(-128, min(int(session.get("mood", 3)), 127)))
+        extra = {key: value for key, value in session.items() if key not in SessionRow.FIELDS}
+        for key, column in (("start", self.starts), ("time", self.times)):
+            value = session.get(key)
+            minute = parse_clock(value) if value else NO_CLOCK
+            if value and format_clock(minute) != value:
+                # Not an HH:MM clock; keep the original text
+                extra[key] = value
+                minute = NO_CLOCK
+            column.append(minute)
+        self.notes += (session.get("note") or "").encode("utf-8")
+        self.note_offsets.append(len(self.notes))
+        self.live.append(1)
+        if extra:
+            self.extras[row] = extra
+        return SessionRow(self, row)
+
+    def discard(self, row):
+        self.live[row] = 0
+
+    def note(self, row):
+        return self.notes[self.note_offsets[row]:self.note_offsets[row + 1]].decode("utf-8")
+
+    def total_minutes(self):
+        return sum(compress(self.minutes, self.live))
+
+    def average_mood(self):
+        count = sum(self.live)
+        return sum(compress(self.moods, self.live)) / count if count else 3
+
+    def nbytes(self):
+        """Bytes held by the column buffers (excluding the sparse extras)."""
+        arrays = (self.days, self.minutes, self.moods, self.starts, self.times, self.note_offsets)
+        return sum(len(column) * column.itemsize for column in arrays) + len(self.notes) + len(self.live)
+
+
+class SessionRow(Mapping):
+    """Read-only dict-like view of one row of a SessionColumns store."""
+
+    __slots__ = ("_columns", "_row")
+    FIELDS = ("date", "start", "minutes", "note", "mood", "time")
+
+    def __init__(self, columns, row):
+        self._columns = columns
+        self._row = row
+
+    def __getitem__(self, key):
+        columns, row = self._columns, self._row
+        if key == "date" and columns.days[row]:
+            return from_ordinal(columns.days[row])
+        if key == "minutes":
+            return columns.minutes[row]
+        if key == "mood":
+            return columns.moods[row]
+        if key == "note":
+            return columns.note(row)
+        if key == "start" and columns.starts[row] != NO_CLOCK:
+            return format_clock(columns.starts[row])
+        if key == "time" and columns.times[row] != NO_CLOCK:
+            return format_clock(columns.times[row])
+        extra = columns.extras.get(row)
+        if extra is not None and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        columns, row = self._columns, self._row
+        if columns.days[row]:
+            yield "date"
+        if columns.starts[row] != NO_CLOCK:
+            yield "start"
+        yield "minutes"
+        yield "note"
+        yield "mood"
+        if columns.times[row] != NO_CLOCK:
+            yield "time"
+        yield from columns.extras.get(self._row, ())
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"SessionRow({dict(self)!r})"
+
+
+def json_default(value):
+    """json.dump default= hook that writes session rows as plain objects."""
+    if isinstance(value, SessionRow):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class SessionIndex:
+    """Timed sessions of one activity, several per day allowed.
+
+    Sessions are keyed by (day, start minute) and the keys are kept sorted,
+    which also orders them as intervals on an absolute minute axis
+    (day ordinal * 1440 + start). Overlap checks and "time spent in
+    range" queries are binary searches over those intervals; per-day
+    totals, a DayTotals tree of minutes per day, the chart buckets in
+    minute_series and stats are updated incrementally. The persisted newest-first
+    list is only rebuilt (via sessions()) when sessions were added or
+    removed, which dirty records.
+
+    Sessions are held as SessionRow views over a SessionColumns store, so
+    callers keep using session["minutes"] / session.get("note") while the
+    data itself lives in typed arrays.
+
+    Start minutes count from the midnight opening the session's logical
+    day, so with a day_start boundary a session after midnight but before
+    it is keyed past 1440 and lands after the evening ones.
+    """
+
+    def __init__(self, sessions=(), day_start=0):
+        self.day_start = day_start
+        self._by_key = {}
+        self._row_keys = {}
+        self._keys = []
+        self._abs_starts = []
+        self._abs_ends = []
+        self._day_minutes = {}
+        self._day_counts = {}
+        self._undated = []
+        self.stats = SessionAggregates()
+        self.columns = SessionColumns()
+        for session in sessions:
+            session = self.columns.append(session)
+            day = session.get("date")
+            if not day:
+                self._undated.append(session)
+                self.stats.add(session)
+                continue
+            start = session_start(session, day_start)
+            while (day, start) in self._by_key:
+                start += 1
+            self._store((day, start), session, keep_order=False)
+        order = sorted(range(len(self._keys)), key=self._keys.__getitem__)
+        self._keys = [self._keys[i] for i in order]
+        self._abs_starts = [self._abs_starts[i] for i in order]
+        self._abs_ends = [self._abs_ends[i] for i in order]
+        self.minute_totals = DayTotals((to_ordinal(day), minutes) for day, minutes in self._day_minutes.items())
+        self.minute_series = MinuteSeries()
+        for day, minutes in self._day_minutes.items():
+            self.minute_series.add(to_ordinal(day), minutes)
+        self.dirty = False
+
+    def __len__(self):
+        return len(self._keys) + len(self._undated)
+
+    def __contains__(self, day):
+        return day in self._day_counts
+
+    @staticmethod
+    def interval(day, start, minutes):
+        """Absolute [start, end) minutes of a session; empty sessions still occupy a minute."""
+        begin = to_ordinal(day) * 1440 + start
+        return begin, begin + max(minutes, 1)
+
+    def _store(self, key, session, keep_order=True):
+        begin, end = self.interval(key[0], key[1], session.get("minutes", 0))
+        if keep_order:
+            i = bisect_left(self._keys, key)
+            self._keys.insert(i, key)
+            self._abs_starts.insert(i, begin)
+            self._abs_ends.insert(i, end)
+            self.minute_totals.add(to_ordinal(key[0]), session.get("minutes", 0))
+            self.minute_series.add(to_ordinal(key[0]), session.get("minutes", 0))
+        else:
+            # __init__ builds the minutes tree and series in one pass afterwards
+            self._keys.append(key)
+            self._abs_starts.append(begin)
+            self._abs_ends.append(end)
+        self._by_key[key] = session
+        self._row_keys[session._row] = key
+        day = key[0]
+        self._day_minutes[day] = self._day_minutes.get(day, 0) + session.get("minutes", 0)
+        self._day_counts[day] = self._day_counts.get(day, 0) + 1
+        self.stats.add(session)
+
+    def _drop(self, key):
+        session = self._by_key.pop(key)
+        del self._row_keys[session._row]
+        i = bisect_left(self._keys, key)
+        del self._keys[i]
+        del self._abs_starts[i]
+        del self._abs_ends[i]
+        day = key[0]
+        self.minute_totals.add(to_ordinal(day), -session.get("minutes", 0))
+        self.minute_series.add(to_ordinal(day), -session.get("minutes", 0))
+        self._day_minutes[day] -= session.get("minutes", 0)
+        self._day_counts[day] -= 1
+        if not self._day_counts[day]:
+            del self._day_counts[day]
+            del self._day_minutes[day]
+        self.stats.remove(session)
+        return session
+
+    def key_of(self, session):
+        """(day, start minute) key a stored session is filed under."""
+        key = self._row_keys.get(getattr(session, "_row", None))
+        if key is not None:
+            return key
+        return session.get("date"), session_start(session, self.day_start)
+
+    def get(self, key):
+        return self._by_key.get(key)
+
+    def day_sessions(self, day):
+        """Sessions on a day, earliest first."""
+        i = bisect_left(self._keys, (day, -1))
+        j = bisect_left(self._keys, (day, 1440 * 2))
+        return [self._by_key[key] for key in self._keys[i:j]]
+
+    def day_minutes(self, day):
+        return self._day_minutes.get(day, 0)
+
+    def conflict(self, day, start, minutes, ignore=None):
+        """Return the stored session overlapping a proposed one, or None."""
+        begin, end = self.interval(day, start, minutes)
+        i = bisect_left(self._abs_starts, end)
+        # Intervals never overlap each other, so only the one before end can
+        for j in (i - 1, i - 2):
+            if j < 0 or self._keys[j] == ignore:
+                continue
+            if self._abs_ends[j] > begin and self._abs_starts[j] < end:
+                return self._by_key[self._keys[j]]
+        return None
+
+    def add(self, session, replace=None):
+        """Store a session (replacing the one at key replace), returning its key.
+
+        Like __init__, a start already taken that day is moved on a minute
+        at a time, so the returned key may differ from the session's start.
+        """
+        if replace is not None and replace in self._by_key:
+            self.columns.discard(self._drop(replace)._row)
+        session = self.columns.append(session)
+        day, start = session["date"], session_start(session, self.day_start)
+        while (day, start) in self._by_key:
+            start += 1
+        key = (day, start)
+        self._store(key, session)
+        self.dirty = True
+        return key
+
+    def delete(self, key):
+        if key not in self._by_key:
+            return
+        self.columns.discard(self._drop(key)._row)
+        self.dirty = True
+
+    def delete_day(self, day):
+        for session in self.day_sessions(day):
+            self.delete(self.key_of(session))
+
+    def span(self, first_day=None, last_day=None):
+        """(lo, hi) sorted positions of the sessions dated first_day..last_day."""
+        lo = bisect_left(self._keys, (first_day, -1)) if first_day else 0
+        hi = self.count_through(last_day) if last_day else len(self._keys)
+        return lo, max(lo, hi)
+
+    def count_through(self, day):
+        """Number of dated sessions on or before day."""
+        return bisect_left(self._keys, (day, 1440 * 2))
+
+    def key_at(self, position):
+        """Key of the session at a sorted position (0 is the oldest)."""
+        return self._keys[position]
+
+    def newest(self, offset=0, limit=None):
+        """Sessions newest first, skipping offset and returning at most limit."""
+        end = len(self._keys) - offset
+        start = 0 if limit is None else max(end - limit, 0)
+        return [self._by_key[key] for key in reversed(self._keys[start:max(end, 0)])]
+
+    def sessions(self):
+        """Newest-first list for persisting under activity["sessions"]."""
+        return self.newest() + self._undated
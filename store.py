@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+🔔 Change tracking for Consistency Tracker.
+Mutations announce what they touched as typed Change events; views subscribe
+to the topics they show and cached values recompute only after a change to
+something they actually read.
+"""
+
+from collections import namedtuple
+
+# Topics a change can touch; the key narrows it to one activity, note or day
+ACTIVITY = "activity"    # activity name: added, deleted or restyled
+CHECKINS = "checkins"    # activity name: check-in days or sessions
+GOAL = "goal"            # activity name: frequency or schedule
+NOTE = "note"            # note id: saved or deleted
+CALENDAR = "calendar"    # date key: planned items
+BADGE = "badge"          # badge key: earned
+SETTINGS = "settings"    # setting name: reminders, day start
+TODAY = "today"          # no key: the current day rolled over or moved
+
+
+class Change(namedtuple("Change", "topic key")):
+    """One thing a mutation touched; a key of None means the whole topic."""
+    __slots__ = ()
+
+
+class Derived:
+    """A value computed from the data and cached until a change it read.
+
+    While compute runs, every store.read() (and every other Derived it
+    gets) is recorded as a dependency; an emit() matching one of them marks
+    the value stale and the next get() recomputes it.
+    """
+
+    __slots__ = ("_store", "_compute", "_value", "_deps", "stale")
+
+    def __init__(self, store, compute):
+        self._store = store
+        self._compute = compute
+        self._value = None
+        self._deps = frozenset()
+        self.stale = True
+
+    def get(self):
+        store = self._store
+        if self.stale:
+            store._reading.append(set())
+            try:
+                self._value = self._compute()
+            finally:
+                deps = store._reading.pop()
+            self._deps = frozenset(deps)
+            store._track(self)
+            self.stale = False
+        if store._reading:
+            # Whatever is computing from this value depends on what it read
+            store._reading[-1].update(self._deps)
+        return self._value
+
+    def invalidate(self):
+        if not self.stale:
+            self._store._untrack(self)
+            self.stale = True
+            self._value = None
+
+
+class Store:
+    """Change events and dependency tracking over a frontend's data dict.
+
+    emit(topic, key) marks derived values that read it stale at once, and
+    hands the change to subscribers: immediately, or once at commit when a
+    Batch is open, with repeated changes merged.
+    """
+
+    def __init__(self, batch=None):
+        self._batch = batch
+        self._subscribers = []
+        self._dependents = {}
+        self._reading = []
+        self._pending = {}
+        if batch is not None:
+            batch.on_rollback(self.discard_pending)
+
+    def subscribe(self, callback, *topics):
+        """Call callback(changes) after changes to any of topics (every topic if none)."""
+        self._subscribers.append((frozenset(topics), callback))
+
+    def unsubscribe(self, callback):
+        self._subscribers = [(topics, other) for topics, other in self._subscribers if other != callback]
+
+    def derived(self, compute):
+        return Derived(self, compute)
+
+    def read(self, topic, key=None):
+        """Note that the value being computed depends on topic (one key, or all of it)."""
+        if self._reading:
+            self._reading[-1].add((topic, key))
+
+    def _track(self, derived):
+        for topic, key in derived._deps:
+            self._dependents.setdefault(topic, {}).setdefault(key, set()).add(derived)
+
+    def _untrack(self, derived):
+        for topic, key in derived._deps:
+            dependents = self._dependents[topic][key]
+            dependents.discard(derived)
+            if not dependents:
+                del self._dependents[topic][key]
+                if not self._dependents[topic]:
+                    del self._dependents[topic]
+
+    def invalidate(self, topic, key=None):
+        """Mark values that read topic/key stale without telling subscribers."""
+        by_key = self._dependents.get(topic)
+        if not by_key:
+            return
+        if key is None:
+            stale = [derived for dependents in by_key.values() for derived in dependents]
+        else:
+            stale = list(by_key.get(key, ())) + list(by_key.get(None, ()))
+        for derived in stale:
+            derived.invalidate()
+
+    def emit(self, topic, key=None):
+        self.invalidate(topic, key)
+        self._pending[Change(topic, key)] = None
+        if self._batch is not None and self._batch.active:
+            self._batch.after(self.flush)
+        else:
+            self.flush()
+
+    def flush(self):
+        changes, self._pending = list(self._pending), {}
+        for topics, callback in list(self._subscribers):
+            matching = [change for change in changes if not topics or change.topic in topics]
+            if matching:
+                callback(matching)
+
+    def discard_pending(self):
+        """Forget changes not yet handed to subscribers, e.g. from a rolled-back batch."""
+        self._pending = {}
+
+    def reset(self):
+        """Drop pending changes and every cached value, e.g. after a rollback."""
+        self._pending = {}
+        for by_key in list(self._dependents.values()):
+            for dependents in list(by_key.values()):
+                for derived in list(dependents):
+                    derived.invalidate()
@@ -0,0 +1,526 @@
+#!/usr/bin/env python3
+"""
+🔥 Streak engine for Consistency Tracker.
+Pure date arithmetic - no UI imports, safe to use from any frontend.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+
+
+def to_ordinal(date_str):
+    """Convert a YYYY-MM-DD string to a day ordinal."""
+    return date.fromisoformat(date_str).toordinal()
+
+
+def from_ordinal(ordinal):
+    """Convert a day ordinal back to a YYYY-MM-DD string."""
+    return date.fromordinal(ordinal).isoformat()
+
+
+def parse_day_start(day_start):
+    """Minutes after midnight for an HH:MM day boundary, or None if it isn't one."""
+    try:
+        hours, minutes = (int(part) for part in str(day_start).split(":"))
+    except ValueError:
+        return None
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        return None
+    return hours * 60 + minutes
+
+
+def day_start_minutes(day_start):
+    """Parse an HH:MM day boundary into minutes after midnight (0 if invalid)."""
+    return parse_day_start(day_start) or 0
+
+
+def day_key(moment=None, day_start="00:00"):
+    """Return the YYYY-MM-DD day a moment belongs to.
+
+    The moment is taken in its own (local) timezone and shifted back by the
+    day boundary, so with day_start="04:00" a 00:30 session counts for the
+    previous day. Keys are meant to be computed once, when a check-in is
+    written, and stored alongside it.
+    """
+    moment = moment or datetime.now().astimezone()
+    shifted = moment - timedelta(minutes=day_start_minutes(day_start))
+    return shifted.date().isoformat()
+
+
+def get_streak(dates, frozen=(), today=None):
+    """Calculate the current streak from check-in dates.
+
+    Frozen days bridge gaps in the chain but do not add to the count.
+    Today is still open, so a streak ending yesterday is kept alive.
+    """
+    if not dates:
+        return 0
+    # Hash the ISO strings as-is; only days inside the streak get formatted
+    active = set(dates)
+    bridged = set(frozen)
+    day = (today or date.today()).toordinal()
+    key = from_ordinal(day)
+    if key not in active and key not in bridged:
+        day -= 1
+        key = from_ordinal(day)
+
+    streak = 0
+    while True:
+        if key in active:
+            streak += 1
+        elif key not in bridged:
+            break
+        day -= 1
+        key = from_ordinal(day)
+    return streak
+
+
+def spend_freeze_tokens(dates, frozen, tokens, today=None):
+    """Return the missed days a streak needs frozen to survive until today.
+
+    Tokens are only spent when they can cover the whole gap and there is
+    a streak worth saving; otherwise an empty list is returned.
+    """
+    if tokens <= 0 or not dates:
+        return []
+    today = today or date.today()
+    yesterday = today.toordinal() - 1
+    covered = {to_ordinal(d) for d in dates} | {to_ordinal(d) for d in frozen}
+
+    last = max((day for day in covered if day <= yesterday), default=None)
+    if last is None or last >= yesterday:
+        return []
+    if yesterday - last > tokens:
+        return []
+    if get_streak(dates, frozen, today=date.fromordinal(last)) == 0:
+        return []
+    return [from_ordinal(day) for day in range(last + 1, yesterday + 1)]
+
+
+class RunIndex:
+    """Sorted, merged runs of consecutive days for one activity.
+
+    Runs are kept as parallel lists of inclusive start/end ordinals so any
+    day can be located with a binary search. Frozen days extend runs like
+    check-ins do but are excluded from streak counts; a day that is both
+    counts as a check-in.
+    """
+
+    def __init__(self, dates=(), frozen=()):
+        self._load({to_ordinal(d) for d in dates}, {to_ordinal(d) for d in frozen})
+
+    @classmethod
+    def from_ordinals(cls, days=(), frozen=()):
+        """Build an index straight from day ordinals (or any integer keys)."""
+        index = cls.__new__(cls)
+        index._load(set(days), set(frozen))
+        return index
+
+    def _load(self, days, frozen):
+        self._starts = []
+        self._ends = []
+        self._frozen = sorted(frozen - days)
+        for day in sorted(days | frozen):
+            if self._ends and self._ends[-1] == day - 1:
+                self._ends[-1] = day
+            else:
+                self._starts.append(day)
+                self._ends.append(day)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __contains__(self, day):
+        return self._find(day) is not None
+
+    def _find(self, day):
+        """Return the index of the run covering day, or None."""
+        i = bisect_right(self._starts, day) - 1
+        if i >= 0 and self._ends[i] >= day:
+            return i
+        return None
+
+    def is_frozen(self, day):
+        """Whether day is covered by a freeze rather than a check-in."""
+        i = bisect_left(self._frozen, day)
+        return i < len(self._frozen) and self._frozen[i] == day
+
+    def _frozen_between(self, start, end):
+        return bisect_right(self._frozen, end) - bisect_left(self._frozen, start)
+
+    def add(self, day, frozen=False):
+        """Cover a day, merging it with neighbouring runs."""
+        if frozen:
+            if day in self:
+                return
+            insort(self._frozen, day)
+        else:
+            if self.is_frozen(day):
+                # Checked in on a frozen day: it stays covered, now as a check-in
+                del self._frozen[bisect_left(self._frozen, day)]
+                return
+            if day in self:
+                return
+
+        i = bisect_right(self._starts, day) - 1
+        joins_left = i >= 0 and self._ends[i] == day - 1
+        joins_right = i + 1 < len(self._starts) and self._starts[i + 1] == day + 1
+        if joins_left and joins_right:
+            self._ends[i] = self._ends[i + 1]
+            del self._starts[i + 1]
+            del self._ends[i + 1]
+        elif joins_left:
+            self._ends[i] = day
+        elif joins_right:
+            self._starts[i + 1] = day
+        else:
+            self._starts.insert(i + 1, day)
+            self._ends.insert(i + 1, day)
+
+    def remove(self, day):
+        """Uncover a day, splitting the run it belonged to."""
+        i = self._find(day)
+        if i is None:
+            return
+        if self.is_frozen(day):
+            del self._frozen[bisect_left(self._frozen, day)]
+
+        start, end = self._starts[i], self._ends[i]
+        if start == end:
+            del self._starts[i]
+            del self._ends[i]
+        elif day == start:
+            self._starts[i] = day + 1
+        elif day == end:
+            self._ends[i] = day - 1
+        else:
+            self._ends[i] = day - 1
+            self._starts.insert(i + 1, day + 1)
+            self._ends.insert(i + 1, end)
+
+    def streak_as_of(self, day):
+        """Streak length on a given day, treating that day as still open."""
+        i = self._find(day)
+        if i is None:
+            day -= 1
+            i = self._find(day)
+            if i is None:
+                return 0
+        start = self._starts[i]
+        return day - start + 1 - self._frozen_between(start, day)
+
+    def run_length(self, day):
+        """Number of check-ins in the whole run covering day."""
+        i = self._find(day)
+        if i is None:
+            return 0
+        start, end = self._starts[i], self._ends[i]
+        return end - start + 1 - self._frozen_between(start, end)
+
+    def runs_between(self, start, end):
+        """Return (start, end) ordinal pairs of runs overlapping [start, end]."""
+        first = max(bisect_right(self._starts, start) - 1, 0)
+        if first < len(self._ends) and self._ends[first] < start:
+            first += 1
+        last = bisect_right(self._starts, end)
+        return list(zip(self._starts[first:last], self._ends[first:last]))
+
+    def longest(self):
+        """Longest streak across all runs."""
+        return max((self.run_length(start) for start in self._starts), default=0)
+
+
+class DayIndex:
+    """Reverse index from day ordinal to a bitmask of activities checked in.
+
+    Each activity name gets a bit the first time it is seen, so "anything
+    on day D", "was X done on D" and "what happened on D" are a dict lookup
+    plus bit tests instead of a scan over every activity's dates.
+    """
+
+    def __init__(self):
+        self._bits = {}
+        self._names = []
+        self._days = {}
+
+    @classmethod
+    def build(cls, activities, key="dates"):
+        """Index a name -> info mapping whose infos hold date strings under key."""
+        index = cls()
+        for name, info in activities.items():
+            bit = index._bit(name)
+            for day in info.get(key, []):
+                day = to_ordinal(day)
+                index._days[day] = index._days.get(day, 0) | bit
+        return index
+
+    def _bit(self, name):
+        if name not in self._bits:
+            self._bits[name] = 1 << len(self._names)
+            self._names.append(name)
+        return self._bits[name]
+
+    def add(self, day, name):
+        self._days[day] = self._days.get(day, 0) | self._bit(name)
+
+    def remove(self, day, name):
+        mask = self._days.get(day, 0) & ~self._bits.get(name, 0)
+        if mask:
+            self._days[day] = mask
+        else:
+            self._days.pop(day, None)
+
+    def remove_activity(self, name):
+        """Forget every check-in of an activity (e.g. when it is deleted)."""
+        bit = self._bits.get(name)
+        if bit is None:
+            return
+        for day in [day for day, mask in self._days.items() if mask & bit]:
+            self.remove(day, name)
+
+    def any_on(self, day):
+        return day in self._days
+
+    def has(self, day, name):
+        return bool(self._days.get(day, 0) & self._bits.get(name, 0))
+
+    def names_on(self, day):
+        """Names of the activities checked in on a day."""
+        mask = self._days.get(day, 0)
+        return [name for i, name in enumerate(self._names) if mask >> i & 1]
+
+
+class DayTotals:
+    """Fenwick (binary indexed) tree of per-day values over day ordinals.
+
+    add() and window() are O(log n) in the span of days covered. The tree
+    starts at the first day seen and grows (rebuilt in O(n) from the raw
+    per-day values) when a day outside the span arrives, so backfilling
+    an old day or checking in on a new one both stay cheap.
+    """
+
+    def __init__(self, values=()):
+        self._base = 0
+        self._values = []
+        self._tree = [0]
+        values = list(values)
+        if values:
+            days = [day for day, _ in values]
+            self._resize(min(days), max(days))
+            for day, value in values:
+                self._values[day - self._base] += value
+            self._rebuild()
+
+    def _rebuild(self):
+        tree = [0] + self._values
+        size = len(self._values)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _resize(self, first, last):
+        if self._values:
+            end = self._base + len(self._values) - 1
+            # Leave headroom on the side that overflowed so a run of new
+            # (or backfilled) days doesn't rebuild every time
+            first = min(first - len(self._values), self._base) if first < self._base else self._base
+            last = max(last + len(self._values), end) if last > end else end
+        values = [0] * (last - first + 1)
+        for i, value in enumerate(self._values):
+            values[self._base - first + i] = value
+        self._base = first
+        self._values = values
+
+    def add(self, day, delta):
+        """Add delta to the value stored for a day ordinal."""
+        if not self._values or not self._base <= day < self._base + len(self._values):
+            self._resize(day, day)
+            self._values[day - self._base] += delta
+            self._rebuild()
+            return
+        self._values[day - self._base] += delta
+        i = day - self._base + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def value(self, day):
+        if self._values and self._base <= day < self._base + len(self._values):
+            return self._values[day - self._base]
+        return 0
+
+    def prefix(self, day):
+        """Sum of the values on every day up to and including a day ordinal."""
+        i = min(day - self._base + 1, len(self._values))
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def window(self, first, last):
+        """Sum of the values on days first..last (inclusive ordinals)."""
+        if last < first:
+            return 0
+        return self.prefix(last) - self.prefix(first - 1)
+
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+EVERY_DAY = 0b1111111
+
+
+class Schedule:
+    """Which days an activity is due: a weekday bitmask plus excluded dates.
+
+    Bit 0 of the mask is Monday. Scheduled days are numbered by rank (how
+    many scheduled days come before them), so consecutive scheduled days
+    have consecutive ranks and a RunIndex over ranks yields streaks that
+    skip rest days. rank() uses a precomputed per-week prefix table and a
+    binary search over excluded dates.
+    """
+
+    def __init__(self, mask=EVERY_DAY, excluded=()):
+        self.mask = (mask & EVERY_DAY) or EVERY_DAY
+        self._per_week = bin(self.mask).count("1")
+        self._before = [bin(self.mask & ((1 << wd) - 1)).count("1") for wd in range(7)]
+        self._excluded = sorted(
+            day for day in {to_ordinal(d) for d in excluded} if self.mask >> ((day - 1) % 7) & 1
+        )
+
+    def is_scheduled(self, day):
+        """Whether a day ordinal is a due day."""
+        if not self.mask >> ((day - 1) % 7) & 1:
+            return False
+        i = bisect_left(self._excluded, day)
+        return i == len(self._excluded) or self._excluded[i] != day
+
+    def rank(self, day):
+        """Number of scheduled days strictly before a day ordinal."""
+        week, weekday = divmod(day - 1, 7)
+        return week * self._per_week + self._before[weekday] - bisect_left(self._excluded, day)
+
+    def rank_runs(self, dates, frozen=()):
+        """RunIndex over the ranks of the scheduled days among dates."""
+        return RunIndex.from_ordinals(
+            (self.rank(day) for day in map(to_ordinal, dates) if self.is_scheduled(day)),
+            (self.rank(day) for day in map(to_ordinal, frozen) if self.is_scheduled(day)),
+        )
+
+
+PERIOD_UNITS = {"day": "days", "week": "weeks", "month": "months"}
+
+
+def window_start(ordinal, per):
+    """First day ordinal of the day/week/month window containing ordinal."""
+    if per == "week":
+        return ordinal - date.fromordinal(ordinal).weekday()
+    if per == "month":
+        return ordinal - date.fromordinal(ordinal).day + 1
+    return ordinal
+
+
+def window_end(ordinal, per):
+    """Last day ordinal of the window containing ordinal."""
+    start = window_start(ordinal, per)
+    if per == "week":
+        return start + 6
+    if per == "month":
+        first = date.fromordinal(start)
+        if first.month == 12:
+            return date(first.year + 1, 1, 1).toordinal() - 1
+        return date(first.year, first.month + 1, 1).toordinal() - 1
+    return start
+
+
+def window_streak(dates, count, per, today=None):
+    """Count consecutive windows with at least count check-ins.
+
+    The current window only counts once it is satisfied; until then it is
+    still open and the streak covers the windows before it. Window sums
+    come from prefix sums over day ordinals, so a multi-year history is a
+    single linear pass.
+
+    Returns (streak, done in current window, days left in current window).
+    """
+    today_ord = (today or date.today()).toordinal()
+    days_left = window_end(today_ord, per) - today_ord + 1
+    days = {to_ordinal(d) for d in dates}
+    days = sorted(day for day in days if day <= today_ord)
+    if not days:
+        return 0, 0, days_left
+
+    first = window_start(days[0], per)
+    hits = bytearray(today_ord - first + 1)
+    for day in days:
+        hits[day - first] = 1
+    prefix = list(accumulate(hits, initial=0))
+
+    def total(start, end):
+        return prefix[end - first + 1] - prefix[start - first]
+
+    start = window_start(today_ord, per)
+    done = total(start, today_ord)
+    streak = 1 if done >= count else 0
+    while start > first:
+        previous = window_start(start - 1, per)
+        if total(previous, start - 1) < count:
+            break
+        streak += 1
+        start = previous
+    return streak, done, days_left
+
+
+def day_status(done, frozen_today, streak):
+    if done:
+        return "done"
+    if frozen_today:
+        return "frozen"
+    return "at_risk" if streak else "start"
+
+
+def habit_status(dates, frequency=None, frozen=(), today=None, schedule=None, runs=None):
+    """Return (status, streak, done, target) for an activity.
+
+    status is "done", "frozen", "on_track", "at_risk", "start" or "rest";
+    "frozen" is a day a freeze token covers, which keeps the streak but
+    isn't a check-in. Daily
+    habits use the freeze-aware day streak, skipping days a Schedule does
+    not cover; habits with a frequency such as {"count": 3, "per": "week"}
+    count satisfied windows instead. Callers that keep a RunIndex (in day
+    space, or rank space when scheduled) can pass it as runs to make this
+    a couple of binary searches.
+    """
+    today = today or date.today()
+    per = (frequency or {}).get("per", "day")
+    if per == "day" and schedule is not None:
+        runs = runs if runs is not None else schedule.rank_runs(dates, frozen)
+        rank = schedule.rank(today.toordinal())
+        streak = runs.streak_as_of(rank)
+        if not schedule.is_scheduled(today.toordinal()):
+            return "rest", streak, 0, 0
+        frozen_today = runs.is_frozen(rank)
+        done = 1 if rank in runs and not frozen_today else 0
+        return day_status(done, frozen_today, streak), streak, done, 1
+    if per == "day":
+        if runs is not None:
+            streak = runs.streak_as_of(today.toordinal())
+            frozen_today = runs.is_frozen(today.toordinal())
+            done = 1 if today.toordinal() in runs and not frozen_today else 0
+        else:
+            streak = get_streak(dates, frozen, today=today)
+            done = 1 if today.isoformat() in dates else 0
+            frozen_today = not done and today.isoformat() in frozen
+        return day_status(done, frozen_today, streak), streak, done, 1
+
+    target = max(1, int(frequency.get("count", 1)))
+    streak, done, days_left = window_streak(dates, target, per, today=today)
+    if done >= target:
+        status = "done"
+    elif target - done < days_left:
+        status = "on_track"
+    else:
+        status = "at_risk" if streak else "start"
+    return status, streak, done, target
@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+
+@pytest.fixture
+def window(tmp_path, monkeypatch):
+    """A ConsistencyApp on the offscreen platform, saving under tmp_path."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    import main
+    monkeypatch.setattr(main, "DATA_FILE", tmp_path / "data.json")
+    monkeypatch.setattr(main, "ICLOUD_DIR", tmp_path / "icloud")
+    monkeypatch.setattr(main, "ICLOUD_FILE", tmp_path / "icloud" / "data.json")
+    monkeypatch.setattr(main.ConsistencyApp, "post_notification", lambda self, title, message: None)
+    monkeypatch.setattr(main.QMessageBox, "warning", staticmethod(lambda *args: None))
+    window = main.ConsistencyApp()
+    yield window
+    window.close()
+    window.deleteLater()
+    app.processEvents()
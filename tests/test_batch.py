@@ -0,0 +1,133 @@
+import copy
+
+from batch import Batch
+from store import CHECKINS, Store
+
+
+class Frontend:
+    def __init__(self):
+        self.data = {"count": 0}
+        self.writes = []
+        self.changes = []
+        self.snapshots = 0
+        self.restored = []
+        self.batch = Batch(self.write, snapshot=self.snapshot, restore=self.restore)
+        self.store = Store(self.batch)
+        self.store.subscribe(self.changes.extend)
+
+    def write(self):
+        self.writes.append(dict(self.data))
+
+    def snapshot(self):
+        self.snapshots += 1
+        return copy.deepcopy(self.data)
+
+    def restore(self, saved):
+        self.restored.append(saved)
+        if saved is not None:
+            self.data = saved
+
+
+def test_only_snapshot_batches_copy_the_data():
+    app = Frontend()
+    with app.batch:
+        with app.batch(snapshot=True):
+            app.batch.save()
+    assert app.snapshots == 0
+    with app.batch(snapshot=True):
+        with app.batch:
+            app.batch.save()
+    assert app.snapshots == 1
+    assert len(app.writes) == 2
+
+
+def test_inner_rollback_aborts_the_outer_transaction():
+    app = Frontend()
+    with app.batch(snapshot=True):
+        app.data["count"] = 1
+        app.store.emit(CHECKINS, "before")
+        app.batch.save()
+        try:
+            with app.batch:
+                app.data["count"] = 2
+                raise ValueError("inner failure")
+        except ValueError:
+            pass
+        # Nothing is restored while the outer level runs, so its work isn't silently lost midway
+        assert app.batch.active
+        assert app.data == {"count": 2}
+        app.data["count"] = 3
+        app.store.emit(CHECKINS, "after")
+        app.batch.save()
+    assert not app.batch.active
+    assert app.data == {"count": 0}
+    assert app.writes == []
+    app.store.flush()
+    assert app.changes == []
+    # The next transaction starts clean
+    with app.batch:
+        app.batch.save()
+    assert app.writes == [{"count": 0}]
+
+
+def test_outer_frame_never_writes_to_a_discarded_copy():
+    app = Frontend()
+    app.data["items"] = []
+    with app.batch(snapshot=True):
+        items = app.data["items"]
+        try:
+            with app.batch:
+                raise ValueError
+        except ValueError:
+            pass
+        items.append("kept")
+        assert app.data["items"] is items
+    assert app.data["items"] == []
+
+
+def test_rollback_never_goes_below_zero():
+    app = Frontend()
+    app.batch.rollback()
+    with app.batch:
+        app.batch.save()
+    assert not app.batch.active
+    assert app.writes == [{"count": 0}]
+    app.batch.save()
+    assert len(app.writes) == 2
+
+
+def test_rollback_restores_data_and_drops_events():
+    app = Frontend()
+    try:
+        with app.batch(snapshot=True):
+            app.data["count"] = 5
+            app.store.emit(CHECKINS, "lost")
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert app.data == {"count": 0}
+    assert app.writes == []
+    app.store.flush()
+    assert app.changes == []
+
+
+def test_rollback_without_snapshot_hands_restore_none():
+    app = Frontend()
+    try:
+        with app.batch:
+            app.data["count"] = 5
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert app.restored == [None]
+    assert app.data == {"count": 5}
+    assert app.writes == []
+
+
+def test_single_check_in_takes_no_snapshot(window, monkeypatch):
+    calls = []
+    monkeypatch.setattr(window.batch, "_snapshot", lambda: calls.append(1))
+    window.data["activities"]["Reading"] = {"dates": [], "longest": 0, "color": "#e94560"}
+    assert window.check_in("Reading", 30)
+    window.remove_checkin("Reading", window.get_today())
+    assert calls == []
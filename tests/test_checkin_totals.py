@@ -0,0 +1,23 @@
+from streak_core import from_ordinal, to_ordinal
+
+
+def add_activity(window, name, dates=()):
+    window.data["activities"][name] = {"dates": list(dates), "longest": 0, "color": "#e94560"}
+
+
+def test_check_in_before_totals_are_built(window):
+    add_activity(window, "Reading")
+    assert "Reading" not in window.checkin_totals
+    today = to_ordinal(window.get_today())
+    assert window.check_in("Reading", 30)
+    assert window.get_checkin_totals("Reading").window(today, today) == 1
+
+
+def test_unmark_day_before_totals_are_built(window):
+    today = to_ordinal(window.get_today())
+    days = [from_ordinal(today - 2), from_ordinal(today - 1)]
+    add_activity(window, "Reading", days)
+    assert "Reading" not in window.checkin_totals
+    window.unmark_day("Reading", days[0])
+    assert window.get_checkin_totals("Reading").window(today - 2, today - 2) == 0
+    assert window.get_checkin_totals("Reading").window(today - 7, today) == 1
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Pin the wall clock main and streak_core read, returning a setter."""
+    import main
+    import streak_core
+
+    class Clock(datetime):
+        moment = datetime(2024, 5, 7, 1, 0)
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls.moment if tz is None else cls.moment.astimezone(tz)
+
+    monkeypatch.setattr(main, "datetime", Clock)
+    monkeypatch.setattr(streak_core, "datetime", Clock)
+
+    def set_clock(hour, minute):
+        Clock.moment = datetime(2024, 5, 7, hour, minute)
+    return set_clock
+
+
+def test_quick_check_in_after_midnight_stays_in_the_logical_day(window, clock):
+    window.data["day_start"] = "04:00"
+    window.data["activities"]["Coding"] = {"dates": [], "longest": 0, "color": "#e94560"}
+    assert window.get_today() == "2024-05-06"
+
+    assert window.check_in("Coding", 60, day="2024-05-06", start=23 * 60)
+    clock(0, 15)
+    # 23:45-00:15 overlaps the 23:00-00:00 session
+    assert not window.check_in("Coding", 30)
+    clock(1, 0)
+    assert window.check_in("Coding", 30)
+
+    index = window.get_sessions("Coding")
+    assert [index.key_of(s) for s in index.day_sessions("2024-05-06")] == [("2024-05-06", 1380), ("2024-05-06", 1470)]
+    assert [s["start"] for s in index.day_sessions("2024-05-06")] == ["23:00", "00:30"]
+
+    # Moving the boundary back to midnight refiles the keys from the stored clocks
+    window.data["day_start"] = "00:00"
+    window.rekey_sessions()
+    index = window.get_sessions("Coding")
+    assert [index.key_of(s) for s in index.day_sessions("2024-05-06")] == [("2024-05-06", 30), ("2024-05-06", 1380)]
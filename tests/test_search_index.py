@@ -0,0 +1,25 @@
+from search_index import SearchIndex
+
+
+def test_discard_where_drops_only_that_prefix():
+    index = SearchIndex()
+    index.set(("calendar", "2026-10-18", "a"), "dentist appointment")
+    index.set(("calendar", "2026-10-18", "b"), "team dinner")
+    index.set(("calendar", "2026-10-19", "c"), "dentist follow up")
+    index.set(("session", "Coding", ("2026-10-18", 600)), "dinner prep")
+    index.set(("note", "n1"), "dentist notes", "Teeth")
+
+    index.discard_where("calendar", "2026-10-18")
+
+    assert sorted(doc_id for doc_id, *_ in index.search("dentist")) == [("calendar", "2026-10-19", "c"), ("note", "n1")]
+    assert [doc_id for doc_id, *_ in index.search("dinner")] == [("session", "Coding", ("2026-10-18", 600))]
+    assert len(index) == 3
+
+    # Re-indexing and discarding keep the prefix groups in step with the docs
+    index.set(("calendar", "2026-10-19", "c"), "dentist moved")
+    index.discard(("note", "n1"))
+    index.discard_where("session")
+    assert [doc_id for doc_id, *_ in index.search("dentist")] == [("calendar", "2026-10-19", "c")]
+    index.discard_where("calendar")
+    assert len(index) == 0
+    assert index._groups == {}
@@ -0,0 +1,37 @@
+from session_index import SessionIndex
+
+
+def session(start, minutes=30, note=""):
+    return {"date": "2024-05-01", "start": start, "minutes": minutes, "note": note}
+
+
+def test_add_same_start_keeps_both_sessions():
+    index = SessionIndex()
+    first = index.add(session("09:00", note="first"))
+    second = index.add(session("09:00", note="second"))
+    assert first == ("2024-05-01", 540)
+    assert second == ("2024-05-01", 541)
+    assert len(index) == 2
+    assert index.get(first)["note"] == "first"
+    assert index.get(second)["note"] == "second"
+    assert index.day_minutes("2024-05-01") == 60
+
+
+def test_delete_after_same_start_check_ins():
+    index = SessionIndex()
+    first = index.add(session("09:00", note="first"))
+    index.add(session("09:00", note="second"))
+    index.delete(first)
+    assert [one["note"] for one in index.sessions()] == ["second"]
+    index.delete_day("2024-05-01")
+    assert index.sessions() == []
+    assert "2024-05-01" not in index
+
+
+def test_sessions_before_the_day_boundary_sort_after_the_evening():
+    index = SessionIndex([session("23:00", minutes=60), session("00:30", minutes=30)], day_start=240)
+    assert [index.key_of(s) for s in index.day_sessions("2024-05-01")] == [("2024-05-01", 1380), ("2024-05-01", 1470)]
+    # 23:30-00:30 overlaps the 23:00 session, 01:00-01:30 overlaps neither
+    assert index.conflict("2024-05-01", 1410, 60)["start"] == "23:00"
+    assert index.conflict("2024-05-01", 1500, 30) is None
+    assert index.conflict("2024-05-01", 1460, 20)["start"] == "00:30"
@@ -0,0 +1,46 @@
+import threading
+
+from streak_core import from_ordinal, to_ordinal
+
+
+def test_statistics_page_indexes_sessions_off_the_ui_thread(window, monkeypatch):
+    import main
+    from PyQt6.QtCore import QThreadPool
+    from PyQt6.QtWidgets import QApplication
+
+    today = to_ordinal(window.get_today())
+    for n in range(5):
+        sessions = [
+            {"date": from_ordinal(today - day), "start": "09:00", "minutes": 20 + n, "note": "", "mood": 3}
+            for day in range(40)
+        ]
+        window.data["activities"][f"Habit {n}"] = {
+            "dates": [session["date"] for session in sessions], "longest": 40, "color": "#e94560", "sessions": sessions,
+        }
+
+    built_on = []
+
+    class RecordingIndex(main.SessionIndex):
+        def __init__(self, *args, **kwargs):
+            built_on.append(threading.current_thread() is threading.main_thread())
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(main, "SessionIndex", RecordingIndex)
+    window.show_stats()
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+    assert built_on == [False] * 5
+    assert sorted(window.session_indexes) == [f"Habit {n}" for n in range(5)]
+    assert len(window.stats_view["series"]) == 5
+    assert window.get_sessions("Habit 2").minute_totals.window(today - 6, today) == 7 * 22
+
+    # Sessions that changed meanwhile aren't adopted; the trend chart still needs no UI-thread index
+    window.session_indexes.clear()
+    built_on.clear()
+    monkeypatch.setattr(window, "adopt_sessions", lambda *args: None)
+    window.show_stats()
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+    assert built_on == [False] * 5
+    assert window.stats_view["trend"].isVisibleTo(window)
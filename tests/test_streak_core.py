@@ -0,0 +1,33 @@
+from datetime import date
+
+from streak_core import RunIndex, get_streak, habit_status, to_ordinal
+
+TODAY = date(2024, 5, 10)
+
+
+def test_checked_in_frozen_day_counts_once():
+    dates = ["2024-05-07", "2024-05-08", "2024-05-09"]
+    frozen = ["2024-05-08"]
+    runs = RunIndex(dates, frozen)
+    assert get_streak(dates, frozen, today=TODAY) == 3
+    assert runs.streak_as_of(TODAY.toordinal()) == 3
+    assert runs.run_length(to_ordinal("2024-05-08")) == 3
+    assert not runs.is_frozen(to_ordinal("2024-05-08"))
+
+
+def test_check_in_on_a_frozen_day_unfreezes_it():
+    runs = RunIndex(["2024-05-07", "2024-05-09"], ["2024-05-08"])
+    assert runs.streak_as_of(TODAY.toordinal()) == 2
+    runs.add(to_ordinal("2024-05-08"))
+    assert runs.streak_as_of(TODAY.toordinal()) == 3
+    runs.add(to_ordinal("2024-05-08"), frozen=True)
+    assert runs.streak_as_of(TODAY.toordinal()) == 3
+
+
+def test_frozen_today_is_its_own_status():
+    dates = ["2024-05-08", "2024-05-09"]
+    frozen = ["2024-05-10"]
+    assert habit_status(dates, frozen=frozen, today=TODAY) == ("frozen", 2, 0, 1)
+    runs = RunIndex(dates, frozen)
+    assert habit_status(dates, frozen=frozen, today=TODAY, runs=runs) == ("frozen", 2, 0, 1)
+    assert habit_status(dates + ["2024-05-10"], frozen=frozen, today=TODAY)[:3] == ("done", 3, 1)
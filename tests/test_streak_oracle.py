@@ -0,0 +1,183 @@
+"""Differential tests: streak_core against brute-force walks over plain sets."""
+
+import random
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+import streak_core
+from streak_core import RunIndex, Schedule, from_ordinal
+
+TODAY = date(2024, 5, 15)
+SEEDS = range(40)
+
+
+def oracle_streak(days, frozen, today, due=lambda day: True):
+    """Walk back from today one day at a time; frozen days bridge, rest days are skipped."""
+    covered = days | frozen
+    day = today
+    if not (due(day) and day in covered):
+        day -= 1
+    streak = 0
+    floor = min(covered, default=today) - 8
+    while day > floor:
+        if due(day):
+            if day not in covered:
+                break
+            streak += day in days
+        day -= 1
+    return streak
+
+
+def oracle_run_length(days, frozen, day):
+    covered = days | frozen
+    if day not in covered:
+        return 0
+    first, last = day, day
+    while first - 1 in covered:
+        first -= 1
+    while last + 1 in covered:
+        last += 1
+    return sum(1 for d in range(first, last + 1) if d in days)
+
+
+def oracle_window_streak(days, count, per, today):
+    def bounds(day):
+        current = date.fromordinal(day)
+        if per == "week":
+            start = current - timedelta(days=current.weekday())
+            return start.toordinal(), start.toordinal() + 6
+        start = current.replace(day=1)
+        following = (start + timedelta(days=32)).replace(day=1)
+        return start.toordinal(), following.toordinal() - 1
+
+    def hits(first, last):
+        return sum(1 for day in days if first <= day <= last)
+
+    first, last = bounds(today)
+    done = hits(first, today)
+    streak = 1 if done >= count else 0
+    earliest = min(days, default=today)
+    while first > earliest:
+        first, _ = bounds(first - 1)
+        if hits(first, bounds(first)[1]) < count:
+            break
+        streak += 1
+    return streak, done, last - today + 1
+
+
+def oracle_day(moment, day_start):
+    hours, minutes = map(int, day_start.split(":"))
+    if moment.time() < time(hours, minutes):
+        return (moment.date() - timedelta(days=1)).isoformat()
+    return moment.date().isoformat()
+
+
+def random_history(rng, today):
+    """(check-in ordinals, frozen ordinals); some frozen days are also check-ins."""
+    span = rng.randint(1, 120)
+    density = rng.uniform(0.2, 0.95)
+    days = {today - i for i in range(rng.choice((0, 0, 1, 2)), span) if rng.random() < density}
+    gaps = [today - i for i in range(span) if today - i not in days]
+    frozen = set(rng.sample(gaps, min(len(gaps), rng.randint(0, 6))))
+    if days and rng.random() < 0.5:
+        frozen |= set(rng.sample(sorted(days), min(len(days), 3)))
+    return days, frozen
+
+
+def keys(ordinals):
+    return [from_ordinal(day) for day in ordinals]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_get_streak_and_run_index_match_the_oracle(seed):
+    rng = random.Random(seed)
+    today = TODAY.toordinal()
+    days, frozen = random_history(rng, today)
+    expected = oracle_streak(days, frozen, today)
+    runs = RunIndex(keys(days), keys(frozen))
+    assert streak_core.get_streak(keys(days), keys(frozen), today=TODAY) == expected
+    assert runs.streak_as_of(today) == expected
+    assert streak_core.habit_status(keys(days), frozen=keys(frozen), today=TODAY)[1] == expected
+    assert streak_core.habit_status(keys(days), frozen=keys(frozen), today=TODAY, runs=runs)[1] == expected
+    for day in range(today - 130, today + 1):
+        assert runs.run_length(day) == oracle_run_length(days, frozen, day)
+    assert runs.longest() == max((oracle_run_length(days, frozen, day) for day in days | frozen), default=0)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_run_index_updates_match_the_oracle(seed):
+    rng = random.Random(seed)
+    today = TODAY.toordinal()
+    days, frozen = random_history(rng, today)
+    runs = RunIndex(keys(days), keys(frozen))
+    days, frozen = set(days), frozen - days
+    for _ in range(60):
+        day = today - rng.randint(0, 40)
+        action = rng.choice(("add", "freeze", "remove"))
+        if action == "add":
+            runs.add(day)
+            days.add(day)
+            frozen.discard(day)
+        elif action == "freeze":
+            runs.add(day, frozen=True)
+            if day not in days:
+                frozen.add(day)
+        else:
+            runs.remove(day)
+            days.discard(day)
+            frozen.discard(day)
+        assert runs.streak_as_of(today) == oracle_streak(days, frozen, today)
+        assert runs.is_frozen(day) == (day in frozen)
+        assert runs.run_length(day) == oracle_run_length(days, frozen, day)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_scheduled_streaks_match_the_oracle(seed):
+    rng = random.Random(seed)
+    today = TODAY.toordinal()
+    days, frozen = random_history(rng, today)
+    mask = rng.randint(1, streak_core.EVERY_DAY)
+    excluded = {today - rng.randint(0, 60) for _ in range(rng.randint(0, 4))}
+    schedule = Schedule(mask, keys(excluded))
+
+    def due(day):
+        return bool(mask >> date.fromordinal(day).weekday() & 1) and day not in excluded
+
+    expected = oracle_streak(days, frozen, today, due)
+    status = streak_core.habit_status(keys(days), frozen=keys(frozen), today=TODAY, schedule=schedule)
+    assert status[1] == expected
+    assert schedule.rank_runs(keys(days), keys(frozen)).streak_as_of(schedule.rank(today)) == expected
+    for day in range(today - 14, today + 1):
+        assert schedule.is_scheduled(day) == due(day)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("per", ("week", "month"))
+def test_window_streak_matches_the_oracle(seed, per):
+    rng = random.Random(seed)
+    today = TODAY.toordinal() + rng.randint(0, 30)
+    days, _ = random_history(rng, today)
+    count = rng.randint(1, 4 if per == "week" else 12)
+    expected = oracle_window_streak(days, count, per, today)
+    assert streak_core.window_streak(keys(days), count, per, today=date.fromordinal(today)) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_day_boundary_streaks_match_the_oracle(seed):
+    rng = random.Random(seed)
+    day_start = f"{rng.randint(0, 6):02d}:{rng.choice((0, 15, 30)):02d}"
+    now = datetime(2024, 5, 15, rng.randint(0, 23), rng.randint(0, 59))
+    moments = [now - timedelta(minutes=rng.randint(0, 60 * 24 * 30)) for _ in range(rng.randint(0, 40))]
+    dates = [streak_core.day_key(moment, day_start) for moment in moments]
+    assert dates == [oracle_day(moment, day_start) for moment in moments]
+
+    today = streak_core.day_key(now, day_start)
+    assert today == oracle_day(now, day_start)
+    today = date.fromisoformat(today)
+    days = {streak_core.to_ordinal(day) for day in dates}
+    gaps = [today.toordinal() - i for i in range(30) if today.toordinal() - i not in days]
+    frozen = set(rng.sample(gaps, min(len(gaps), 2)))
+    expected = oracle_streak(days, frozen, today.toordinal())
+    assert streak_core.get_streak(dates, keys(frozen), today=today) == expected
+    assert RunIndex(dates, keys(frozen)).streak_as_of(today.toordinal()) == expected
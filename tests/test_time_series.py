@@ -0,0 +1,16 @@
+from time_series import MinuteSeries
+
+
+def test_emptied_buckets_are_pruned():
+    series = MinuteSeries()
+    series.add(100, 30)
+    series.add(120, 45)
+    series.add(100, -30)
+    assert series.first_day() == 120
+    assert series.bucketed(100, 100, "day") == [(100, 0)]
+    assert series._starts["day"] == [120]
+
+    series.add(120, -45)
+    assert series.first_day() is None
+    assert series._buckets == {"day": {}, "week": {}, "month": {}}
+    assert series._starts == {"day": [], "week": [], "month": []}
@@ -0,0 +1,20 @@
+from streak_core import from_ordinal, to_ordinal
+
+
+def add_activity(window, name, days, longest):
+    window.data["activities"][name] = {"dates": [from_ordinal(day) for day in days], "longest": longest, "color": "#e94560"}
+
+
+def test_unmarking_outside_the_record_run_keeps_longest(window):
+    today = to_ordinal(window.get_today())
+    add_activity(window, "Reading", [today - 2, today - 1, today], longest=40)
+    window.unmark_day("Reading", from_ordinal(today - 1))
+    assert window.data["activities"]["Reading"]["longest"] == 40
+
+
+def test_unmarking_inside_the_record_run_lowers_longest(window):
+    today = to_ordinal(window.get_today())
+    record = [today - 20 + i for i in range(5)]
+    add_activity(window, "Reading", record + [today - 1, today], longest=5)
+    window.unmark_day("Reading", from_ordinal(record[2]))
+    assert window.data["activities"]["Reading"]["longest"] == 2
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+📉 Time series for Consistency Tracker charts.
+Minutes per day/week/month kept as running buckets, plus LTTB downsampling
+so a multi-year trend never hands the chart more points than it has pixels.
+"""
+
+from bisect import bisect_left, insort
+
+from streak_core import window_end, window_start
+
+BUCKETS = ("day", "week", "month")
+APPROX_DAYS = {"day": 1, "week": 7, "month": 30}
+# Buckets handed to LTTB per output point; extra detail lets it keep real peaks
+OVERSAMPLE = 4
+
+
+def choose_bucket(first, last, width):
+    """Smallest bucket giving at most OVERSAMPLE points per pixel over first..last."""
+    span = last - first + 1
+    for per in BUCKETS:
+        if span / APPROX_DAYS[per] <= width * OVERSAMPLE:
+            return per
+    return "month"
+
+
+def bucket_starts(first, last, per):
+    """Start ordinals of every per-bucket overlapping first..last."""
+    starts = []
+    start = window_start(first, per)
+    while start <= last:
+        starts.append(start)
+        start = window_end(start, per) + 1
+    return starts
+
+
+def lttb(points, threshold):
+    """Largest-Triangle-Three-Buckets downsampling of (x, y) points.
+
+    Keeps the first and last points and, from each of threshold - 2 equal
+    slices in between, the point forming the largest triangle with the
+    previously kept point and the next slice's average, which preserves
+    peaks and dips that plain averaging would flatten.
+    """
+    count = len(points)
+    if threshold >= count or threshold < 3:
+        return list(points)
+    sampled = [points[0]]
+    every = (count - 2) / (threshold - 2)
+    kept = 0
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, count)
+        avg_points = points[avg_start:avg_end] or points[-1:]
+        avg_x = sum(x for x, _ in avg_points) / len(avg_points)
+        avg_y = sum(y for _, y in avg_points) / len(avg_points)
+
+        kept_x, kept_y = points[kept]
+        best, best_area = int(i * every) + 1, -1.0
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            x, y = points[j]
+            area = abs((kept_x - avg_x) * (y - kept_y) - (kept_x - x) * (avg_y - kept_y))
+            if area > best_area:
+                best, best_area = j, area
+        sampled.append(points[best])
+        kept = best
+    sampled.append(points[-1])
+    return sampled
+
+
+class MinuteSeries:
+    """Minutes per day, week and month for one activity, updated per session.
+
+    add() touches one bucket per granularity, so check-ins and backfills
+    never re-walk the sessions. series() answers "what should a chart this
+    many pixels wide draw for this range" and remembers its last answers
+    until the next change.
+    """
+
+    CACHE_SIZE = 8
+
+    def __init__(self):
+        self._buckets = {per: {} for per in BUCKETS}
+        self._starts = {per: [] for per in BUCKETS}
+        self._cache = {}
+
+    def add(self, day, minutes):
+        """Add minutes (negative to remove) on a day ordinal.
+
+        A bucket that drops back to zero is deleted, so first_day() and the
+        chart range follow the sessions that are left.
+        """
+        for per in BUCKETS:
+            start = window_start(day, per)
+            buckets = self._buckets[per]
+            total = buckets.get(start, 0) + minutes
+            if total:
+                if start not in buckets:
+                    insort(self._starts[per], start)
+                buckets[start] = total
+            elif start in buckets:
+                del buckets[start]
+                starts = self._starts[per]
+                del starts[bisect_left(starts, start)]
+        self._cache.clear()
+
+    def first_day(self):
+        starts = self._starts["day"]
+        return starts[0] if starts else None
+
+    def bucketed(self, first, last, per):
+        """[(bucket start, minutes)] for every bucket in first..last, zero-filled."""
+        buckets = self._buckets[per]
+        return [(start, buckets.get(start, 0)) for start in bucket_starts(first, last, per)]
+
+    def series(self, first, last, width):
+        """(bucket, points) to draw first..last in width pixels: bucketed, then LTTB-thinned."""
+        key = (first, last, width)
+        if key not in self._cache:
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            per = choose_bucket(first, last, width)
+            self._cache[key] = (per, lttb(self.bucketed(first, last, per), width))
+        return self._cache[key]
+
+
+def combined_series(series, first, last, width):
+    """(bucket, points) for the sum of several MinuteSeries, thinned to width."""
+    if len(series) == 1:
+        return series[0].series(first, last, width)
+    per = choose_bucket(first, last, width)
+    totals = None
+    for one in series:
+        points = one.bucketed(first, last, per)
+        if totals is None:
+            totals = points
+        else:
+            totals = [(start, total + minutes) for (start, total), (_, minutes) in zip(totals, points)]
+    return per, lttb(totals or [], width)
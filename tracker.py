@@ -9,6 +9,9 @@ import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import streak_core
+from batch import Batch
+
 # Data file path
 DATA_FILE = Path(__file__).parent / "streak_data.json"
 
@@ -68,6 +71,10 @@ def send_notification(title, message):
     script = f'display notification "{message}" with title "{title}" sound name "default"'
     subprocess.run(["osascript", "-e", script], capture_output=True)
 
+def open_batch(data):
+    """Batch that saves data and notifies once on commit (or immediately outside one)."""
+    return Batch(lambda: save_data(data), send_notification)
+
 def clear_screen():
     """Clear terminal screen."""
     os.system('clear')
@@ -76,32 +83,26 @@ def get_today():
     """Get today's date as string."""
     return datetime.now().strftime("%Y-%m-%d")
 
-def get_streak(dates):
-    """Calculate current streak from list of dates."""
-    if not dates:
-        return 0
-    
-    dates = sorted(set(dates), reverse=True)
-    today = datetime.now().date()
-    yesterday = today - timedelta(days=1)
-    
-    # Check if checked in today or yesterday
-    last_date = datetime.strptime(dates[0], "%Y-%m-%d").date()
-    if last_date != today and last_date != yesterday:
-        return 0
-    
-    streak = 0
-    expected = last_date
-    
-    for date_str in dates:
-        date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        if date == expected:
-            streak += 1
-            expected = date - timedelta(days=1)
-        elif date < expected:
-            break
-    
-    return streak
+def get_streak(dates, frozen=()):
+    """Calculate current streak from list of dates, bridging frozen days."""
+    return streak_core.get_streak(dates, frozen)
+
+def apply_freeze_tokens(data, batch=None):
+    """Spend freeze tokens on missed days so active streaks survive."""
+    batch = batch or open_batch(data)
+    spent = 0
+    for name, info in data.get("activities", {}).items():
+        days = streak_core.spend_freeze_tokens(
+            info.get("dates", []), info.get("frozen", []), data.get("freeze_tokens", 0)
+        )
+        if days:
+            info.setdefault("frozen", []).extend(days)
+            data["freeze_tokens"] -= len(days)
+            spent += len(days)
+            batch.notify("❄️ Streak Frozen", f"{name}: used {len(days)} freeze token(s)")
+    if spent:
+        batch.save()
+    return spent
 
 def print_header():
     """Print app header."""
@@ -114,7 +115,7 @@ def print_header():
 def print_activity(name, data, index):
     """Print a single activity with streak info."""
     dates = data.get("dates", [])
-    streak = get_streak(dates)
+    streak = get_streak(dates, data.get("frozen", []))
     longest = data.get("longest", 0)
     total = len(dates)
     today = get_today()
@@ -194,36 +195,40 @@ def check_in(data):
             if today in activities[name].get("dates", []):
                 print(f"\n  {Colors.YELLOW}Already checked in for {name} today!{Colors.RESET}")
             else:
-                activities[name].setdefault("dates", []).append(today)
-                
-                # Update longest streak
-                streak = get_streak(activities[name]["dates"])
-                if streak > activities[name].get("longest", 0):
-                    activities[name]["longest"] = streak
-                
-                save_data(data)
-                
-                # Check for new badges
-                check_badges(data, name, streak)
-                
-                print(f"\n  {Colors.GREEN}✓ Checked in for {name}! Streak: {streak} days 🔥{Colors.RESET}")
-                send_notification("Consistency Tracker", f"✓ Checked in for {name}! Streak: {streak} days 🔥")
+                # One write and one notification for the tokens, check-in and badges
+                with open_batch(data) as batch:
+                    apply_freeze_tokens(data, batch)
+                    activities[name].setdefault("dates", []).append(today)
+                    
+                    # Update longest streak
+                    streak = get_streak(activities[name]["dates"], activities[name].get("frozen", []))
+                    if streak > activities[name].get("longest", 0):
+                        activities[name]["longest"] = streak
+                    
+                    batch.save()
+                    
+                    # Check for new badges
+                    check_badges(data, name, streak, batch)
+                    
+                    print(f"\n  {Colors.GREEN}✓ Checked in for {name}! Streak: {streak} days 🔥{Colors.RESET}")
+                    batch.notify("Consistency Tracker", f"✓ Checked in for {name}! Streak: {streak} days 🔥")
     except (ValueError, IndexError):
         print(f"\n  {Colors.RED}Invalid choice.{Colors.RESET}")
     
     input("\n  Press Enter to continue...")
     return data
 
-def check_badges(data, activity_name, streak):
+def check_badges(data, activity_name, streak, batch=None):
     """Check and award new badges."""
+    batch = batch or open_batch(data)
     if streak in BADGES:
         badge_key = f"{activity_name}_{streak}"
         if badge_key not in data.get("badges", []):
             data.setdefault("badges", []).append(badge_key)
             icon, name, desc = BADGES[streak]
-            save_data(data)
+            batch.save()
             print(f"\n  {Colors.YELLOW}🏆 NEW BADGE: {icon} {name} - {desc}!{Colors.RESET}")
-            send_notification("🏆 Badge Earned!", f"{icon} {name} - {desc}")
+            batch.notify("🏆 Badge Earned!", f"{icon} {name} - {desc}")
 
 def add_activity(data):
     """Add a new activity."""
@@ -356,7 +361,7 @@ def show_stats(data):
     total_days = sum(len(a.get("dates", [])) for a in activities.values())
     total_activities = len(activities)
     best_streak = max((a.get("longest", 0) for a in activities.values()), default=0)
-    active_streaks = sum(1 for a in activities.values() if get_streak(a.get("dates", [])) > 0)
+    active_streaks = sum(1 for a in activities.values() if get_streak(a.get("dates", []), a.get("frozen", [])) > 0)
     
     print(f"""
     📅 Total Days Logged:    {Colors.BOLD}{total_days}{Colors.RESET}
@@ -364,6 +369,7 @@ def show_stats(data):
     🔥 Active Streaks:       {Colors.BOLD}{active_streaks}{Colors.RESET}
     🏆 Best Streak Ever:     {Colors.BOLD}{best_streak} days{Colors.RESET}
     ⭐ Badges Earned:        {Colors.BOLD}{len(data.get('badges', []))}{Colors.RESET}
+    ❄️  Freeze Tokens:        {Colors.BOLD}{data.get('freeze_tokens', 0)}{Colors.RESET}
 """)
     
     # Weekly view
@@ -378,11 +384,14 @@ def show_stats(data):
     
     for name, info in activities.items():
         dates = info.get("dates", [])
+        frozen = info.get("frozen", [])
         row = f"    "
         for i in range(6, -1, -1):
             day = (today - timedelta(days=i)).strftime("%Y-%m-%d")
             if day in dates:
                 row += f" {Colors.GREEN}  ■  {Colors.RESET}"
+            elif day in frozen:
+                row += f" {Colors.CYAN}  ❄  {Colors.RESET}"
             else:
                 row += f" {Colors.DIM}  ·  {Colors.RESET}"
         print(f"{row}  {name[:15]}")
@@ -424,6 +433,7 @@ def setup_reminders():
 def main():
     """Main application loop."""
     data = load_data()
+    apply_freeze_tokens(data)
     
     while True:
         clear_screen()
@@ -461,14 +471,16 @@ def main():
                 name = activities[idx]
                 today = get_today()
                 if today not in data["activities"][name].get("dates", []):
-                    data["activities"][name].setdefault("dates", []).append(today)
-                    streak = get_streak(data["activities"][name]["dates"])
-                    if streak > data["activities"][name].get("longest", 0):
-                        data["activities"][name]["longest"] = streak
-                    save_data(data)
-                    check_badges(data, name, streak)
-                    print(f"\n  {Colors.GREEN}✓ Checked in for {name}! Streak: {streak} days 🔥{Colors.RESET}")
-                    send_notification("Consistency Tracker", f"✓ {name}: {streak} days 🔥")
+                    with open_batch(data) as batch:
+                        apply_freeze_tokens(data, batch)
+                        data["activities"][name].setdefault("dates", []).append(today)
+                        streak = get_streak(data["activities"][name]["dates"], data["activities"][name].get("frozen", []))
+                        if streak > data["activities"][name].get("longest", 0):
+                            data["activities"][name]["longest"] = streak
+                        batch.save()
+                        check_badges(data, name, streak, batch)
+                        print(f"\n  {Colors.GREEN}✓ Checked in for {name}! Streak: {streak} days 🔥{Colors.RESET}")
+                        batch.notify("Consistency Tracker", f"✓ {name}: {streak} days 🔥")
                 else:
                     print(f"\n  {Colors.YELLOW}Already checked in for {name} today!{Colors.RESET}")
                 input("\n  Press Enter to continue...")